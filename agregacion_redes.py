@@ -0,0 +1,186 @@
+from ip_utils import *
+from ip_utils import _importar_numpy
+
+
+def _a_intervalos(redes):
+    """
+    Convierte redes IPv4 ("IP/prefijo", (red_entero, prefijo) o registros
+    con red y prefijo) en arreglos NumPy de inicio y fin (inclusive).
+    """
+    np = _importar_numpy()
+
+    redes = list(redes)
+    if not redes:
+        vacio = np.zeros(0, dtype=np.int64)
+        return vacio, vacio.copy()
+
+    # Los intervalos son enteros de 64 bits: las redes IPv6 no caben
+    if isinstance(redes[0], str):
+        es_ipv6 = any(':' in red for red in redes)
+    elif isinstance(redes[0], tuple):
+        es_ipv6 = any(red > 0xFFFFFFFF for red, _ in redes)
+    else:
+        es_ipv6 = any(getattr(r, "bits", 32) != 32 or ':' in r["red"] for r in redes)
+    if es_ipv6:
+        raise ValueError("La detección de solapamientos y la agregación solo admiten redes IPv4")
+
+    if isinstance(redes[0], str):
+        partes = [red.split('/') for red in redes]
+        incorrectas = [i for i, p in enumerate(partes) if len(p) != 2]
+        if incorrectas:
+            raise ValueError(f"Red {incorrectas[0] + 1}: formato incorrecto. Use: IP/prefijo")
+        ips, validos_ip = ips_a_enteros([p[0].strip() for p in partes])
+        prefijos, validos_prefijo = textos_a_prefijos([p[1].strip() for p in partes])
+        validos = validos_ip & validos_prefijo
+        if not validos.all():
+            raise ValueError(f"Red {int(np.argmin(validos)) + 1}: dirección o prefijo inválido")
+    elif isinstance(redes[0], tuple):
+        ips = np.array([red for red, _ in redes], dtype=np.int64)
+        prefijos = np.array([prefijo for _, prefijo in redes], dtype=np.int64)
+    else:
+        ips = np.array([r.red_entero if hasattr(r, "red_entero") else ip_a_entero(r["red"])
+                        for r in redes], dtype=np.int64)
+        prefijos = np.array([r["prefijo"] for r in redes], dtype=np.int64)
+
+    inicios = calcular_redes(ips, prefijos).astype(np.int64)
+    fines = inicios + calcular_tamanos_bloque(prefijos) - 1
+    return inicios, fines
+
+
+def detectar_solapamientos(redes) -> list:
+    """
+    Reporta cada par de redes que se solapan. En CIDR dos redes solapadas
+    siempre están una dentro de la otra, así que cada elemento es un dict
+    con los índices (en la lista de entrada) de la red "contenida" y la red
+    que la "contiene", y el tipo: "igual" o "contenida".
+
+    Se ordena una vez y se hace un barrido con una pila de redes abiertas:
+    O(n log n + k) para k solapamientos.
+    """
+    np = _importar_numpy()
+
+    inicios, fines = _a_intervalos(redes)
+    # Por inicio ascendente y, a igual inicio, el bloque más grande primero
+    orden = np.lexsort((-fines, inicios)).tolist()
+    inicios = inicios.tolist()
+    fines = fines.tolist()
+
+    solapamientos = []
+    abiertas = []  # pila de índices; cada una contiene a la siguiente
+    for indice in orden:
+        inicio = inicios[indice]
+        while abiertas and fines[abiertas[-1]] < inicio:
+            abiertas.pop()
+        for contenedora in abiertas:
+            igual = inicios[contenedora] == inicio and fines[contenedora] == fines[indice]
+            solapamientos.append({
+                "contenida": indice,
+                "contiene": contenedora,
+                "tipo": "igual" if igual else "contenida",
+            })
+        abiertas.append(indice)
+
+    return solapamientos
+
+
+def rango_a_prefijos(inicio: int, fin: int, bits: int = 32) -> list:
+    """
+    Descompone el rango [inicio, fin] en la menor cantidad de bloques CIDR
+    alineados (IPv6 con bits=128). Regresa una lista de (red_entero, prefijo).
+    """
+    bloques = []
+    while inicio <= fin:
+        # Bloque más grande alineado en `inicio` que no se pase de `fin`
+        tamano = inicio & -inicio if inicio else 1 << bits
+        while tamano > fin - inicio + 1:
+            tamano >>= 1
+        bloques.append((inicio, bits + 1 - tamano.bit_length()))
+        inicio += tamano
+    return bloques
+
+
+def colapsar_enteros(redes) -> list:
+    """
+    Une las redes solapadas o contiguas y regresa el conjunto mínimo de
+    superredes como lista de (red_entero, prefijo) ordenada.
+    """
+    np = _importar_numpy()
+
+    inicios, fines = _a_intervalos(redes)
+    if inicios.size == 0:
+        return []
+
+    orden = np.argsort(inicios, kind="stable")
+    inicios = inicios[orden]
+    fines = fines[orden]
+
+    # Un rango nuevo empieza donde el inicio supera al mayor fin anterior + 1
+    fin_acumulado = np.maximum.accumulate(fines)
+    nuevo = np.empty(inicios.size, dtype=bool)
+    nuevo[0] = True
+    nuevo[1:] = inicios[1:] > fin_acumulado[:-1] + 1
+
+    cortes = np.flatnonzero(nuevo)
+    rangos_inicio = inicios[cortes].tolist()
+    rangos_fin = fin_acumulado[np.append(cortes[1:] - 1, inicios.size - 1)].tolist()
+
+    resultado = []
+    for inicio, fin in zip(rangos_inicio, rangos_fin):
+        resultado.extend(rango_a_prefijos(inicio, fin))
+    return resultado
+
+
+def colapsar_redes(redes) -> list:
+    """
+    Igual que colapsar_enteros, pero regresa las superredes como "IP/prefijo".
+    """
+    return [f"{entero_a_ip(red)}/{prefijo}" for red, prefijo in colapsar_enteros(redes)]
+
+
+def comparar_con_ipaddress(cantidad: int = 1000000, semilla: int = 1) -> dict:
+    """
+    Compara colapsar_redes contra ipaddress.collapse_addresses con redes
+    aleatorias y verifica que ambos den el mismo resultado.
+    """
+    import ipaddress
+    import random
+    import time
+
+    aleatorio = random.Random(semilla)
+    redes = []
+    for _ in range(cantidad):
+        prefijo = aleatorio.randint(16, 32)
+        red = aleatorio.getrandbits(32) & ((0xFFFFFFFF << (32 - prefijo)) & 0xFFFFFFFF)
+        redes.append(f"{entero_a_ip(red)}/{prefijo}")
+
+    inicio = time.perf_counter()
+    propio = colapsar_redes(redes)
+    tiempo_propio = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    referencia = [str(r) for r in ipaddress.collapse_addresses(
+        ipaddress.IPv4Network(red) for red in redes)]
+    tiempo_referencia = time.perf_counter() - inicio
+
+    if propio != referencia:
+        raise AssertionError("colapsar_redes no coincide con ipaddress.collapse_addresses")
+
+    return {
+        "redes": cantidad,
+        "superredes": len(propio),
+        "segundos": tiempo_propio,
+        "segundos_ipaddress": tiempo_referencia,
+        "aceleracion": tiempo_referencia / tiempo_propio,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    resultado = comparar_con_ipaddress(cantidad)
+    print(f"Redes:               {resultado['redes']}")
+    print(f"Superredes:          {resultado['superredes']}")
+    print(f"colapsar_redes:      {resultado['segundos']:.2f} s")
+    print(f"ipaddress:           {resultado['segundos_ipaddress']:.2f} s")
+    print(f"Aceleración:         {resultado['aceleracion']:.1f}x")
@@ -0,0 +1,237 @@
+import mmap
+import struct
+from bisect import bisect_right
+from collections.abc import Sequence
+
+from ip_utils import *
+from registro_subred import RegistroSubred
+from vlsm_calculator import CalculadoraVLSM
+
+# Formato del archivo (little endian):
+#   encabezado   _ENCABEZADO
+#   subredes     cantidad registros _REGISTRO, ordenados por dirección de red
+#   reservas     cantidad_reservas registros _RESERVA
+#   nombres      nombres UTF-8 concatenados en el orden de los registros; el
+#                nombre i va de su desplazamiento al del registro i + 1
+MAGICO = b"VLSMPLAN"
+VERSION = 1
+_ENCABEZADO = struct.Struct("<8sHHIIIB3xQQQQQ")
+_REGISTRO = struct.Struct("<IBxxxII")   # red, prefijo, hosts requeridos, nombre
+_RESERVA = struct.Struct("<IB3x")       # red, prefijo
+
+
+def guardar_plan(calculadora: CalculadoraVLSM, ruta: str) -> int:
+    """
+    Guarda el plan calculado de una CalculadoraVLSM en un archivo binario.
+    Regresa el tamaño del archivo en bytes.
+    """
+    if not calculadora.resultados:
+        raise ValueError("No hay resultados. Ejecute calcular_vlsm() primero.")
+    if calculadora.bits != 32:
+        raise ValueError("El formato de plan guardado solo admite redes IPv4")
+
+    registros = sorted(calculadora.resultados, key=lambda r: r.red_entero)
+    cantidad = len(registros)
+    reservas = calculadora.reservas
+
+    nombres = bytearray()
+    datos = bytearray(_ENCABEZADO.size + cantidad * _REGISTRO.size + len(reservas) * _RESERVA.size)
+
+    posicion = _ENCABEZADO.size
+    for registro in registros:
+        _REGISTRO.pack_into(datos, posicion, registro.red_entero, registro.prefijo,
+                            registro.hosts_requeridos, len(nombres))
+        nombres += str(registro.nombre).encode("utf-8")
+        posicion += _REGISTRO.size
+    for red_entero, prefijo in reservas:
+        _RESERVA.pack_into(datos, posicion, red_entero, prefijo)
+        posicion += _RESERVA.size
+
+    mascara_base = (0xFFFFFFFF << (32 - calculadora.prefijo_base)) & 0xFFFFFFFF
+    _ENCABEZADO.pack_into(
+        datos, 0, MAGICO, VERSION, 0, cantidad, len(reservas),
+        ip_a_entero(calculadora.red_base) & mascara_base, calculadora.prefijo_base,
+        calculadora.espacio_total, calculadora.espacio_usado,
+        calculadora.espacio_reservado, calculadora.espacio_restante, posicion,
+    )
+
+    with open(ruta, "wb") as archivo:
+        archivo.write(datos)
+        archivo.write(nombres)
+    return len(datos) + len(nombres)
+
+
+class _Redes(Sequence):
+    """
+    Vista de solo las direcciones de red de los registros, para bisect.
+    """
+
+    def __init__(self, plan: "PlanMapeado"):
+        self._plan = plan
+
+    def __len__(self):
+        return self._plan.cantidad
+
+    def __getitem__(self, indice):
+        return self._plan._campos(indice)[0]
+
+
+class PlanMapeado(Sequence):
+    """
+    Plan VLSM guardado con guardar_plan, leído con mmap: abrirlo solo lee
+    el encabezado y cada registro se decodifica al pedirlo, directamente del
+    mapa del archivo. Los registros están ordenados por dirección, así que
+    buscar() es una bisección sobre el archivo.
+
+    Se usa como secuencia de RegistroSubred y como contexto:
+        with PlanMapeado("plan.vlsm") as plan:
+            plan.buscar("10.0.3.7")
+    """
+
+    def __init__(self, ruta: str):
+        self._archivo = open(ruta, "rb")
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._archivo.close()
+            raise ValueError("Archivo de plan vacío")
+
+        if len(self._mapa) < _ENCABEZADO.size:
+            self.cerrar()
+            raise ValueError("Archivo de plan inválido: encabezado incompleto")
+
+        (magico, version, _, self.cantidad, self.cantidad_reservas,
+         self.red_base_entero, self.prefijo_base, self.espacio_total, self.espacio_usado,
+         self.espacio_reservado, self.espacio_restante,
+         self._inicio_nombres) = _ENCABEZADO.unpack_from(self._mapa, 0)
+
+        if magico != MAGICO:
+            self.cerrar()
+            raise ValueError("Archivo de plan inválido: no es un plan VLSM")
+        if version != VERSION:
+            self.cerrar()
+            raise ValueError(f"Versión de plan no soportada: {version}")
+        fin_registros = (_ENCABEZADO.size + self.cantidad * _REGISTRO.size
+                         + self.cantidad_reservas * _RESERVA.size)
+        if fin_registros != self._inicio_nombres or self._inicio_nombres > len(self._mapa):
+            self.cerrar()
+            raise ValueError("Archivo de plan inválido: tamaño incorrecto")
+
+        self._redes = _Redes(self)
+
+    @property
+    def red_base(self) -> str:
+        return f"{entero_a_ip(self.red_base_entero)}/{self.prefijo_base}"
+
+    def _campos(self, indice: int) -> tuple:
+        return _REGISTRO.unpack_from(self._mapa, _ENCABEZADO.size + indice * _REGISTRO.size)
+
+    def _nombre(self, indice: int, desplazamiento: int) -> str:
+        if indice + 1 < self.cantidad:
+            fin = self._campos(indice + 1)[3]
+        else:
+            fin = len(self._mapa) - self._inicio_nombres
+        inicio = self._inicio_nombres
+        return self._mapa[inicio + desplazamiento:inicio + fin].decode("utf-8")
+
+    def __len__(self):
+        return self.cantidad
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(self.cantidad))]
+        if indice < 0:
+            indice += self.cantidad
+        if not 0 <= indice < self.cantidad:
+            raise IndexError("Índice de subred fuera de rango")
+        red_entero, prefijo, hosts, desplazamiento = self._campos(indice)
+        return RegistroSubred(self._nombre(indice, desplazamiento), hosts, red_entero, prefijo)
+
+    def __iter__(self):
+        # Recorrido secuencial: decodifica todos los registros de una vez
+        # sobre una vista del mapa, sin copiar la región de registros
+        fin_registros = _ENCABEZADO.size + self.cantidad * _REGISTRO.size
+        with memoryview(self._mapa) as vista:
+            campos = list(_REGISTRO.iter_unpack(vista[_ENCABEZADO.size:fin_registros]))
+            nombres = vista[self._inicio_nombres:].tobytes()
+        if nombres.isascii():
+            # En ASCII los desplazamientos en bytes sirven sobre el texto
+            nombres = nombres.decode("ascii")
+            for indice, (red_entero, prefijo, hosts, desplazamiento) in enumerate(campos, 1):
+                fin = campos[indice][3] if indice < len(campos) else len(nombres)
+                yield RegistroSubred(nombres[desplazamiento:fin], hosts, red_entero, prefijo)
+            return
+        for indice, (red_entero, prefijo, hosts, desplazamiento) in enumerate(campos, 1):
+            fin = campos[indice][3] if indice < len(campos) else len(nombres)
+            yield RegistroSubred(nombres[desplazamiento:fin].decode("utf-8"), hosts, red_entero, prefijo)
+
+    @property
+    def reservas(self) -> list:
+        """
+        Las redes reservadas del plan como (red_entero, prefijo).
+        """
+        inicio = _ENCABEZADO.size + self.cantidad * _REGISTRO.size
+        return [_RESERVA.unpack_from(self._mapa, inicio + i * _RESERVA.size)
+                for i in range(self.cantidad_reservas)]
+
+    def buscar_indice(self, ip) -> int:
+        """
+        Índice de la subred que contiene la IP (string o entero), o -1.
+        Lee O(log n) registros del archivo.
+        """
+        if isinstance(ip, str):
+            ip = ip_a_entero(ip)
+        indice = bisect_right(self._redes, ip) - 1
+        if indice < 0:
+            return -1
+        red_entero, prefijo, _, _ = self._campos(indice)
+        return indice if ip < red_entero + (1 << (32 - prefijo)) else -1
+
+    def buscar(self, ip):
+        """
+        La subred (RegistroSubred) que contiene la IP, o None.
+        """
+        indice = self.buscar_indice(ip)
+        return self[indice] if indice >= 0 else None
+
+    def a_calculadora(self) -> CalculadoraVLSM:
+        """
+        Reconstruye una CalculadoraVLSM con la red base, las reservas, las
+        subredes y los resultados (en orden de dirección) del plan.
+        """
+        calculadora = CalculadoraVLSM()
+        calculadora.configurar_red_base(self.red_base)
+        calculadora.reservas = self.reservas
+        calculadora.resultados = list(self)
+        calculadora.subredes = [{"nombre": r.nombre, "hosts_requeridos": r.hosts_requeridos}
+                                for r in calculadora.resultados]
+        calculadora.espacio_total = self.espacio_total
+        calculadora.espacio_usado = self.espacio_usado
+        calculadora.espacio_reservado = self.espacio_reservado
+        calculadora.espacio_restante = self.espacio_restante
+        return calculadora
+
+    def cerrar(self):
+        if getattr(self, "_mapa", None) is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+        return False
+
+    def __repr__(self):
+        return f"PlanMapeado('{self.red_base}', {self.cantidad} subredes)"
+
+
+def cargar_plan(ruta: str) -> CalculadoraVLSM:
+    """
+    Lee un plan guardado con guardar_plan y regresa la CalculadoraVLSM
+    equivalente, con los resultados ya calculados.
+    """
+    with PlanMapeado(ruta) as plan:
+        return plan.a_calculadora()
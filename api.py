@@ -0,0 +1,71 @@
+from types import MappingProxyType
+from typing import NamedTuple
+
+from cidr_calculator import CACHE_REDES, CacheRedes, CalculadoraCIDR
+from vlsm_calculator import CalculadoraVLSM
+
+
+class PlanVLSM(NamedTuple):
+    """
+    Resultado inmutable de calcular_vlsm: las subredes asignadas (tupla de
+    RegistroSubred en orden de asignación) y el uso del espacio.
+    """
+    red_base: str
+    prefijo_base: int
+    subredes: tuple
+    espacio_total: int
+    espacio_usado: int
+    espacio_reservado: int
+    espacio_restante: int
+
+
+def calcular_cidr(entrada: str, cache: CacheRedes = CACHE_REDES) -> MappingProxyType:
+    """
+    Analiza "IP/prefijo" o "IP máscara" y regresa el resultado de
+    CalculadoraCIDR.calcular() como mapeo de solo lectura.
+
+    No comparte estado mutable entre llamadas salvo la caché de redes, que
+    es segura entre hilos; se puede llamar desde muchos hilos a la vez.
+    """
+    return MappingProxyType(CalculadoraCIDR(entrada, cache=cache).calcular())
+
+
+def _requerimiento(subred) -> tuple:
+    if isinstance(subred, tuple):
+        nombre, hosts_requeridos = subred
+    else:
+        nombre, hosts_requeridos = subred["nombre"], subred["hosts_requeridos"]
+    return nombre, int(hosts_requeridos)
+
+
+def calcular_vlsm(red_base: str, subredes, reservas=()) -> PlanVLSM:
+    """
+    Calcula un plan VLSM sin estado compartido: red_base "IP/prefijo",
+    subredes como pares (nombre, hosts_requeridos) o mapeos con esas
+    claves, y reservas como "IP/prefijo". Las entradas se copian al inicio
+    y nunca se modifican, y el resultado es inmutable, así que la función
+    se puede llamar desde muchos hilos a la vez.
+
+    Lanza ValueError con los mismos mensajes que CalculadoraVLSM.
+    """
+    requerimientos = tuple(_requerimiento(subred) for subred in subredes)
+    reservas = tuple(reservas)
+
+    # Calculadora propia de esta llamada: su estado no sale de aquí
+    calculadora = CalculadoraVLSM()
+    calculadora.configurar_red_base(red_base)
+    for reserva in reservas:
+        calculadora.reservar_red(reserva)
+    for nombre, hosts_requeridos in requerimientos:
+        calculadora.agregar_subred(nombre, hosts_requeridos)
+
+    asignadas = tuple(calculadora.iterar_vlsm())
+    return PlanVLSM(
+        red_base=f"{calculadora.red_base}/{calculadora.prefijo_base}",
+        prefijo_base=calculadora.prefijo_base,
+        subredes=asignadas,
+        espacio_total=calculadora.espacio_total,
+        espacio_usado=calculadora.espacio_usado,
+        espacio_reservado=calculadora.espacio_reservado,
+        espacio_restante=calculadora.espacio_restante,
+    )
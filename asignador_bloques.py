@@ -0,0 +1,218 @@
+import heapq
+
+
+class AsignadorBuddy:
+    """
+    Asignador de bloques tipo "buddy" para una red base.
+
+    Mantiene una lista de bloques libres por cada longitud de prefijo. Asignar,
+    reservar o liberar un bloque cuesta O(bits) operaciones sobre conjuntos y
+    montículos, sin importar cuántas subredes haya ya en la red.
+    """
+
+    def __init__(self, red_base: int, prefijo_base: int, bits: int = 32):
+        if not 0 <= prefijo_base <= bits:
+            raise ValueError(f"Prefijo debe estar entre 0 y {bits}")
+        if red_base & ((1 << (bits - prefijo_base)) - 1):
+            raise ValueError("La red base no está alineada con su prefijo")
+
+        self.red_base = red_base
+        self.prefijo_base = prefijo_base
+        self.bits = bits
+        self.espacio_total = 1 << (bits - prefijo_base)
+        self.espacio_libre = 0
+
+        # Por cada prefijo: conjunto de redes libres (fuente de verdad) y un
+        # montículo para obtener la de menor dirección. El montículo puede
+        # contener entradas obsoletas que se descartan al extraer o al
+        # reconstruirlo en _quitar_libre.
+        self._libres = [set() for _ in range(bits + 1)]
+        self._monticulos = [[] for _ in range(bits + 1)]
+
+        self._agregar_libre(red_base, prefijo_base)
+
+    def _agregar_libre(self, red: int, prefijo: int):
+        self._libres[prefijo].add(red)
+        heapq.heappush(self._monticulos[prefijo], red)
+        self.espacio_libre += 1 << (self.bits - prefijo)
+
+    def _quitar_libre(self, red: int, prefijo: int):
+        libres = self._libres[prefijo]
+        libres.remove(red)
+        self.espacio_libre -= 1 << (self.bits - prefijo)
+        # Las entradas obsoletas solo se descartan al llegar a la cima: si
+        # ya son la mayoría, el montículo se reconstruye con las libres
+        if len(self._monticulos[prefijo]) > 2 * len(libres) + 16:
+            monticulo = list(libres)
+            heapq.heapify(monticulo)
+            self._monticulos[prefijo] = monticulo
+
+    def _extraer_menor(self, prefijo: int) -> int:
+        libres = self._libres[prefijo]
+        monticulo = self._monticulos[prefijo]
+        while True:
+            red = heapq.heappop(monticulo)
+            if red in libres:
+                self._quitar_libre(red, prefijo)
+                return red
+
+    def _dividir(self, red: int, prefijo: int, prefijo_destino: int, objetivo: int):
+        """
+        Divide el bloque (red, prefijo) hasta prefijo_destino, dejando libre
+        en cada nivel la mitad que no contiene a `objetivo`.
+        """
+        while prefijo < prefijo_destino:
+            prefijo += 1
+            mitad = 1 << (self.bits - prefijo)
+            if objetivo & mitad:
+                self._agregar_libre(red, prefijo)
+                red += mitad
+            else:
+                self._agregar_libre(red + mitad, prefijo)
+
+    def asignar(self, prefijo: int):
+        """
+        Asigna el bloque libre más pequeño que aloje el prefijo pedido (el de
+        menor dirección en caso de empate). Regresa la red asignada o None si
+        no hay espacio.
+        """
+        if prefijo < self.prefijo_base or prefijo > self.bits:
+            return None
+
+        for nivel in range(prefijo, self.prefijo_base - 1, -1):
+            if self._libres[nivel]:
+                red = self._extraer_menor(nivel)
+                self._dividir(red, nivel, prefijo, red)
+                return red
+
+        return None
+
+    def reservar(self, red: int, prefijo: int):
+        """
+        Marca como ocupado el bloque (red, prefijo). Lanza ValueError si está
+        fuera de la red base o se solapa con espacio ya ocupado.
+        """
+        if prefijo < self.prefijo_base or prefijo > self.bits:
+            raise ValueError("La reserva no cabe en la red base")
+        if red & ((1 << (self.bits - prefijo)) - 1):
+            raise ValueError("La reserva no está alineada con su prefijo")
+        if not self.red_base <= red < self.red_base + self.espacio_total:
+            raise ValueError("La reserva está fuera de la red base")
+
+        for nivel in range(prefijo, self.prefijo_base - 1, -1):
+            candidato = red & ~((1 << (self.bits - nivel)) - 1)
+            if candidato in self._libres[nivel]:
+                self._quitar_libre(candidato, nivel)
+                self._dividir(candidato, nivel, prefijo, red)
+                return
+
+        raise ValueError("La reserva se solapa con espacio ya ocupado")
+
+    def liberar(self, red: int, prefijo: int):
+        """
+        Devuelve el bloque (red, prefijo) al espacio libre, fusionándolo con su
+        bloque compañero mientras éste también esté libre.
+        """
+        while prefijo > self.prefijo_base:
+            companero = red ^ (1 << (self.bits - prefijo))
+            if companero not in self._libres[prefijo]:
+                break
+            self._quitar_libre(companero, prefijo)
+            red = min(red, companero)
+            prefijo -= 1
+
+        self._agregar_libre(red, prefijo)
+
+    # Consultas sobre el espacio libre. Los bloques libres son siempre los
+    # bloques alineados máximos (dos compañeros libres se fusionan), así que
+    # cada consulta recorre a lo más bits + 1 niveles, sin importar cuántas
+    # subredes estén asignadas.
+
+    def _menor_libre(self, prefijo: int) -> int:
+        """
+        Red libre de menor dirección del nivel, sin sacarla.
+        """
+        libres = self._libres[prefijo]
+        monticulo = self._monticulos[prefijo]
+        while monticulo[0] not in libres:
+            heapq.heappop(monticulo)
+        return monticulo[0]
+
+    def bloque_mas_grande(self):
+        """
+        El bloque libre más grande como (red, prefijo) (el de menor dirección
+        en caso de empate), o None si no queda espacio.
+        """
+        for nivel in range(self.prefijo_base, self.bits + 1):
+            if self._libres[nivel]:
+                return self._menor_libre(nivel), nivel
+        return None
+
+    def cabe(self, prefijo: int) -> bool:
+        """
+        Indica si todavía se puede asignar un bloque /prefijo.
+        """
+        if prefijo < self.prefijo_base or prefijo > self.bits:
+            return False
+        return any(self._libres[nivel] for nivel in range(self.prefijo_base, prefijo + 1))
+
+    def bloques_libres(self, prefijo_maximo: int = None) -> list:
+        """
+        Los bloques libres de prefijo menor o igual a prefijo_maximo (todos si
+        es None) como (red, prefijo), ordenados por dirección.
+        """
+        if prefijo_maximo is None:
+            prefijo_maximo = self.bits
+        bloques = [(red, nivel)
+                   for nivel in range(self.prefijo_base, min(prefijo_maximo, self.bits) + 1)
+                   for red in self._libres[nivel]]
+        bloques.sort()
+        return bloques
+
+    def bloques_de_al_menos(self, tamano: int) -> list:
+        """
+        Los bloques libres de al menos `tamano` direcciones, ordenados por
+        dirección.
+        """
+        if tamano <= 0:
+            raise ValueError("El tamaño debe ser mayor a 0")
+        return self.bloques_libres(self.bits - (tamano - 1).bit_length())
+
+    def bloque_libre_en(self, direccion: int):
+        """
+        El bloque libre (red, prefijo) que contiene la dirección, o None si
+        está ocupada o fuera de la red base.
+        """
+        if not self.red_base <= direccion < self.red_base + self.espacio_total:
+            return None
+        for nivel in range(self.prefijo_base, self.bits + 1):
+            red = direccion & ~((1 << (self.bits - nivel)) - 1)
+            if red in self._libres[nivel]:
+                return red, nivel
+        return None
+
+    def bloques_por_prefijo(self) -> list:
+        """
+        Número de bloques libres de cada prefijo (índices 0 a bits).
+        """
+        return [len(libres) for libres in self._libres]
+
+    def fragmentacion(self) -> dict:
+        """
+        Métricas del espacio libre: total, número de bloques, tamaño del
+        bloque más grande, bloques por prefijo y fragmentación
+        (1 - bloque más grande / espacio libre; 0 cuando todo el espacio
+        libre es un solo bloque o no queda espacio).
+        """
+        por_prefijo = {nivel: len(self._libres[nivel])
+                       for nivel in range(self.prefijo_base, self.bits + 1)
+                       if self._libres[nivel]}
+        mas_grande = self.bloque_mas_grande()
+        tam_mas_grande = 1 << (self.bits - mas_grande[1]) if mas_grande else 0
+        return {
+            "espacio_libre": self.espacio_libre,
+            "bloques_libres": sum(por_prefijo.values()),
+            "bloque_mas_grande": tam_mas_grande,
+            "por_prefijo": por_prefijo,
+            "fragmentacion": 1 - tam_mas_grande / self.espacio_libre if self.espacio_libre else 0.0,
+        }
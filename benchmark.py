@@ -0,0 +1,246 @@
+import gc
+import json
+import platform
+import random
+import sys
+import time
+
+from ip_utils import *
+from cidr_calculator import CACHE_REDES, CalculadoraCIDR
+from vlsm_calculator import CalculadoraVLSM
+
+TAMANOS = (10, 1000, 100000, 1000000)
+UMBRAL = 0.15
+
+
+def _ips_aleatorias(aleatorio: random.Random, cantidad: int) -> list:
+    return [entero_a_ip(aleatorio.getrandbits(32)) for _ in range(cantidad)]
+
+
+def _preparar_ip_a_entero(aleatorio, cantidad):
+    ips = _ips_aleatorias(aleatorio, cantidad)
+    return lambda: [ip_a_entero(ip) for ip in ips]
+
+
+def _preparar_entero_a_ip(aleatorio, cantidad):
+    enteros = [aleatorio.getrandbits(32) for _ in range(cantidad)]
+    return lambda: [entero_a_ip(entero) for entero in enteros]
+
+
+def _preparar_mascara_a_prefijo(aleatorio, cantidad):
+    mascaras = [prefijo_a_mascara(aleatorio.randint(0, 32)) for _ in range(cantidad)]
+    return lambda: [mascara_a_prefijo(mascara) for mascara in mascaras]
+
+
+def _preparar_validar_ip(aleatorio, cantidad):
+    # Una de cada cuatro entradas es inválida
+    ips = [ip if i % 4 else ip + "0" for i, ip in enumerate(_ips_aleatorias(aleatorio, cantidad))]
+    return lambda: [validar_ip(ip) for ip in ips]
+
+
+def _entradas_cidr(aleatorio, cantidad):
+    # Direcciones concentradas en pocas redes, como en el tráfico real
+    return [f"10.{aleatorio.randint(0, 15)}.{aleatorio.randint(0, 255)}."
+            f"{aleatorio.randint(0, 255)}/{aleatorio.choice((16, 20, 24))}"
+            for _ in range(cantidad)]
+
+
+def _preparar_cidr(aleatorio, cantidad):
+    entradas = _entradas_cidr(aleatorio, cantidad)
+    return lambda: [CalculadoraCIDR(entrada).calcular() for entrada in entradas]
+
+
+def _preparar_cidr_sin_cache(aleatorio, cantidad):
+    entradas = _entradas_cidr(aleatorio, cantidad)
+    return lambda: [CalculadoraCIDR(entrada, cache=None).calcular() for entrada in entradas]
+
+
+def _preparar_vlsm(aleatorio, cantidad):
+    # Hasta 14 hosts por subred: un millón de subredes cabe en un /8
+    hosts = [aleatorio.randint(1, 14) for _ in range(cantidad)]
+
+    def ejecutar():
+        calculadora = CalculadoraVLSM()
+        calculadora.configurar_red_base("10.0.0.0/8")
+        for i, cantidad_hosts in enumerate(hosts):
+            calculadora.agregar_subred(f"S{i}", cantidad_hosts)
+        return calculadora.calcular_vlsm()
+
+    return ejecutar
+
+
+# Nombre del caso -> función que recibe (aleatorio, tamaño) y regresa la
+# función a medir; la preparación de entradas no se mide
+CASOS = {
+    "ip_a_entero": _preparar_ip_a_entero,
+    "entero_a_ip": _preparar_entero_a_ip,
+    "mascara_a_prefijo": _preparar_mascara_a_prefijo,
+    "validar_ip": _preparar_validar_ip,
+    "cidr_calcular": _preparar_cidr,
+    "cidr_calcular_sin_cache": _preparar_cidr_sin_cache,
+    "vlsm_calcular": _preparar_vlsm,
+}
+
+
+def medir(funcion, repeticiones: int) -> list:
+    """
+    Ejecuta la función `repeticiones` veces con el recolector de basura
+    desactivado (como timeit) y regresa los tiempos en segundos.
+    """
+    tiempos = []
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            funcion()
+            tiempos.append(time.perf_counter() - inicio)
+    finally:
+        if gc_activo:
+            gc.enable()
+    return tiempos
+
+
+def ejecutar_suite(casos: list = None, tamanos: tuple = TAMANOS, repeticiones: int = 3,
+                   semilla: int = 1, salida=None) -> dict:
+    """
+    Ejecuta cada caso con cada tamaño y regresa un dict listo para guardar
+    como línea base. Las entradas se generan con una semilla fija, así dos
+    ejecuciones miden exactamente el mismo trabajo. Si se da `salida`, se
+    reporta el avance en ese flujo.
+    """
+    casos = casos or list(CASOS)
+    desconocidos = [caso for caso in casos if caso not in CASOS]
+    if desconocidos:
+        raise ValueError(f"Caso desconocido: {desconocidos[0]}")
+
+    resultados = {}
+    for caso in casos:
+        for tamano in tamanos:
+            # Cada medición empieza con la caché de redes vacía
+            CACHE_REDES.limpiar()
+            funcion = CASOS[caso](random.Random(semilla), tamano)
+            tiempos = medir(funcion, repeticiones)
+            mejor = min(tiempos)
+            resultados[f"{caso}/{tamano}"] = {
+                "caso": caso,
+                "tamano": tamano,
+                "mejor": mejor,
+                "mediana": sorted(tiempos)[len(tiempos) // 2],
+                "ns_por_elemento": mejor / tamano * 1e9,
+            }
+            if salida is not None:
+                print(f"{caso + '/' + str(tamano):<32} {mejor:>10.4f} s  "
+                      f"{mejor / tamano * 1e9:>10.0f} ns/elem", file=salida)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeticiones": repeticiones,
+            "semilla": semilla,
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar(base: dict, nuevo: dict, umbral: float = UMBRAL) -> list:
+    """
+    Compara dos ejecuciones de la suite caso por caso (por el mejor tiempo)
+    y regresa una lista de dicts con caso, base, nuevo, cambio (fracción),
+    si falta en la ejecución nueva y si es una regresión (el tiempo creció
+    más que `umbral`). Un caso de la línea base que no aparece en la
+    ejecución nueva (renombrado, fallido u omitido) cuenta como regresión,
+    con nuevo y cambio en None. Los casos nuevos sin línea base se omiten.
+    """
+    filas = []
+    for clave, anterior in base["resultados"].items():
+        medicion = nuevo["resultados"].get(clave)
+        if medicion is None:
+            filas.append({
+                "caso": clave,
+                "base": anterior["mejor"],
+                "nuevo": None,
+                "cambio": None,
+                "faltante": True,
+                "regresion": True,
+            })
+            continue
+        cambio = medicion["mejor"] / anterior["mejor"] - 1 if anterior["mejor"] > 0 else 0.0
+        filas.append({
+            "caso": clave,
+            "base": anterior["mejor"],
+            "nuevo": medicion["mejor"],
+            "cambio": cambio,
+            "faltante": False,
+            "regresion": cambio > umbral,
+        })
+    return filas
+
+
+def _cargar(ruta: str) -> dict:
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def ejecutar_linea_comandos(argumentos: list = None) -> int:
+    """
+    python benchmark.py ejecutar [--salida BASE.json] [--casos ...] [--tamanos ...]
+    python benchmark.py comparar BASE.json NUEVO.json [--umbral 0.15]
+
+    `comparar` regresa código de salida 1 si algún caso empeoró más que el
+    umbral.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Suite de rendimiento de las calculadoras")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    ejecutar = subcomandos.add_parser("ejecutar", help="Ejecuta la suite y guarda los resultados")
+    ejecutar.add_argument("--salida", help="Archivo JSON de resultados")
+    ejecutar.add_argument("--casos", nargs="+", choices=list(CASOS))
+    ejecutar.add_argument("--tamanos", nargs="+", type=int, default=list(TAMANOS))
+    ejecutar.add_argument("--repeticiones", type=int, default=3)
+    ejecutar.add_argument("--semilla", type=int, default=1)
+
+    comparacion = subcomandos.add_parser("comparar", help="Compara contra una línea base")
+    comparacion.add_argument("base")
+    comparacion.add_argument("nuevo")
+    comparacion.add_argument("--umbral", type=float, default=UMBRAL,
+                             help="Aumento relativo de tiempo tolerado (0.15 = 15%%)")
+
+    args = parser.parse_args(argumentos)
+
+    if args.comando == "ejecutar":
+        if args.repeticiones <= 0:
+            parser.error("--repeticiones debe ser mayor a 0")
+        resultado = ejecutar_suite(args.casos, tuple(args.tamanos), args.repeticiones,
+                                   args.semilla, salida=sys.stderr)
+        if args.salida:
+            with open(args.salida, "w", encoding="utf-8") as archivo:
+                json.dump(resultado, archivo, indent=2)
+        else:
+            json.dump(resultado, sys.stdout, indent=2)
+            print()
+        return 0
+
+    filas = comparar(_cargar(args.base), _cargar(args.nuevo), args.umbral)
+    regresiones = 0
+    print(f"{'Caso':<32} {'Base (s)':>10} {'Nuevo (s)':>10} {'Cambio':>8}")
+    print("-" * 64)
+    for fila in filas:
+        regresiones += fila["regresion"]
+        if fila["faltante"]:
+            print(f"{fila['caso']:<32} {fila['base']:>10.4f} {'-':>10} {'-':>8}  FALTANTE")
+            continue
+        marca = "  REGRESIÓN" if fila["regresion"] else ""
+        print(f"{fila['caso']:<32} {fila['base']:>10.4f} {fila['nuevo']:>10.4f} "
+              f"{fila['cambio']:>+8.1%}{marca}")
+    print("-" * 64)
+    print(f"Casos comparados: {len(filas)}  Regresiones (>{args.umbral:.0%}): {regresiones}")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(ejecutar_linea_comandos())
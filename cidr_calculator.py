@@ -1,185 +1,624 @@
-from ip_utils import *
-import math
-
-    
-class CalculadoraCIDR:
-    """
-    Calculadora para operaciones CIDR
-    """
-    
-    def __init__(self, ip_con_prefijo: str = None):
-        self.ip = None
-        self.prefijo = None
-        self.mascara = None
-        
-        if ip_con_prefijo:
-            self.analizar_entrada(ip_con_prefijo)
-    
-    def analizar_entrada(self, entrada: str):
-        entrada = entrada.strip()
-        
-        # Formato: IP/prefijo
-        if '/' in entrada:
-            partes = entrada.split('/')
-            if len(partes) != 2:
-                raise ValueError("Formato incorrecto. Use: IP/prefijo o IP máscara")
-            
-            ip = partes[0].strip()
-            prefijo_str = partes[1].strip()
-            
-            if not validar_ip(ip):
-                raise ValueError("Dirección IP inválida")
-            
-            try:
-                prefijo = int(prefijo_str)
-            except ValueError:
-                raise ValueError("Prefijo debe ser un número")
-            
-            if not 0 <= prefijo <= 32:
-                raise ValueError("Prefijo debe estar entre 0 y 32")
-            
-            self.ip = ip
-            self.prefijo = prefijo
-            self.mascara = prefijo_a_mascara(prefijo)
-        
-        # Formato: IP máscara
-        else:
-            partes = entrada.split()
-            if len(partes) != 2:
-                raise ValueError("Formato incorrecto. Use: IP/prefijo o IP máscara")
-            
-            ip = partes[0].strip()
-            mascara = partes[1].strip()
-            
-            if not validar_ip(ip):
-                raise ValueError("Dirección IP inválida")
-            
-            if not validar_ip(mascara):
-                raise ValueError("Máscara inválida")
-            
-            try:
-                prefijo = mascara_a_prefijo(mascara)
-            except ValueError as e:
-                raise ValueError(f"Máscara inválida: {e}")
-            
-            self.ip = ip
-            self.prefijo = prefijo
-            self.mascara = mascara
-    
-    def calcular(self):
-        """
-        Calcula todas las propiedades de la red CIDR.
-        """
-        if not self.ip or self.prefijo is None:
-            raise ValueError("Debe proporcionar una IP y prefijo primero")
-        
-        ip_entero = ip_a_entero(self.ip)
-        mascara_entero = ip_a_entero(self.mascara) if self.mascara else (0xFFFFFFFF << (32 - self.prefijo)) & 0xFFFFFFFF
-        
-        # Calcular dirección de red
-        red_entero = ip_entero & mascara_entero
-        red = entero_a_ip(red_entero)
-        
-        # Calcular broadcast
-        wildcard = mascara_entero ^ 0xFFFFFFFF
-        broadcast_entero = red_entero | wildcard
-        broadcast = entero_a_ip(broadcast_entero)
-        
-        # Calcular primer y último host
-        if self.prefijo == 32:
-            primer_host = red
-            ultimo_host = red
-            hosts_validos = 1
-        elif self.prefijo == 31:
-            # Caso especial: /31 (RFC 3021)
-            primer_host = red
-            ultimo_host = broadcast
-            hosts_validos = 2
-        else:
-            primer_host_entero = red_entero + 1
-            ultimo_host_entero = broadcast_entero - 1
-            primer_host = entero_a_ip(primer_host_entero)
-            ultimo_host = entero_a_ip(ultimo_host_entero)
-            hosts_validos = ultimo_host_entero - primer_host_entero + 1
-        
-        # Calcular número total de hosts
-        if self.prefijo == 32:
-            total_hosts = 1
-        else:
-            total_hosts = 2 ** (32 - self.prefijo)
-        
-        # Calcular desperdicio
-        desperdicio = total_hosts - hosts_validos if self.prefijo < 31 else 0
-        
-        # Representaciones binarias
-        bin_ip = obtener_binario_ip(self.ip)
-        bin_mascara = obtener_binario_ip(self.mascara)
-        bin_red = obtener_binario_ip(red)
-        
-        return {
-            "ip_original": self.ip,
-            "prefijo": self.prefijo,
-            "mascara": self.mascara,
-            "red": red,
-            "broadcast": broadcast,
-            "primer_host": primer_host,
-            "ultimo_host": ultimo_host,
-            "hosts_validos": hosts_validos,
-            "total_hosts": total_hosts,
-            "desperdicio": desperdicio,
-            "bin_ip": bin_ip,
-            "bin_mascara": bin_mascara,
-            "bin_red": bin_red,
-            "rango_hosts": f"{primer_host} - {ultimo_host}",
-            "notacion_cidr": f"{red}/{self.prefijo}"
-        }
-    
-    def imprimir_resultados(self, resultados: dict):
-        print("\n" + "="*50)
-        print("RESULTADOS CALCULADORA CIDR")
-        print("="*50)
-        print(f"IP original:      {resultados['ip_original']}")
-        print(f"Notación CIDR:    {resultados['notacion_cidr']}")
-        print(f"Máscara:          {resultados['mascara']} (/{resultados['prefijo']})")
-        print(f"Dirección de red: {resultados['red']}")
-        print(f"Broadcast:        {resultados['broadcast']}")
-        print(f"Rango de hosts:   {resultados['rango_hosts']}")
-        print(f"Hosts válidos:    {resultados['hosts_validos']}")
-        print(f"Total direcciones: {resultados['total_hosts']}")
-        print(f"Desperdicio:      {resultados['desperdicio']} direcciones")
-        print("-"*50)
-        print("REPRESENTACIÓN BINARIA")
-        print(f"IP:       {resultados['bin_ip']}")
-        print(f"Máscara:  {resultados['bin_mascara']}")
-        print(f"Red:      {resultados['bin_red']}")
-        print("="*50 + "\n")
-    
-    def ejecutar_desde_consola(self):
-        """
-        Interfaz de consola para la calculadora CIDR.
-        """
-        print("\n" + "="*50)
-        print("CALCULADORA CIDR")
-        print("="*50)
-        print("Formato de entrada:")
-        print("1. IP/prefijo (ej: 192.168.1.0/24)")
-        print("2. IP máscara (ej: 192.168.1.0 255.255.255.0)")
-        print("="*50)
-        
-        while True:
-            entrada = input("\nIngrese dirección IP con prefijo o máscara (o 'salir'): ").strip()
-            
-            if entrada.lower() == 'salir':
-                break
-            
-            try:
-                self.analizar_entrada(entrada)
-                resultados = self.calcular()
-                self.imprimir_resultados(resultados)
-            except ValueError as e:
-                print(f"Error: {e}")
-                print("Intente nuevamente.")
-
-if __name__ == "__main__":
-    calculadora = CalculadoraCIDR()
-    calculadora.ejecutar_desde_consola()
\ No newline at end of file
+from ip_utils import *
+from ip_utils import _importar_numpy
+import math
+import sys
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from perfilado import (PERFILADOR, agregar_argumentos, iniciar_desde_argumentos,
+                       reportar_desde_argumentos)
+
+# Columnas del modo por lotes (las representaciones binarias se omiten)
+CAMPOS_LOTE = ("ip_original", "prefijo", "mascara", "red", "broadcast",
+               "primer_host", "ultimo_host", "hosts_validos", "total_hosts",
+               "desperdicio")
+_MASCARAS_TEXTO = [prefijo_a_mascara(p) for p in range(33)]
+
+
+class CacheRedes:
+    """
+    Caché LRU acotada de la parte de un resultado CIDR que depende solo de
+    la red (red, broadcast, rango de hosts, conteos y binarios de red y
+    máscara), indexada por (red_entero, prefijo).
+    """
+    
+    def __init__(self, tamano: int = 4096):
+        if tamano < 0:
+            raise ValueError("El tamaño de la caché no puede ser negativo")
+        self.tamano = tamano
+        self.activa = True
+        self._entradas = OrderedDict()
+        self._candado = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+    
+    def obtener(self, clave: tuple):
+        """
+        Regresa la entrada de la clave (y la marca como usada recientemente),
+        o None si no está o la caché está desactivada.
+        """
+        if not self.activa or not self.tamano:
+            return None
+        with self._candado:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self.fallos += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return entrada
+    
+    def guardar(self, clave: tuple, entrada: dict):
+        """
+        Guarda una entrada, desalojando la menos usada si se llenó.
+        """
+        if not self.activa or not self.tamano:
+            return
+        with self._candado:
+            self._entradas[clave] = entrada
+            self._entradas.move_to_end(clave)
+            if len(self._entradas) > self.tamano:
+                self._entradas.popitem(last=False)
+                self.desalojos += 1
+    
+    def limpiar(self):
+        """
+        Vacía la caché y reinicia los contadores.
+        """
+        with self._candado:
+            self._entradas.clear()
+            self.aciertos = 0
+            self.fallos = 0
+            self.desalojos = 0
+    
+    def __len__(self):
+        return len(self._entradas)
+    
+    def estadisticas(self) -> dict:
+        with self._candado:
+            aciertos, fallos, desalojos = self.aciertos, self.fallos, self.desalojos
+            entradas = len(self._entradas)
+        consultas = aciertos + fallos
+        return {
+            "activa": self.activa,
+            "tamano": self.tamano,
+            "entradas": entradas,
+            "aciertos": aciertos,
+            "fallos": fallos,
+            "desalojos": desalojos,
+            "tasa_aciertos": aciertos / consultas if consultas else 0.0,
+        }
+
+
+# Caché compartida por omisión de todas las calculadoras CIDR
+CACHE_REDES = CacheRedes()
+
+    
+class CalculadoraCIDR:
+    """
+    Calculadora para operaciones CIDR
+    """
+    
+    def __init__(self, ip_con_prefijo: str = None, cache: CacheRedes = CACHE_REDES):
+        """
+        `cache` es la caché de datos por red; con None cada cálculo se hace
+        completo.
+        """
+        self.ip = None
+        self.prefijo = None
+        self.mascara = None
+        self.bits = 32
+        self.cache = cache
+        
+        if ip_con_prefijo:
+            self.analizar_entrada(ip_con_prefijo)
+    
+    def analizar_entrada(self, entrada: str):
+        entrada = entrada.strip()
+        
+        # Formato IPv6: IP/prefijo
+        if ':' in entrada:
+            partes = entrada.split('/')
+            if len(partes) != 2:
+                raise ValueError("Formato incorrecto. Use: IPv6/prefijo (ej: 2001:db8::/48)")
+            
+            ip = partes[0].strip()
+            ipv6_a_entero(ip)
+            
+            try:
+                prefijo = int(partes[1].strip())
+            except ValueError:
+                raise ValueError("Prefijo debe ser un número")
+            
+            if not 0 <= prefijo <= 128:
+                raise ValueError("Prefijo debe estar entre 0 y 128")
+            
+            self.ip = ip
+            self.prefijo = prefijo
+            self.mascara = prefijo_a_mascara_v6(prefijo)
+            self.bits = 128
+        
+        # Formato: IP/prefijo
+        elif '/' in entrada:
+            partes = entrada.split('/')
+            if len(partes) != 2:
+                raise ValueError("Formato incorrecto. Use: IP/prefijo o IP máscara")
+            
+            ip = partes[0].strip()
+            prefijo_str = partes[1].strip()
+            
+            if not validar_ip(ip):
+                raise ValueError("Dirección IP inválida")
+            
+            try:
+                prefijo = int(prefijo_str)
+            except ValueError:
+                raise ValueError("Prefijo debe ser un número")
+            
+            if not 0 <= prefijo <= 32:
+                raise ValueError("Prefijo debe estar entre 0 y 32")
+            
+            self.ip = ip
+            self.prefijo = prefijo
+            self.mascara = prefijo_a_mascara(prefijo)
+            self.bits = 32
+        
+        # Formato: IP máscara
+        else:
+            partes = entrada.split()
+            if len(partes) != 2:
+                raise ValueError("Formato incorrecto. Use: IP/prefijo o IP máscara")
+            
+            ip = partes[0].strip()
+            mascara = partes[1].strip()
+            
+            if not validar_ip(ip):
+                raise ValueError("Dirección IP inválida")
+            
+            if not validar_ip(mascara):
+                raise ValueError("Máscara inválida")
+            
+            try:
+                prefijo = mascara_a_prefijo(mascara)
+            except ValueError as e:
+                raise ValueError(f"Máscara inválida: {e}")
+            
+            self.ip = ip
+            self.prefijo = prefijo
+            self.mascara = mascara
+            self.bits = 32
+    
+    def calcular(self):
+        """
+        Calcula todas las propiedades de la red CIDR.
+        """
+        if not self.ip or self.prefijo is None:
+            raise ValueError("Debe proporcionar una IP y prefijo primero")
+        
+        if self.bits == 128:
+            ip_entero = ipv6_a_entero(self.ip)
+            red_entero = ip_entero & ~((1 << (128 - self.prefijo)) - 1)
+            # Las claves IPv6 llevan la versión para no chocar con IPv4
+            clave = (red_entero, self.prefijo, 128)
+            calcular_red = self._calcular_red6
+            bin_ip = obtener_binario_ipv6(ip_entero)
+        else:
+            ip_entero = ip_a_entero(self.ip)
+            mascara_entero = (0xFFFFFFFF << (32 - self.prefijo)) & 0xFFFFFFFF
+            red_entero = ip_entero & mascara_entero
+            clave = (red_entero, self.prefijo)
+            calcular_red = self._calcular_red
+            bin_ip = obtener_binario_ip(self.ip)
+        
+        # La parte que depende solo de la red se comparte entre IPs
+        de_red = self.cache.obtener(clave) if self.cache is not None else None
+        if de_red is None:
+            with PERFILADOR.etapa("cidr.red"):
+                de_red = calcular_red(red_entero, self.prefijo)
+            if self.cache is not None:
+                self.cache.guardar(clave, de_red)
+        
+        PERFILADOR.contar("cidr.calculos")
+        PERFILADOR.contar("cidr.cadenas")  # bin_ip
+        return {
+            "ip_original": self.ip,
+            "prefijo": self.prefijo,
+            "mascara": self.mascara,
+            "red": de_red["red"],
+            "broadcast": de_red["broadcast"],
+            "primer_host": de_red["primer_host"],
+            "ultimo_host": de_red["ultimo_host"],
+            "hosts_validos": de_red["hosts_validos"],
+            "total_hosts": de_red["total_hosts"],
+            "desperdicio": de_red["desperdicio"],
+            "bin_ip": bin_ip,
+            "bin_mascara": de_red["bin_mascara"],
+            "bin_red": de_red["bin_red"],
+            "rango_hosts": de_red["rango_hosts"],
+            "notacion_cidr": de_red["notacion_cidr"]
+        }
+    
+    def hosts(self):
+        """
+        Las direcciones de host de la red como secuencia perezosa
+        (enumeracion.HostsDeRed): len(), índices, rebanadas y exportación
+        por bloques sin generar la lista completa.
+        """
+        from enumeracion import HostsDeRed
+        
+        if not self.ip or self.prefijo is None:
+            raise ValueError("Debe proporcionar una IP y prefijo primero")
+        if self.bits == 128:
+            raise ValueError("La enumeración de hosts solo está disponible para IPv4")
+        return HostsDeRed(ip_a_entero(self.ip), self.prefijo)
+    
+    @staticmethod
+    def _calcular_red(red_entero: int, prefijo: int) -> dict:
+        """
+        Calcula los campos del resultado que dependen solo de la red.
+        """
+        mascara_entero = (0xFFFFFFFF << (32 - prefijo)) & 0xFFFFFFFF
+        red = entero_a_ip(red_entero)
+        
+        # Calcular broadcast
+        wildcard = mascara_entero ^ 0xFFFFFFFF
+        broadcast_entero = red_entero | wildcard
+        broadcast = entero_a_ip(broadcast_entero)
+        
+        # Calcular primer y último host
+        if prefijo == 32:
+            primer_host = red
+            ultimo_host = red
+            hosts_validos = 1
+        elif prefijo == 31:
+            # Caso especial: /31 (RFC 3021)
+            primer_host = red
+            ultimo_host = broadcast
+            hosts_validos = 2
+        else:
+            primer_host_entero = red_entero + 1
+            ultimo_host_entero = broadcast_entero - 1
+            primer_host = entero_a_ip(primer_host_entero)
+            ultimo_host = entero_a_ip(ultimo_host_entero)
+            hosts_validos = ultimo_host_entero - primer_host_entero + 1
+        
+        # Calcular número total de hosts
+        if prefijo == 32:
+            total_hosts = 1
+        else:
+            total_hosts = 2 ** (32 - prefijo)
+        
+        # Red, broadcast y máscara, más primer y último host si prefijo < 31
+        PERFILADOR.contar("cidr.conversiones_ip", 3 if prefijo >= 31 else 5)
+        PERFILADOR.contar("cidr.cadenas", 4)  # bin_mascara, bin_red, rango_hosts y notacion_cidr
+        return {
+            "red": red,
+            "broadcast": broadcast,
+            "primer_host": primer_host,
+            "ultimo_host": ultimo_host,
+            "hosts_validos": hosts_validos,
+            "total_hosts": total_hosts,
+            # Calcular desperdicio
+            "desperdicio": total_hosts - hosts_validos if prefijo < 31 else 0,
+            # Representaciones binarias
+            "bin_mascara": obtener_binario_ip(entero_a_ip(mascara_entero)),
+            "bin_red": obtener_binario_ip(red),
+            "rango_hosts": f"{primer_host} - {ultimo_host}",
+            "notacion_cidr": f"{red}/{prefijo}",
+        }
+    
+    @staticmethod
+    def _calcular_red6(red_entero: int, prefijo: int) -> dict:
+        """
+        Campos que dependen solo de la red, para IPv6: no hay broadcast (se
+        reporta la última dirección) y todas las direcciones son hosts.
+        """
+        total_hosts = 1 << (128 - prefijo)
+        ultima_entero = red_entero + total_hosts - 1
+        red = entero_a_ipv6(red_entero)
+        ultima = entero_a_ipv6(ultima_entero)
+        mascara_entero = ((1 << 128) - 1) ^ (total_hosts - 1)
+        
+        PERFILADOR.contar("cidr.conversiones_ip", 2)
+        PERFILADOR.contar("cidr.cadenas", 4)
+        return {
+            "red": red,
+            "broadcast": ultima,
+            "primer_host": red,
+            "ultimo_host": ultima,
+            "hosts_validos": total_hosts,
+            "total_hosts": total_hosts,
+            "desperdicio": 0,
+            "bin_mascara": obtener_binario_ipv6(mascara_entero),
+            "bin_red": obtener_binario_ipv6(red_entero),
+            "rango_hosts": f"{red} - {ultima}",
+            "notacion_cidr": f"{red}/{prefijo}",
+        }
+    
+    def imprimir_resultados(self, resultados: dict):
+        print("\n" + "="*50)
+        print("RESULTADOS CALCULADORA CIDR")
+        print("="*50)
+        print(f"IP original:      {resultados['ip_original']}")
+        print(f"Notación CIDR:    {resultados['notacion_cidr']}")
+        print(f"Máscara:          {resultados['mascara']} (/{resultados['prefijo']})")
+        print(f"Dirección de red: {resultados['red']}")
+        print(f"Broadcast:        {resultados['broadcast']}")
+        print(f"Rango de hosts:   {resultados['rango_hosts']}")
+        print(f"Hosts válidos:    {resultados['hosts_validos']}")
+        print(f"Total direcciones: {resultados['total_hosts']}")
+        print(f"Desperdicio:      {resultados['desperdicio']} direcciones")
+        print("-"*50)
+        print("REPRESENTACIÓN BINARIA")
+        print(f"IP:       {resultados['bin_ip']}")
+        print(f"Máscara:  {resultados['bin_mascara']}")
+        print(f"Red:      {resultados['bin_red']}")
+        print("="*50 + "\n")
+    
+    def calcular_lote(self, lineas: list) -> dict:
+        """
+        Calcula en bloque las propiedades CIDR de una lista de líneas
+        (bytes o str) con formato IP/prefijo o IP máscara. Regresa un dict
+        de columnas con las filas IPv4 válidas, su posición entre las filas
+        de salida ("posicion"), las filas IPv6 como (posición, resultado de
+        calcular) en "ipv6" y el número de líneas rechazadas.
+        
+        Las columnas NumPy son de 64 bits, así que las líneas IPv6 (las que
+        tienen ':') se calculan una por una con calcular(), compartiendo la
+        caché de redes.
+        """
+        np = _importar_numpy()
+        
+        ips = []
+        segundos = []
+        es_prefijo = []
+        posiciones = []
+        filas6 = []
+        rechazadas = 0
+        
+        # 1. Separar IP y prefijo/máscara de cada línea
+        for linea in lineas:
+            if isinstance(linea, str):
+                linea = linea.encode('ascii', 'replace')
+            if b':' in linea:
+                try:
+                    calculadora = CalculadoraCIDR(linea.decode('ascii'), cache=self.cache)
+                    filas6.append((len(posiciones) + len(filas6), calculadora.calcular()))
+                except ValueError:
+                    rechazadas += 1
+                continue
+            if b'/' in linea:
+                partes = linea.split(b'/')
+                con_prefijo = True
+            else:
+                partes = linea.split()
+                con_prefijo = False
+                if not partes:
+                    continue  # Línea vacía
+            if len(partes) != 2:
+                rechazadas += 1
+                continue
+            ips.append(partes[0].strip())
+            segundos.append(partes[1].strip())
+            es_prefijo.append(con_prefijo)
+            posiciones.append(len(posiciones) + len(filas6))
+        
+        # 2. Convertir IPs, prefijos y máscaras en bloque
+        ip_entero, validos = ips_a_enteros(ips)
+        es_prefijo = np.array(es_prefijo, dtype=bool)
+        prefijo = np.zeros(len(segundos), dtype=np.int64)
+        
+        if es_prefijo.any():
+            indices = np.flatnonzero(es_prefijo)
+            valores, ok = textos_a_prefijos([segundos[i] for i in indices])
+            prefijo[indices] = valores
+            validos[indices] &= ok
+        
+        if not es_prefijo.all():
+            indices = np.flatnonzero(~es_prefijo)
+            valores, ok = mascaras_a_prefijos([segundos[i] for i in indices])
+            prefijo[indices] = valores
+            validos[indices] &= ok
+        
+        rechazadas += int(np.count_nonzero(~validos))
+        ip_entero = ip_entero[validos]
+        prefijo = prefijo[validos]
+        ips_originales = [ip for ip, ok in zip(ips, validos.tolist()) if ok]
+        posiciones = np.array(posiciones, dtype=np.int64)[validos]
+        
+        # 3. Red, broadcast y rango de hosts (mismas reglas que calcular)
+        red = calcular_redes(ip_entero, prefijo).astype(np.int64)
+        broadcast = calcular_broadcasts(ip_entero, prefijo).astype(np.int64)
+        total_hosts = calcular_tamanos_bloque(prefijo)
+        
+        normal = prefijo < 31
+        primer_host = np.where(normal, red + 1, red)
+        ultimo_host = np.where(normal, broadcast - 1, broadcast)
+        hosts_validos = np.where(normal, total_hosts - 2, total_hosts)
+        desperdicio = np.where(normal, 2, 0)
+        
+        return {
+            "ip_original": ips_originales,
+            "prefijo": prefijo,
+            "red": red,
+            "broadcast": broadcast,
+            "primer_host": primer_host,
+            "ultimo_host": ultimo_host,
+            "hosts_validos": hosts_validos,
+            "total_hosts": total_hosts,
+            "desperdicio": desperdicio,
+            "posicion": posiciones,
+            "ipv6": filas6,
+            "rechazadas": rechazadas,
+        }
+    
+    def _formatear_lote(self, lote: dict, formato: str) -> str:
+        """
+        Convierte un lote calculado en texto CSV o JSONL.
+        """
+        prefijos = lote["prefijo"].tolist()
+        columnas = zip(
+            (ip.decode('ascii') for ip in lote["ip_original"]),
+            prefijos,
+            (_MASCARAS_TEXTO[p] for p in prefijos),
+            enteros_a_ips(lote["red"]),
+            enteros_a_ips(lote["broadcast"]),
+            enteros_a_ips(lote["primer_host"]),
+            enteros_a_ips(lote["ultimo_host"]),
+            lote["hosts_validos"].tolist(),
+            lote["total_hosts"].tolist(),
+            lote["desperdicio"].tolist(),
+        )
+        
+        # Las filas IPv6 ya vienen calculadas: se formatean después de las
+        # IPv4 y luego se intercalan en su posición original
+        filas6 = [tuple(resultado[campo] for campo in CAMPOS_LOTE) for _, resultado in lote["ipv6"]]
+        if filas6:
+            columnas = chain(columnas, filas6)
+        
+        if formato == "csv":
+            textos = (
+                f"{ip},{p},{m},{r},{b},{ph},{uh},{hv},{th},{d}\n"
+                for ip, p, m, r, b, ph, uh, hv, th, d in columnas
+            )
+        else:
+            # JSONL: todos los valores son ASCII seguros, no hace falta escapar
+            textos = (
+                f'{{"ip_original": "{ip}", "prefijo": {p}, "mascara": "{m}", '
+                f'"red": "{r}", "broadcast": "{b}", "primer_host": "{ph}", '
+                f'"ultimo_host": "{uh}", "hosts_validos": {hv}, '
+                f'"total_hosts": {th}, "desperdicio": {d}}}\n'
+                for ip, p, m, r, b, ph, uh, hv, th, d in columnas
+            )
+        
+        if not filas6:
+            return "".join(textos)
+        textos = list(textos)
+        posiciones = lote["posicion"].tolist() + [posicion for posicion, _ in lote["ipv6"]]
+        return "".join(textos[i] for i in sorted(range(len(textos)), key=posiciones.__getitem__))
+    
+    def procesar_flujo(self, entrada, salida, formato: str = "csv",
+                       lineas_por_bloque: int = 100000) -> dict:
+        """
+        Procesa un flujo de líneas (archivo binario o de texto) por bloques y
+        escribe una fila CSV o JSONL por cada entrada válida. La memoria usada
+        depende solo del tamaño del bloque. Regresa estadísticas del proceso.
+        """
+        if formato not in ("csv", "jsonl"):
+            raise ValueError("Formato debe ser 'csv' o 'jsonl'")
+        if lineas_por_bloque <= 0:
+            raise ValueError("El tamaño de bloque debe ser mayor a 0")
+        
+        inicio = time.perf_counter()
+        total_lineas = 0
+        procesadas = 0
+        rechazadas = 0
+        
+        if formato == "csv":
+            salida.write(",".join(CAMPOS_LOTE) + "\n")
+        
+        bloque = []
+        for linea in entrada:
+            bloque.append(linea)
+            if len(bloque) >= lineas_por_bloque:
+                lote = self._procesar_bloque(bloque, salida, formato)
+                total_lineas += len(bloque)
+                procesadas += len(lote["ip_original"]) + len(lote["ipv6"])
+                rechazadas += lote["rechazadas"]
+                bloque = []
+        
+        if bloque:
+            lote = self._procesar_bloque(bloque, salida, formato)
+            total_lineas += len(bloque)
+            procesadas += len(lote["ip_original"]) + len(lote["ipv6"])
+            rechazadas += lote["rechazadas"]
+        
+        segundos = time.perf_counter() - inicio
+        return {
+            "lineas": total_lineas,
+            "procesadas": procesadas,
+            "rechazadas": rechazadas,
+            "segundos": segundos,
+            "lineas_por_segundo": total_lineas / segundos if segundos > 0 else 0.0,
+        }
+    
+    def _procesar_bloque(self, bloque: list, salida, formato: str) -> dict:
+        """
+        Calcula, formatea y escribe un bloque de procesar_flujo.
+        """
+        with PERFILADOR.etapa("cidr.lote.calcular"):
+            lote = self.calcular_lote(bloque)
+        with PERFILADOR.etapa("cidr.lote.formatear"):
+            texto = self._formatear_lote(lote, formato)
+        with PERFILADOR.etapa("cidr.lote.escribir"):
+            salida.write(texto)
+        PERFILADOR.contar("cidr.lote.filas", len(lote["ip_original"]) + len(lote["ipv6"]))
+        return lote
+    
+    def ejecutar_desde_consola(self):
+        """
+        Interfaz de consola para la calculadora CIDR.
+        """
+        print("\n" + "="*50)
+        print("CALCULADORA CIDR")
+        print("="*50)
+        print("Formato de entrada:")
+        print("1. IP/prefijo (ej: 192.168.1.0/24)")
+        print("2. IP máscara (ej: 192.168.1.0 255.255.255.0)")
+        print("="*50)
+        
+        while True:
+            entrada = input("\nIngrese dirección IP con prefijo o máscara (o 'salir'): ").strip()
+            
+            if entrada.lower() == 'salir':
+                break
+            
+            try:
+                self.analizar_entrada(entrada)
+                resultados = self.calcular()
+                self.imprimir_resultados(resultados)
+            except ValueError as e:
+                print(f"Error: {e}")
+                print("Intente nuevamente.")
+
+def ejecutar_lote(argumentos: list = None):
+    """
+    Modo por lotes desde la línea de comandos:
+    python cidr_calculator.py --lote ARCHIVO|- [--formato csv|jsonl] [--salida ARCHIVO]
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Análisis CIDR por lotes")
+    parser.add_argument("--lote", required=True, help="Archivo de entrada ('-' para stdin)")
+    parser.add_argument("--formato", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("--salida", default="-", help="Archivo de salida ('-' para stdout)")
+    parser.add_argument("--bloque", type=int, default=100000, help="Líneas por bloque")
+    agregar_argumentos(parser)
+    args = parser.parse_args(argumentos)
+    iniciar_desde_argumentos(args)
+    
+    entrada = sys.stdin.buffer if args.lote == "-" else open(args.lote, "rb")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8", newline="")
+    
+    try:
+        estadisticas = CalculadoraCIDR().procesar_flujo(entrada, salida, args.formato, args.bloque)
+    finally:
+        if entrada is not sys.stdin.buffer:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+    
+    print(f"Líneas: {estadisticas['lineas']}  Procesadas: {estadisticas['procesadas']}  "
+          f"Rechazadas: {estadisticas['rechazadas']}  "
+          f"Tiempo: {estadisticas['segundos']:.2f} s  "
+          f"({estadisticas['lineas_por_segundo']:,.0f} líneas/s)", file=sys.stderr)
+    reportar_desde_argumentos(args, sys.stderr)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        ejecutar_lote()
+    else:
+        calculadora = CalculadoraCIDR()
+        calculadora.ejecutar_desde_consola()
\ No newline at end of file
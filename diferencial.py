@@ -0,0 +1,554 @@
+import ipaddress
+import random
+import time
+
+from ip_utils import *
+from cidr_calculator import CalculadoraCIDR
+from vlsm_calculator import CalculadoraVLSM
+
+# Entradas por caso (los casos VLSM son conjuntos de requerimientos)
+CANTIDAD = 20000
+CANTIDAD_VLSM = 1000
+# Prefijo más corto cuyas redes se enumeran con hosts() de ipaddress
+# (/14: 262 142 hosts)
+PREFIJO_MINIMO_ENUMERADO = 14
+# Máximo de diferencias que se guardan por caso para el reporte
+MAX_DIFERENCIAS = 20
+
+_ERROR = "error"
+
+
+# ---------------------------------------------------------------------------
+# Generadores de entradas
+# ---------------------------------------------------------------------------
+
+def _entero_aleatorio(aleatorio: random.Random) -> int:
+    # Con algo de peso en los extremos del espacio de direcciones
+    if aleatorio.random() < 0.02:
+        return aleatorio.choice((0, 1, 0xFFFFFFFE, 0xFFFFFFFF))
+    return aleatorio.getrandbits(32)
+
+
+def _prefijo_aleatorio(aleatorio: random.Random) -> int:
+    # Uno de cada cinco en los casos especiales /0, /1, /31 y /32
+    if aleatorio.random() < 0.2:
+        return aleatorio.choice((0, 1, 31, 32))
+    return aleatorio.randint(0, 32)
+
+
+def _generar_enteros(aleatorio, cantidad):
+    return [_entero_aleatorio(aleatorio) for _ in range(cantidad)]
+
+
+def _generar_ips(aleatorio, cantidad):
+    return [entero_a_ip(_entero_aleatorio(aleatorio)) for _ in range(cantidad)]
+
+
+def _generar_textos_ip(aleatorio, cantidad):
+    """
+    IPs válidas e inválidas (octetos fuera de rango, 3 o 5 octetos, letras,
+    vacías). No se generan octetos con ceros a la izquierda: ipaddress los
+    rechaza por ambiguos y validar_ip no.
+    """
+    textos = []
+    for _ in range(cantidad):
+        tipo = aleatorio.random()
+        octetos = [str(aleatorio.randint(0, 255)) for _ in range(4)]
+        if tipo < 0.6:
+            pass
+        elif tipo < 0.75:
+            octetos[aleatorio.randrange(4)] = str(aleatorio.randint(256, 999))
+        elif tipo < 0.85:
+            if aleatorio.random() < 0.5:
+                octetos.pop()
+            else:
+                octetos.append(str(aleatorio.randint(0, 255)))
+        elif tipo < 0.95:
+            octetos[aleatorio.randrange(4)] = aleatorio.choice(("a", "-1", "", "1a", " "))
+        else:
+            textos.append("")
+            continue
+        textos.append(".".join(octetos))
+    return textos
+
+
+def _generar_mascaras(aleatorio, cantidad):
+    """
+    Máscaras válidas y enteros arbitrarios (casi siempre no contiguos).
+    """
+    return [prefijo_a_mascara(_prefijo_aleatorio(aleatorio)) if aleatorio.random() < 0.7
+            else entero_a_ip(_entero_aleatorio(aleatorio)) for _ in range(cantidad)]
+
+
+def _generar_prefijos(aleatorio, cantidad):
+    return [_prefijo_aleatorio(aleatorio) for _ in range(cantidad)]
+
+
+def _generar_cidr(aleatorio, cantidad):
+    """
+    Entradas "IP/prefijo" e "IP máscara" de CalculadoraCIDR.
+    """
+    entradas = []
+    for _ in range(cantidad):
+        ip = entero_a_ip(_entero_aleatorio(aleatorio))
+        prefijo = _prefijo_aleatorio(aleatorio)
+        if aleatorio.random() < 0.7:
+            entradas.append(f"{ip}/{prefijo}")
+        else:
+            entradas.append(f"{ip} {prefijo_a_mascara(prefijo)}")
+    return entradas
+
+
+def _generar_ipv6(aleatorio, cantidad):
+    """
+    Enteros de 128 bits con rachas de grupos en cero (para probar "::").
+    Se excluyen las IPv4 mapeadas, cuyo texto cambia entre versiones de
+    Python.
+    """
+    enteros = []
+    while len(enteros) < cantidad:
+        if aleatorio.random() < 0.3:
+            entero = aleatorio.getrandbits(128)
+        else:
+            entero = 0
+            for _ in range(8):
+                grupo = aleatorio.choice((0, 0, 0, 1, aleatorio.getrandbits(16)))
+                entero = (entero << 16) | grupo
+        if entero >> 32 != 0xFFFF:
+            enteros.append(entero)
+    return enteros
+
+
+def _generar_cidr6(aleatorio, cantidad):
+    entradas = []
+    for entero in _generar_ipv6(aleatorio, cantidad):
+        prefijo = (aleatorio.choice((0, 64, 127, 128)) if aleatorio.random() < 0.2
+                   else aleatorio.randint(0, 128))
+        entradas.append(f"{entero_a_ipv6(entero)}/{prefijo}")
+    return entradas
+
+
+def _generar_vlsm(aleatorio, cantidad):
+    """
+    (red_base, reservas, [(nombre, hosts)]): algunos planes no caben y la
+    mitad lleva reservas.
+    """
+    planes = []
+    for _ in range(cantidad):
+        prefijo_base = aleatorio.randint(16, 28)
+        red_base = _entero_aleatorio(aleatorio) & ((0xFFFFFFFF << (32 - prefijo_base)) & 0xFFFFFFFF)
+        espacio = 1 << (32 - prefijo_base)
+        subredes = [(f"S{i}", aleatorio.choice((1, 2, 3, aleatorio.randint(1, max(1, espacio // 8)))))
+                    for i in range(aleatorio.randint(1, 12))]
+        reservas = []
+        if aleatorio.random() < 0.5:
+            prefijo = aleatorio.randint(prefijo_base + 1, 32)
+            desplazamiento = aleatorio.randrange(1 << (prefijo - prefijo_base)) << (32 - prefijo)
+            reservas.append(f"{entero_a_ip(red_base + desplazamiento)}/{prefijo}")
+        planes.append((f"{entero_a_ip(red_base)}/{prefijo_base}", reservas, subredes))
+    return planes
+
+
+# ---------------------------------------------------------------------------
+# Implementación propia y referencia (ipaddress)
+# ---------------------------------------------------------------------------
+
+def _o_error(funcion, entrada):
+    try:
+        return funcion(entrada)
+    except ValueError:
+        return _ERROR
+
+
+def _binario_ip(entero: int) -> str:
+    binario = format(entero, "032b")
+    return ".".join(binario[i:i + 8] for i in range(0, 32, 8))
+
+
+def _cidr_propio(entradas):
+    return [_o_error(lambda e: CalculadoraCIDR(e).calcular(), e) for e in entradas]
+
+
+# Por prefijo: (hosts, desplazamiento del último host) de la primera red
+# de ese tamaño que se enumeró
+_HOSTS_MUESTREADOS = {}
+
+
+def _contar_hosts(red) -> tuple:
+    hosts = 0
+    ultimo_host = None
+    for ultimo_host in red.hosts():
+        hosts += 1
+    return hosts, int(ultimo_host) - int(red.network_address)
+
+
+def _hosts_referencia(red):
+    """
+    (hosts_validos, último host) de una red IPv4 según hosts() de
+    ipaddress, o None si la red es demasiado grande para enumerarla.
+    Las redes de /24 en adelante se enumeran completas; las más grandes se
+    enumeran una vez por prefijo (la primera red de ese tamaño que llega)
+    y el desplazamiento del último host se traslada a las demás.
+    """
+    if red.prefixlen >= 24:
+        hosts, desplazamiento = _contar_hosts(red)
+    elif red.prefixlen >= PREFIJO_MINIMO_ENUMERADO:
+        if red.prefixlen not in _HOSTS_MUESTREADOS:
+            _HOSTS_MUESTREADOS[red.prefixlen] = _contar_hosts(red)
+        hosts, desplazamiento = _HOSTS_MUESTREADOS[red.prefixlen]
+    else:
+        return None
+    return hosts, red.network_address + desplazamiento
+
+
+def _cidr_referencia(entradas):
+    """
+    Resultados de ipaddress con los campos de CalculadoraCIDR. En las redes
+    con prefijo menor a PREFIJO_MINIMO_ENUMERADO no se comparan los campos
+    que dependen de enumerar hosts().
+    """
+    resultados = []
+    for entrada in entradas:
+        ip, separador, segundo = entrada.partition("/") if "/" in entrada else entrada.partition(" ")
+        direccion = ipaddress.IPv4Address(ip)
+        red = ipaddress.IPv4Network(f"{ip}/{segundo}", strict=False)
+        primer_host = next(iter(red.hosts()))
+
+        resultado = {
+            "ip_original": ip,
+            "prefijo": red.prefixlen,
+            "mascara": str(red.netmask),
+            "red": str(red.network_address),
+            "broadcast": str(red.broadcast_address),
+            "primer_host": str(primer_host),
+            "total_hosts": red.num_addresses,
+            "bin_ip": _binario_ip(int(direccion)),
+            "bin_mascara": _binario_ip(int(red.netmask)),
+            "bin_red": _binario_ip(int(red.network_address)),
+            "notacion_cidr": str(red),
+        }
+        enumerados = _hosts_referencia(red)
+        if enumerados is not None:
+            hosts_validos, ultimo_host = enumerados
+            resultado.update({
+                "ultimo_host": str(ultimo_host),
+                "hosts_validos": hosts_validos,
+                "desperdicio": red.num_addresses - hosts_validos,
+                "rango_hosts": f"{primer_host} - {ultimo_host}",
+            })
+        resultados.append(resultado)
+    return resultados
+
+
+# Campos IPv6 comparables: ipaddress excluye de hosts() la dirección
+# anycast de la subred y CalculadoraCIDR cuenta todas las direcciones
+_CAMPOS_CIDR6 = ("prefijo", "mascara", "red", "broadcast", "total_hosts", "notacion_cidr")
+
+
+def _cidr6_propio(entradas):
+    resultados = []
+    for entrada in entradas:
+        resultado = CalculadoraCIDR(entrada).calcular()
+        resultados.append({campo: resultado[campo] for campo in _CAMPOS_CIDR6})
+    return resultados
+
+
+def _cidr6_referencia(entradas):
+    resultados = []
+    for entrada in entradas:
+        red = ipaddress.IPv6Network(entrada, strict=False)
+        resultados.append({
+            "prefijo": red.prefixlen,
+            "mascara": str(red.netmask),
+            "red": str(red.network_address),
+            "broadcast": str(red.broadcast_address),
+            "total_hosts": red.num_addresses,
+            "notacion_cidr": str(red),
+        })
+    return resultados
+
+
+def _mascara_referencia(mascara: str):
+    # ipaddress también acepta máscaras de host (0.0.0.255); aquí solo
+    # cuentan las de red
+    red = ipaddress.IPv4Network(f"0.0.0.0/{mascara}")
+    if str(red.netmask) != mascara:
+        raise ValueError(mascara)
+    return red.prefixlen
+
+
+def _prefijo_vlsm_referencia(hosts: int) -> int:
+    # El prefijo más largo cuya red tiene hosts suficientes según hosts()
+    # de ipaddress (los planes generados no piden redes más grandes que las
+    # enumerables)
+    for prefijo in range(30, PREFIJO_MINIMO_ENUMERADO - 1, -1):
+        if _hosts_referencia(ipaddress.IPv4Network(f"0.0.0.0/{prefijo}"))[0] >= hosts:
+            return prefijo
+    raise ValueError(hosts)
+
+
+def _registro_vlsm(nombre, hosts, red) -> dict:
+    primer_host = next(iter(red.hosts()))
+    hosts_validos, ultimo_host = _hosts_referencia(red)
+    return {
+        "nombre": nombre,
+        "hosts_requeridos": hosts,
+        "red": str(red.network_address),
+        "prefijo": red.prefixlen,
+        "mascara": str(red.netmask),
+        "broadcast": str(red.broadcast_address),
+        "primer_host": str(primer_host),
+        "ultimo_host": str(ultimo_host),
+        "hosts_validos": hosts_validos,
+        "tam_bloque": red.num_addresses,
+        "desperdicio": red.num_addresses - hosts_validos,
+        "rango_hosts": f"{primer_host} - {ultimo_host}",
+        "notacion_cidr": str(red),
+    }
+
+
+def _vlsm_propio(planes):
+    resultados = []
+    for red_base, reservas, subredes in planes:
+        calculadora = CalculadoraVLSM()
+        calculadora.configurar_red_base(red_base)
+        for reserva in reservas:
+            calculadora.reservar_red(reserva)
+        for nombre, hosts in subredes:
+            calculadora.agregar_subred(nombre, hosts)
+        try:
+            registros = [dict(r) for r in calculadora.calcular_vlsm()]
+        except ValueError:
+            resultados.append(_ERROR)
+            continue
+        if reservas:
+            # Con reservas se comparan propiedades: el acomodo lo decide el
+            # asignador buddy
+            propiedades = _PropiedadesVLSM(_propiedades_vlsm(registros))
+            propiedades.redes = [r["notacion_cidr"] for r in registros]
+            registros = propiedades
+        resultados.append(registros)
+    return resultados
+
+
+class _PropiedadesVLSM(list):
+    """
+    Propiedades de un plan con reservas (se comparan como lista) con las
+    redes asignadas en `redes`, para verificarlas sin recalcular el plan.
+    """
+
+
+def _propiedades_vlsm(registros: list) -> list:
+    return sorted((r["nombre"], r["prefijo"]) for r in registros)
+
+
+def _primer_ajuste(base, ocupadas: list, prefijo: int):
+    """
+    La primera red /prefijo de la red base, en orden de direcciones, que no
+    se solapa con ninguna de `ocupadas`, o None si no hay.
+    """
+    tamano = 1 << (32 - prefijo)
+    candidata = int(base.network_address)
+    fin_base = int(base.broadcast_address)
+    while candidata + tamano - 1 <= fin_base:
+        red = ipaddress.IPv4Network((candidata, prefijo))
+        choque = next((ocupada for ocupada in ocupadas if red.overlaps(ocupada)), None)
+        if choque is None:
+            return red
+        # Siguiente bloque alineado después de la red con la que choca
+        siguiente = int(choque.broadcast_address) + 1
+        candidata = max(candidata + tamano, -(-siguiente // tamano) * tamano)
+    return None
+
+
+def _vlsm_referencia(planes):
+    """
+    VLSM con ipaddress: de mayor a menor, cada subred en la primera
+    dirección libre. Con reservas cada subred va en el primer bloque
+    alineado que no choca con las reservas ni con las ya colocadas (con
+    bloques potencia de 2 de mayor a menor, cualquier bloque libre da el
+    mismo resultado de factibilidad que el asignador propio) y se regresan
+    las mismas propiedades que la implementación propia.
+    """
+    resultados = []
+    for red_base, reservas, subredes in planes:
+        base = ipaddress.IPv4Network(red_base)
+        ordenadas = sorted(subredes, key=lambda s: s[1], reverse=True)
+        prefijos = [_prefijo_vlsm_referencia(hosts) for _, hosts in ordenadas]
+
+        if not reservas:
+            registros = []
+            actual = int(base.network_address)
+            fin = int(base.broadcast_address)
+            for (nombre, hosts), prefijo in zip(ordenadas, prefijos):
+                if prefijo < base.prefixlen or actual + (1 << (32 - prefijo)) - 1 > fin:
+                    registros = _ERROR
+                    break
+                red = ipaddress.IPv4Network((actual, prefijo))
+                registros.append(_registro_vlsm(nombre, hosts, red))
+                actual = int(red.broadcast_address) + 1
+            resultados.append(registros)
+            continue
+
+        ocupadas = [ipaddress.IPv4Network(reserva, strict=False) for reserva in reservas]
+        cabe = True
+        for prefijo in prefijos:
+            red = _primer_ajuste(base, ocupadas, prefijo) if prefijo >= base.prefixlen else None
+            if red is None:
+                cabe = False
+                break
+            ocupadas.append(red)
+        resultados.append(_propiedades_vlsm([{"nombre": n, "prefijo": p}
+                                             for (n, _), p in zip(ordenadas, prefijos)])
+                          if cabe else _ERROR)
+    return resultados
+
+
+def _verificar_vlsm_con_reservas(planes, resultados_propios) -> list:
+    """
+    Verifica con ipaddress que las subredes asignadas con reservas están
+    dentro de la red base y no se solapan entre sí ni con las reservas. Usa
+    las redes que guardó _vlsm_propio.
+    """
+    diferencias = []
+    for plan, propio in zip(planes, resultados_propios):
+        red_base, reservas, subredes = plan
+        if not reservas or propio == _ERROR:
+            continue
+        base = ipaddress.IPv4Network(red_base)
+        redes = sorted([ipaddress.IPv4Network(red) for red in propio.redes]
+                       + [ipaddress.IPv4Network(r, strict=False) for r in reservas])
+        if not all(red.subnet_of(base) for red in redes) or any(
+                a.overlaps(b) for a, b in zip(redes, redes[1:])):
+            diferencias.append({"entrada": plan, "campo": "solapamiento",
+                                "propio": [str(r) for r in redes], "referencia": None})
+    return diferencias
+
+
+CASOS = {
+    "ip_a_entero": (_generar_ips,
+                    lambda xs: [ip_a_entero(x) for x in xs],
+                    lambda xs: [int(ipaddress.IPv4Address(x)) for x in xs]),
+    "entero_a_ip": (_generar_enteros,
+                    lambda xs: [entero_a_ip(x) for x in xs],
+                    lambda xs: [str(ipaddress.IPv4Address(x)) for x in xs]),
+    "validar_ip": (_generar_textos_ip,
+                   lambda xs: [validar_ip(x) for x in xs],
+                   lambda xs: [_o_error(ipaddress.IPv4Address, x) != _ERROR for x in xs]),
+    "mascara_a_prefijo": (_generar_mascaras,
+                          lambda xs: [_o_error(mascara_a_prefijo, x) for x in xs],
+                          lambda xs: [_o_error(_mascara_referencia, x) for x in xs]),
+    "prefijo_a_mascara": (_generar_prefijos,
+                          lambda xs: [prefijo_a_mascara(x) for x in xs],
+                          lambda xs: [str(ipaddress.IPv4Network(f"0.0.0.0/{x}").netmask) for x in xs]),
+    "cidr": (_generar_cidr, _cidr_propio, _cidr_referencia),
+    "ipv6_a_entero": (lambda a, n: [entero_a_ipv6(x) for x in _generar_ipv6(a, n)],
+                      lambda xs: [ipv6_a_entero(x) for x in xs],
+                      lambda xs: [int(ipaddress.IPv6Address(x)) for x in xs]),
+    "entero_a_ipv6": (_generar_ipv6,
+                      lambda xs: [entero_a_ipv6(x) for x in xs],
+                      lambda xs: [str(ipaddress.IPv6Address(x)) for x in xs]),
+    "cidr6": (_generar_cidr6, _cidr6_propio, _cidr6_referencia),
+    "vlsm": (_generar_vlsm, _vlsm_propio, _vlsm_referencia),
+}
+
+
+def _diferencias(entradas, propios, referencias) -> list:
+    diferencias = []
+    for entrada, propio, referencia in zip(entradas, propios, referencias):
+        if propio == referencia:
+            continue
+        if isinstance(propio, dict) and isinstance(referencia, dict):
+            for campo in referencia:
+                if propio.get(campo) != referencia[campo]:
+                    diferencias.append({"entrada": entrada, "campo": campo,
+                                        "propio": propio.get(campo), "referencia": referencia[campo]})
+        elif isinstance(propio, list) and isinstance(referencia, list) and len(propio) == len(referencia):
+            for registro_propio, registro_referencia in zip(propio, referencia):
+                if registro_propio != registro_referencia:
+                    diferencias.extend(_diferencias([entrada], [registro_propio], [registro_referencia]))
+        else:
+            diferencias.append({"entrada": entrada, "campo": None,
+                                "propio": propio, "referencia": referencia})
+    return diferencias
+
+
+def ejecutar_caso(nombre: str, cantidad: int, semilla: int = 1) -> dict:
+    """
+    Genera `cantidad` entradas con la semilla, ejecuta la implementación
+    propia y la referencia de ipaddress sobre las mismas entradas, compara
+    todos los campos y mide ambas.
+    """
+    generar, propio, referencia = CASOS[nombre]
+    entradas = generar(random.Random(f"{semilla}:{nombre}"), cantidad)
+
+    inicio = time.perf_counter()
+    propios = propio(entradas)
+    segundos = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    referencias = referencia(entradas)
+    segundos_referencia = time.perf_counter() - inicio
+
+    diferencias = _diferencias(entradas, propios, referencias)
+    if nombre == "vlsm":
+        diferencias.extend(_verificar_vlsm_con_reservas(entradas, propios))
+
+    return {
+        "caso": nombre,
+        "entradas": cantidad,
+        "errores": sum(1 for p in propios if p == _ERROR),
+        "diferencias": len(diferencias),
+        "ejemplos": diferencias[:MAX_DIFERENCIAS],
+        "segundos": segundos,
+        "segundos_ipaddress": segundos_referencia,
+        "por_segundo": cantidad / segundos if segundos else 0.0,
+        "por_segundo_ipaddress": cantidad / segundos_referencia if segundos_referencia else 0.0,
+        "aceleracion": segundos_referencia / segundos if segundos else 0.0,
+    }
+
+
+def ejecutar_diferencial(casos: list = None, cantidad: int = CANTIDAD,
+                         cantidad_vlsm: int = CANTIDAD_VLSM, semilla: int = 1) -> list:
+    """
+    Ejecuta los casos indicados (todos por omisión). Los casos VLSM usan
+    `cantidad_vlsm` conjuntos de requerimientos.
+    """
+    resultados = []
+    for nombre in casos or CASOS:
+        if nombre not in CASOS:
+            raise ValueError(f"Caso desconocido: {nombre}")
+        resultados.append(ejecutar_caso(nombre, cantidad_vlsm if nombre == "vlsm" else cantidad,
+                                        semilla))
+    return resultados
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description="Compara ip_utils, CalculadoraCIDR y CalculadoraVLSM contra ipaddress")
+    parser.add_argument("--casos", nargs="+", choices=sorted(CASOS), help="Casos a ejecutar")
+    parser.add_argument("--cantidad", type=int, default=CANTIDAD, help="Entradas por caso")
+    parser.add_argument("--cantidad-vlsm", type=int, default=CANTIDAD_VLSM,
+                        help="Conjuntos de requerimientos VLSM")
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'Caso':<18} {'Entradas':>9} {'Difer.':>7} {'Propio/s':>12} "
+          f"{'ipaddress/s':>12} {'Aceleración':>12}")
+    print("-" * 74)
+    total_diferencias = 0
+    for nombre in args.casos or CASOS:
+        resultado = ejecutar_caso(nombre, args.cantidad_vlsm if nombre == "vlsm" else args.cantidad,
+                                  args.semilla)
+        total_diferencias += resultado["diferencias"]
+        print(f"{resultado['caso']:<18} {resultado['entradas']:>9} {resultado['diferencias']:>7} "
+              f"{resultado['por_segundo']:>12.0f} {resultado['por_segundo_ipaddress']:>12.0f} "
+              f"{resultado['aceleracion']:>11.2f}x", flush=True)
+        for diferencia in resultado["ejemplos"]:
+            print(f"    {diferencia['entrada']!r} [{diferencia['campo']}]: "
+                  f"{diferencia['propio']!r} != {diferencia['referencia']!r}")
+
+    sys.exit(1 if total_diferencias else 0)
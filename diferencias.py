@@ -0,0 +1,199 @@
+from ip_utils import *
+from registro_subred import RegistroSubred
+
+TIPOS_CAMBIO = ("nuevas", "eliminadas", "movidas", "crecidas", "reducidas", "renombradas")
+
+
+def _asignaciones(plan) -> tuple:
+    """
+    Convierte un plan (CalculadoraVLSM, PlanMapeado o lista de registros o
+    dicts con nombre, red y prefijo) en (bits, asignaciones), con las
+    asignaciones como lista de (inicio, fin, prefijo, nombre,
+    hosts_requeridos) ordenada por inicio. Todas las redes del plan deben
+    ser de la misma versión de IP.
+    """
+    registros = plan.resultados if hasattr(plan, "resultados") else plan
+    if not isinstance(registros, list):
+        registros = list(registros)
+    if registros and isinstance(registros[0], RegistroSubred):
+        # Camino rápido: los registros ya tienen la red como entero
+        bits = registros[0].bits
+        if any(r.bits != bits for r in registros):
+            raise ValueError("Todas las redes de un plan deben ser de la misma versión de IP")
+        asignaciones = [(r.red_entero, r.red_entero + (1 << (bits - r.prefijo)) - 1, r.prefijo,
+                         r.nombre, r.hosts_requeridos) for r in registros]
+    else:
+        bits = None
+        asignaciones = []
+        for registro in registros:
+            red_entero, bits_red = analizar_direccion(registro["red"])
+            if bits is None:
+                bits = bits_red
+            elif bits_red != bits:
+                raise ValueError("Todas las redes de un plan deben ser de la misma versión de IP")
+            prefijo = registro["prefijo"]
+            asignaciones.append((red_entero, red_entero + (1 << (bits - prefijo)) - 1, prefijo,
+                                 registro["nombre"], registro["hosts_requeridos"]))
+    asignaciones.sort()
+    return bits, asignaciones
+
+
+def _solapamientos(a: list, b: list):
+    """
+    Recorre dos listas de rangos disjuntos ordenadas por inicio (tuplas que
+    empiezan con inicio y fin) y entrega cada par (i, j) de rangos que se
+    solapan. Es una mezcla lineal: avanza siempre el rango que termina
+    primero, O(len(a) + len(b) + pares).
+    """
+    i = j = 0
+    while i < len(a) and j < len(b):
+        inicio_a, fin_a = a[i][0], a[i][1]
+        inicio_b, fin_b = b[j][0], b[j][1]
+        if inicio_a <= fin_b and inicio_b <= fin_a:
+            yield i, j
+        if fin_a < fin_b:
+            i += 1
+        else:
+            j += 1
+
+
+def _texto(asignacion: tuple, bits: int) -> str:
+    return f"{entero_a_direccion(asignacion[0], bits)}/{asignacion[2]}"
+
+
+def comparar_planes(anterior, nuevo) -> dict:
+    """
+    Compara dos planes VLSM y regresa el conjunto de cambios: un dict con
+    una lista por tipo de cambio y el número de subredes sin cambios.
+
+    Las subredes se emparejan primero por nombre:
+      - "crecidas" / "reducidas": el bloque cambió de tamaño (con "movida"
+        True si además cambió de dirección).
+      - "movidas": mismo tamaño en otra dirección.
+    Las que no se emparejan por nombre se emparejan por rango de
+    direcciones con una mezcla lineal sobre los rangos ordenados:
+      - "renombradas": el mismo bloque con otro nombre.
+      - "nuevas" (con las subredes del plan anterior que ocupaban ese
+        espacio en "ocupaba") y "eliminadas": el resto.
+    """
+    bits_viejas, viejas = _asignaciones(anterior)
+    bits_nuevas, nuevas = _asignaciones(nuevo)
+    if bits_viejas and bits_nuevas and bits_viejas != bits_nuevas:
+        raise ValueError("Los dos planes deben ser de la misma versión de IP")
+    bits = bits_viejas or bits_nuevas or 32
+
+    # Con nombres repetidos se empareja la primera aparición
+    por_nombre = {}
+    for indice in range(len(viejas) - 1, -1, -1):
+        por_nombre[viejas[indice][3]] = indice
+
+    cambios = {tipo: [] for tipo in TIPOS_CAMBIO}
+    sin_cambios = 0
+    emparejadas = bytearray(len(viejas))
+    sin_pareja = []
+
+    # 1. Por nombre
+    for asignacion in nuevas:
+        indice = por_nombre.get(asignacion[3])
+        if indice is None or emparejadas[indice]:
+            sin_pareja.append(asignacion)
+            continue
+        emparejadas[indice] = 1
+        previa = viejas[indice]
+        nombre = asignacion[3]
+
+        if previa[0] == asignacion[0] and previa[2] == asignacion[2]:
+            sin_cambios += 1
+            continue
+
+        cambio = {
+            "nombre": nombre,
+            "anterior": _texto(previa, bits),
+            "nueva": _texto(asignacion, bits),
+            "hosts_anterior": previa[4],
+            "hosts_nuevo": asignacion[4],
+        }
+        if previa[2] == asignacion[2]:
+            cambios["movidas"].append(cambio)
+        else:
+            cambio["movida"] = previa[0] != asignacion[0]
+            cambios["crecidas" if asignacion[2] < previa[2] else "reducidas"].append(cambio)
+
+    restantes = [a for a, emparejada in zip(viejas, emparejadas) if not emparejada]
+
+    # 2. Por rango, entre las que no tienen pareja por nombre
+    renombradas_viejas = set()
+    renombradas_nuevas = set()
+    for i, j in _solapamientos(restantes, sin_pareja):
+        previa, asignacion = restantes[i], sin_pareja[j]
+        if previa[0] == asignacion[0] and previa[2] == asignacion[2]:
+            renombradas_viejas.add(i)
+            renombradas_nuevas.add(j)
+            cambios["renombradas"].append({
+                "nombre_anterior": previa[3],
+                "nombre": asignacion[3],
+                "red": _texto(asignacion, bits),
+                "hosts_anterior": previa[4],
+                "hosts_nuevo": asignacion[4],
+            })
+
+    agregadas = [a for j, a in enumerate(sin_pareja) if j not in renombradas_nuevas]
+    ocupaba = [[] for _ in agregadas]
+    for i, j in _solapamientos(viejas, agregadas):
+        ocupaba[j].append(viejas[i][3])
+    for asignacion, nombres in zip(agregadas, ocupaba):
+        cambios["nuevas"].append({
+            "nombre": asignacion[3],
+            "red": _texto(asignacion, bits),
+            "hosts": asignacion[4],
+            "ocupaba": nombres,
+        })
+
+    for i, previa in enumerate(restantes):
+        if i not in renombradas_viejas:
+            cambios["eliminadas"].append({
+                "nombre": previa[3],
+                "red": _texto(previa, bits),
+                "hosts": previa[4],
+            })
+
+    cambios["sin_cambios"] = sin_cambios
+    return cambios
+
+
+def resumen(cambios: dict) -> dict:
+    """
+    Número de subredes por tipo de cambio.
+    """
+    conteos = {tipo: len(cambios[tipo]) for tipo in TIPOS_CAMBIO}
+    conteos["sin_cambios"] = cambios["sin_cambios"]
+    return conteos
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+    import time
+
+    from almacen_plan import PlanMapeado
+
+    parser = argparse.ArgumentParser(description="Diferencias entre dos planes VLSM guardados")
+    parser.add_argument("anterior", help="Plan anterior (archivo de almacen_plan)")
+    parser.add_argument("nuevo", help="Plan nuevo (archivo de almacen_plan)")
+    parser.add_argument("--detalle", action="store_true",
+                        help="Escribe cada cambio como una línea JSON")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    with PlanMapeado(args.anterior) as anterior, PlanMapeado(args.nuevo) as nuevo:
+        cambios = comparar_planes(list(anterior), list(nuevo))
+    segundos = time.perf_counter() - inicio
+
+    if args.detalle:
+        for tipo in TIPOS_CAMBIO:
+            for cambio in cambios[tipo]:
+                print(json.dumps({"tipo": tipo, **cambio}, ensure_ascii=False))
+    for tipo, cantidad in resumen(cambios).items():
+        print(f"{tipo + ':':<14} {cantidad}", file=sys.stderr)
+    print(f"Tiempo: {segundos:.2f} s", file=sys.stderr)
@@ -0,0 +1,279 @@
+from collections.abc import Sequence
+
+from ip_utils import *
+from ip_utils import _OCTETOS_TEXTO
+from registro_subred import RegistroSubred, RegistroSubred6
+
+
+class SubredesDe(Sequence):
+    """
+    Secuencia perezosa de todas las subredes /prefijo de una red base.
+
+    No guarda ninguna subred: la subred i se calcula al pedirla como
+    red_base + i * tamaño de bloque, así que dividir un /8 en /30 (4 millones
+    de subredes) no ocupa memoria. Soporta len(), índices (también
+    negativos), rebanadas (que regresan otra SubredesDe), `in` e index() en
+    O(1), e indice_de() para ubicar la subred que contiene una dirección.
+
+    Cada elemento es un RegistroSubred llamado "<nombre><número>" con todos
+    sus hosts válidos como requeridos. Con una red base IPv6 los elementos
+    son RegistroSubred6 (por ejemplo, los 65,536 /64 de un /48).
+    """
+
+    def __init__(self, red_base: str, prefijo: int, nombre: str = "Subred"):
+        """
+        red_base: "IP/prefijo" de la red a dividir (IPv4 o IPv6); prefijo:
+        el de las subredes, entre el de la red base y 32 (128 en IPv6).
+        """
+        if '/' not in red_base:
+            raise ValueError("Formato incorrecto. Use: IP/prefijo (ej: 10.0.0.0/8)")
+
+        partes = red_base.split('/')
+        ip_entero, bits = analizar_direccion(partes[0].strip())
+
+        try:
+            prefijo_base = int(partes[1])
+        except ValueError:
+            prefijo_base = -1
+        if not 0 <= prefijo_base <= bits:
+            raise ValueError(f"Prefijo debe estar entre 0 y {bits}")
+        if not prefijo_base <= prefijo <= bits:
+            raise ValueError(f"El prefijo de las subredes debe estar entre {prefijo_base} y {bits}")
+
+        self.bits = bits
+        self.red_base = ip_entero & ~((1 << (bits - prefijo_base)) - 1)
+        self.prefijo_base = prefijo_base
+        self.prefijo = prefijo
+        self.nombre = nombre
+        self.tam_bloque = 2 ** (bits - prefijo)
+
+        # Índices (dentro de la red base) de las subredes de esta secuencia;
+        # una rebanada solo cambia este rango
+        self._indices = range(2 ** (prefijo - prefijo_base))
+
+    def _crear(self, indice_base: int) -> RegistroSubred:
+        tam_bloque = self.tam_bloque
+        if self.bits == 128:
+            return RegistroSubred6(f"{self.nombre}{indice_base + 1}", tam_bloque,
+                                   self.red_base + indice_base * tam_bloque, self.prefijo)
+        return RegistroSubred(f"{self.nombre}{indice_base + 1}",
+                              tam_bloque - 2 if self.prefijo < 31 else tam_bloque,
+                              self.red_base + indice_base * tam_bloque, self.prefijo)
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            rebanada = object.__new__(SubredesDe)
+            rebanada.__dict__.update(self.__dict__)
+            rebanada._indices = self._indices[indice]
+            return rebanada
+        return self._crear(self._indices[indice])
+
+    def __iter__(self):
+        for indice_base in self._indices:
+            yield self._crear(indice_base)
+
+    def __reversed__(self):
+        for indice_base in reversed(self._indices):
+            yield self._crear(indice_base)
+
+    def _indice_base(self, valor):
+        """
+        Índice dentro de la red base de una subred dada como registro,
+        "IP/prefijo" o (red_entero, prefijo); None si no es una subred
+        alineada /prefijo de la red base.
+        """
+        if isinstance(valor, str):
+            partes = valor.split('/')
+            if len(partes) != 2:
+                return None
+            try:
+                red_entero, bits = analizar_direccion(partes[0].strip())
+                prefijo = int(partes[1])
+            except ValueError:
+                return None
+            if bits != self.bits:
+                return None
+        elif isinstance(valor, tuple) and len(valor) == 2:
+            red_entero, prefijo = valor
+        elif hasattr(valor, "red_entero"):
+            red_entero, prefijo = valor.red_entero, valor.prefijo
+        else:
+            return None
+
+        desplazamiento = red_entero - self.red_base
+        if prefijo != self.prefijo or desplazamiento < 0 or desplazamiento % self.tam_bloque:
+            return None
+        return desplazamiento // self.tam_bloque
+
+    def __contains__(self, valor):
+        indice_base = self._indice_base(valor)
+        return indice_base is not None and indice_base in self._indices
+
+    def index(self, valor, inicio: int = 0, fin: int = None) -> int:
+        """
+        Posición de una subred en la secuencia, en O(1).
+        """
+        indice_base = self._indice_base(valor)
+        if indice_base is None or indice_base not in self._indices:
+            raise ValueError(f"{valor!r} no está en la secuencia")
+        posicion = self._indices.index(indice_base)
+        inicio, fin, _ = slice(inicio, fin).indices(len(self))
+        if not inicio <= posicion < fin:
+            raise ValueError(f"{valor!r} no está en la secuencia")
+        return posicion
+
+    def count(self, valor) -> int:
+        return 1 if valor in self else 0
+
+    def indice_de(self, ip) -> int:
+        """
+        Posición de la subred que contiene la IP (string o entero). Lanza
+        ValueError si ninguna subred de la secuencia la contiene.
+        """
+        if isinstance(ip, str):
+            ip, bits = analizar_direccion(ip)
+            if bits != self.bits:
+                raise ValueError("La dirección y la red base deben ser de la misma versión de IP")
+        desplazamiento = ip - self.red_base
+        indice_base = desplazamiento // self.tam_bloque
+        if desplazamiento < 0 or indice_base not in self._indices:
+            raise ValueError(f"La dirección {entero_a_direccion(ip, self.bits)} "
+                             f"no está en ninguna subred de la secuencia")
+        return self._indices.index(indice_base)
+
+    def subred_de(self, ip) -> RegistroSubred:
+        """
+        Subred de la secuencia que contiene la IP (string o entero).
+        """
+        return self[self.indice_de(ip)]
+
+    def __repr__(self):
+        return (f"SubredesDe('{entero_a_direccion(self.red_base, self.bits)}/{self.prefijo_base}', "
+                f"/{self.prefijo}, {len(self)} subredes)")
+
+
+class HostsDeRed(Sequence):
+    """
+    Secuencia perezosa de las direcciones de host de una red, con las mismas
+    reglas que CalculadoraCIDR: /32 tiene un host (la red), /31 dos (RFC
+    3021) y las demás excluyen red y broadcast.
+
+    Cada host se convierte a texto solo al pedirlo. Soporta len(), índices,
+    rebanadas con paso (hosts[::256] recorre un host de cada 256 sin tocar
+    los demás), `in`/index() en O(1), y exportación por bloques con
+    bloques() y exportar().
+    """
+
+    def __init__(self, red_entero: int, prefijo: int):
+        if not 0 <= prefijo <= 32:
+            raise ValueError("Prefijo debe estar entre 0 y 32")
+        tam_bloque = 2 ** (32 - prefijo)
+        red_entero &= ~(tam_bloque - 1) & 0xFFFFFFFF
+
+        self.red_entero = red_entero
+        self.prefijo = prefijo
+        if prefijo >= 31:
+            self._enteros = range(red_entero, red_entero + tam_bloque)
+        else:
+            self._enteros = range(red_entero + 1, red_entero + tam_bloque - 1)
+
+    @classmethod
+    def desde_resultado(cls, resultado) -> "HostsDeRed":
+        """
+        Hosts de un resultado de CalculadoraCIDR.calcular() o de un registro
+        de calcular_vlsm (cualquier objeto con claves "red" y "prefijo").
+        """
+        return cls(ip_a_entero(resultado["red"]), resultado["prefijo"])
+
+    @property
+    def enteros(self) -> range:
+        """
+        Los hosts como enteros (un range, también perezoso).
+        """
+        return self._enteros
+
+    def __len__(self):
+        return len(self._enteros)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            rebanada = object.__new__(HostsDeRed)
+            rebanada.red_entero = self.red_entero
+            rebanada.prefijo = self.prefijo
+            rebanada._enteros = self._enteros[indice]
+            return rebanada
+        return entero_a_ip(self._enteros[indice])
+
+    def __iter__(self):
+        for bloque in self.bloques():
+            yield from bloque
+
+    def __reversed__(self):
+        for entero in reversed(self._enteros):
+            yield entero_a_ip(entero)
+
+    def __contains__(self, ip):
+        if isinstance(ip, str):
+            if not validar_ip(ip):
+                return False
+            ip = ip_a_entero(ip)
+        return ip in self._enteros
+
+    def index(self, ip, inicio: int = 0, fin: int = None) -> int:
+        """
+        Posición de una IP (string o entero) en la secuencia, en O(1).
+        """
+        if ip not in self:
+            raise ValueError(f"{ip!r} no está en la secuencia")
+        posicion = self._enteros.index(ip_a_entero(ip) if isinstance(ip, str) else ip)
+        inicio, fin, _ = slice(inicio, fin).indices(len(self))
+        if not inicio <= posicion < fin:
+            raise ValueError(f"{ip!r} no está en la secuencia")
+        return posicion
+
+    def count(self, ip) -> int:
+        return 1 if ip in self else 0
+
+    def bloques(self, tamano: int = 65536):
+        """
+        Entrega los hosts como listas de a lo más `tamano` strings. Con paso 1
+        los hosts de un mismo /24 comparten los tres primeros octetos, así que
+        solo se formatea el último.
+        """
+        if tamano <= 0:
+            raise ValueError("El tamaño de bloque debe ser mayor a 0")
+
+        enteros = self._enteros
+        for inicio in range(0, len(enteros), tamano):
+            tramo = enteros[inicio:inicio + tamano]
+            if tramo.step != 1:
+                yield [entero_a_ip(entero) for entero in tramo]
+                continue
+
+            bloque = []
+            actual = tramo.start
+            while actual < tramo.stop:
+                fin = min(tramo.stop, (actual | 0xFF) + 1)
+                prefijo_texto = f"{actual >> 24}.{(actual >> 16) & 0xFF}.{(actual >> 8) & 0xFF}."
+                bloque.extend([prefijo_texto + octeto
+                               for octeto in _OCTETOS_TEXTO[actual & 0xFF:((fin - 1) & 0xFF) + 1]])
+                actual = fin
+            yield bloque
+
+    def exportar(self, salida, tamano: int = 65536) -> int:
+        """
+        Escribe un host por línea en `salida`, por bloques de `tamano`.
+        Regresa el número de hosts escritos.
+        """
+        total = 0
+        for bloque in self.bloques(tamano):
+            salida.write("\n".join(bloque))
+            salida.write("\n")
+            total += len(bloque)
+        return total
+
+    def __repr__(self):
+        return f"HostsDeRed('{entero_a_ip(self.red_entero)}/{self.prefijo}', {len(self)} hosts)"
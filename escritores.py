@@ -0,0 +1,66 @@
+import csv
+import json
+
+from registro_subred import RegistroSubred
+
+# Columnas de la tabla resumen de imprimir_resultados: (encabezado, clave, ancho)
+COLUMNAS_ANCHO_FIJO = (
+    ("Subred", "nombre", 15),
+    ("Red", "notacion_cidr", 18),
+    ("Hosts Req.", "hosts_requeridos", 12),
+    ("Hosts Disp.", "hosts_validos", 12),
+    ("Desperdicio", "desperdicio", 12),
+)
+
+
+def escribir_csv(registros, salida, campos: tuple = RegistroSubred.CAMPOS) -> int:
+    """
+    Escribe cada registro como una fila CSV en cuanto llega. Acepta cualquier
+    iterable (por ejemplo CalculadoraVLSM.iterar_vlsm()). Regresa el número
+    de filas escritas.
+    """
+    escritor = csv.writer(salida, lineterminator="\n")
+    escritor.writerow(campos)
+
+    filas = 0
+    for registro in registros:
+        escritor.writerow([registro[campo] for campo in campos])
+        filas += 1
+    return filas
+
+
+def escribir_jsonl(registros, salida, campos: tuple = RegistroSubred.CAMPOS) -> int:
+    """
+    Escribe cada registro como un objeto JSON por línea en cuanto llega.
+    Regresa el número de líneas escritas.
+    """
+    filas = 0
+    for registro in registros:
+        salida.write(json.dumps({campo: registro[campo] for campo in campos},
+                                ensure_ascii=False))
+        salida.write("\n")
+        filas += 1
+    return filas
+
+
+def escribir_ancho_fijo(registros, salida, columnas: tuple = COLUMNAS_ANCHO_FIJO) -> int:
+    """
+    Escribe los registros como la tabla de ancho fijo de imprimir_resultados,
+    una línea por subred en cuanto llega. Regresa el número de filas escritas.
+    """
+    ancho_total = 4 + sum(ancho + 1 for _, _, ancho in columnas)
+    salida.write(f"{'No.':<4} " + " ".join(f"{titulo:<{ancho}}" for titulo, _, ancho in columnas) + "\n")
+    salida.write("-" * ancho_total + "\n")
+
+    filas = 0
+    for filas, registro in enumerate(registros, 1):
+        salida.write(f"{filas:<4} " + " ".join(
+            f"{registro[clave]:<{ancho}}" for _, clave, ancho in columnas) + "\n")
+    return filas
+
+
+ESCRITORES = {
+    "csv": escribir_csv,
+    "jsonl": escribir_jsonl,
+    "ancho": escribir_ancho_fijo,
+}
@@ -0,0 +1,232 @@
+import time
+
+from ip_utils import *
+from asignador_bloques import AsignadorBuddy
+from vlsm_calculator import CalculadoraVLSM, crear_resultado
+
+
+def _asignador(calculadora: CalculadoraVLSM) -> AsignadorBuddy:
+    if not calculadora.red_base or calculadora.prefijo_base is None:
+        raise ValueError("Debe configurar la red base primero")
+    bits = calculadora.bits
+    asignador = AsignadorBuddy(calculadora._red_base_alineada(), calculadora.prefijo_base, bits)
+    for red_entero, prefijo in calculadora.reservas:
+        try:
+            asignador.reservar(red_entero, prefijo)
+        except ValueError as e:
+            raise ValueError(f"Reserva {entero_a_direccion(red_entero, bits)}/{prefijo} "
+                             f"inválida: {e}")
+    return asignador
+
+
+def _libres_por_prefijo(calculadora: CalculadoraVLSM) -> list:
+    """
+    Número de bloques libres por prefijo (índice 0 a bits) antes de asignar.
+    """
+    if not calculadora.reservas:
+        if not calculadora.red_base or calculadora.prefijo_base is None:
+            raise ValueError("Debe configurar la red base primero")
+        libres = [0] * (calculadora.bits + 1)
+        libres[calculadora.prefijo_base] = 1
+        return libres
+    return _asignador(calculadora).bloques_por_prefijo()
+
+
+def _primer_prefijo_sin_espacio(libres: list, demanda: list, prefijo_base: int):
+    """
+    Recorre los prefijos de mayor a menor bloque: los bloques libres de cada
+    nivel más los que sobraron del nivel anterior (cada uno se parte en dos)
+    deben alcanzar para la demanda del nivel. Con bloques potencia de 2
+    alineados esta condición es exacta. Regresa el primer prefijo que no
+    alcanza, o None si todo cabe.
+    """
+    sobrante = 0
+    for prefijo in range(prefijo_base, len(libres)):
+        disponibles = libres[prefijo] + 2 * sobrante
+        if demanda[prefijo] > disponibles:
+            return prefijo
+        sobrante = disponibles - demanda[prefijo]
+    return None
+
+
+def verificar_factibilidad(calculadora: CalculadoraVLSM) -> dict:
+    """
+    Decide si las subredes de la calculadora caben en la red base (con sus
+    reservas) usando solo los tamaños de bloque como enteros, sin asignar
+    ni formatear nada: O(n + bits).
+
+    Regresa un dict con "factible", "espacio_requerido", "espacio_libre" y
+    "prefijo_sin_espacio" (el primer tamaño de bloque que ya no cabe, o
+    None).
+    """
+    bits = calculadora.bits
+    libres = _libres_por_prefijo(calculadora)
+    demanda = [0] * (bits + 1)
+    espacio_requerido = 0
+    sin_espacio = None
+    for subred in calculadora.subredes:
+        bits_host = bits_host_para(subred["hosts_requeridos"], bits)
+        espacio_requerido += 1 << bits_host
+        prefijo = bits - bits_host
+        if prefijo < calculadora.prefijo_base:
+            # Más grande que toda la red base
+            if sin_espacio is None or prefijo < sin_espacio:
+                sin_espacio = prefijo
+        else:
+            demanda[prefijo] += 1
+
+    if sin_espacio is None:
+        sin_espacio = _primer_prefijo_sin_espacio(libres, demanda, calculadora.prefijo_base)
+
+    return {
+        "factible": sin_espacio is None,
+        "espacio_requerido": espacio_requerido,
+        "espacio_libre": sum(cantidad << (bits - prefijo) for prefijo, cantidad in enumerate(libres)),
+        "prefijo_sin_espacio": sin_espacio,
+    }
+
+
+def es_factible(calculadora: CalculadoraVLSM) -> bool:
+    """
+    Indica si calcular_vlsm podrá asignar todas las subredes.
+    """
+    return verificar_factibilidad(calculadora)["factible"]
+
+
+def _orden_mayor_primero(subredes: list) -> list:
+    # Mismo orden que calcular_vlsm (estable, de mayor a menor)
+    return sorted(subredes, key=lambda s: s["hosts_requeridos"], reverse=True)
+
+
+def _alineado(calculadora: CalculadoraVLSM, asignador: AsignadorBuddy) -> tuple:
+    """
+    De mayor a menor, cada subred en el bloque libre más pequeño que la
+    aloje. Con bloques potencia de 2 en orden descendente cada bloque cae
+    alineado justo después del anterior, sin huecos: es el acomodo de
+    calcular_vlsm y asigna todo siempre que sea factible.
+    """
+    return _asignar_en_orden(_orden_mayor_primero(calculadora.subredes), asignador)
+
+
+def _mejor_ajuste(calculadora: CalculadoraVLSM, asignador: AsignadorBuddy) -> tuple:
+    """
+    En el orden en que se agregaron las subredes, cada una en el bloque
+    libre más pequeño que la aloje (el de menor dirección en empate). Las
+    primeras subredes conservan su lugar aunque se agreguen más, y los
+    huecos que dejan las reservas se llenan antes de partir bloques
+    grandes; puede dejar fuera subredes que el acomodo alineado sí asigna.
+    """
+    return _asignar_en_orden(calculadora.subredes, asignador)
+
+
+def _maximizar(calculadora: CalculadoraVLSM, asignador: AsignadorBuddy) -> tuple:
+    """
+    Para redes sobresuscritas: el mayor número posible de subredes. Si k
+    subredes caben, las k más pequeñas también, así que se busca (por
+    bisección con la prueba de factibilidad) la k más grande para la que
+    caben las k más pequeñas, y se asignan con el acomodo alineado.
+    """
+    bits = asignador.bits
+    libres = asignador.bloques_por_prefijo()
+    menores = sorted(calculadora.subredes, key=lambda s: s["hosts_requeridos"])
+    prefijos = [bits - bits_host_para(s["hosts_requeridos"], bits) for s in menores]
+
+    def caben(cantidad: int) -> bool:
+        demanda = [0] * (bits + 1)
+        for prefijo in prefijos[:cantidad]:
+            if prefijo < asignador.prefijo_base:
+                return False
+            demanda[prefijo] += 1
+        return _primer_prefijo_sin_espacio(libres, demanda, asignador.prefijo_base) is None
+
+    bajo, alto = 0, len(menores)
+    while bajo < alto:
+        medio = (bajo + alto + 1) // 2
+        if caben(medio):
+            bajo = medio
+        else:
+            alto = medio - 1
+
+    elegidas = set(map(id, menores[:bajo]))
+    asignadas, sin_asignar = _asignar_en_orden(
+        _orden_mayor_primero([s for s in calculadora.subredes if id(s) in elegidas]), asignador)
+    sin_asignar.extend(s for s in calculadora.subredes if id(s) not in elegidas)
+    return asignadas, sin_asignar
+
+
+def _asignar_en_orden(subredes: list, asignador: AsignadorBuddy) -> tuple:
+    bits = asignador.bits
+    asignadas = []
+    sin_asignar = []
+    for subred in subredes:
+        prefijo = bits - bits_host_para(subred["hosts_requeridos"], bits)
+        red_entero = asignador.asignar(prefijo)
+        if red_entero is None:
+            sin_asignar.append(subred)
+        else:
+            asignadas.append(crear_resultado(subred, red_entero, prefijo, bits))
+    return asignadas, sin_asignar
+
+
+ESTRATEGIAS = {
+    "alineado": _alineado,
+    "mejor_ajuste": _mejor_ajuste,
+    "maximizar": _maximizar,
+}
+
+
+def asignar(calculadora: CalculadoraVLSM, estrategia: str = "alineado") -> dict:
+    """
+    Asigna las subredes de la calculadora (red base, reservas y subredes ya
+    configuradas) con la estrategia indicada; ver ESTRATEGIAS. No modifica
+    la calculadora ni lanza por falta de espacio: las subredes que no caben
+    se regresan en "sin_asignar".
+
+    Regresa un dict con la estrategia, "asignadas" (RegistroSubred),
+    "sin_asignar" (los requerimientos), "hosts_sin_usar" (direcciones de
+    los bloques asignados que no son hosts requeridos), "espacio_restante",
+    "fragmentacion" (métricas del espacio libre que queda), "mapa_libre"
+    (el AsignadorBuddy resultante) y "segundos".
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia desconocida: {estrategia}. "
+                         f"Use una de: {', '.join(ESTRATEGIAS)}")
+
+    inicio = time.perf_counter()
+    asignador = _asignador(calculadora)
+    asignadas, sin_asignar = ESTRATEGIAS[estrategia](calculadora, asignador)
+    segundos = time.perf_counter() - inicio
+
+    return {
+        "estrategia": estrategia,
+        "asignadas": asignadas,
+        "sin_asignar": sin_asignar,
+        "hosts_sin_usar": sum(r.tam_bloque - r.hosts_requeridos for r in asignadas),
+        "espacio_restante": asignador.espacio_libre,
+        "fragmentacion": asignador.fragmentacion(),
+        "mapa_libre": asignador,
+        "segundos": segundos,
+    }
+
+
+def comparar_estrategias(calculadora: CalculadoraVLSM) -> list:
+    """
+    Ejecuta todas las estrategias sobre la misma calculadora y regresa un
+    resumen por estrategia: subredes asignadas y sin asignar, direcciones
+    sin usar, espacio restante, bloque libre más grande, fragmentación y
+    tiempo.
+    """
+    resumen = []
+    for estrategia in ESTRATEGIAS:
+        resultado = asignar(calculadora, estrategia)
+        resumen.append({
+            "estrategia": estrategia,
+            "asignadas": len(resultado["asignadas"]),
+            "sin_asignar": len(resultado["sin_asignar"]),
+            "hosts_sin_usar": resultado["hosts_sin_usar"],
+            "espacio_restante": resultado["espacio_restante"],
+            "bloque_libre_mas_grande": resultado["fragmentacion"]["bloque_mas_grande"],
+            "fragmentacion": resultado["fragmentacion"]["fragmentacion"],
+            "segundos": resultado["segundos"],
+        })
+    return resumen
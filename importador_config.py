@@ -0,0 +1,262 @@
+import os
+import re
+from functools import lru_cache
+
+from ip_utils import *
+
+_IPV4 = rb"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+# Grupos hexadecimales separados por ":" (con "::" y una IPv4 final
+# opcionales); ipv6_a_entero valida el resto
+_IPV6 = rb"(?:[0-9A-Fa-f]{0,4}:){2,7}(?:[0-9A-Fa-f]{1,4}|" + _IPV4 + rb")?"
+
+# "ip address 10.0.0.1 255.255.255.0", "ipv4 address 10.0.0.1/24",
+# "address 10.0.0.1/24;" (Junos), "ipv6 address 2001:db8::1/64"... con o
+# sin "secondary" al final. La palabra "address" debe estar completa y todo
+# en la misma línea. Grupos: IPv4, prefijo, máscara, IPv6, prefijo IPv6
+_PATRON_INTERFAZ = re.compile(
+    rb"\baddress[ \t]+(?:(" + _IPV4 + rb")(?:/(\d{1,2})|[ \t]+(" + _IPV4 + rb"))(?![\d.])"
+    rb"|(" + _IPV6 + rb")/(\d{1,3})(?!\d))"
+)
+# Cualquier "A.B.C.D/NN" o "IPv6/NN" de la línea. Grupos: IPv4, prefijo,
+# IPv6, prefijo IPv6
+_PATRON_CIDR = re.compile(
+    rb"(?<![\d.])(" + _IPV4 + rb")/(\d{1,2})(?![\d.])"
+    rb"|(?<![0-9A-Fa-f:.])(" + _IPV6 + rb")/(\d{1,3})(?!\d)"
+)
+
+TAM_BLOQUE_LECTURA = 1 << 20
+
+
+@lru_cache(maxsize=None)
+def _prefijo_de_mascara(mascara: bytes) -> int:
+    """
+    mascara_a_prefijo sobre la máscara en bytes. Las configuraciones repiten
+    unas pocas máscaras, así que cada una se convierte una sola vez.
+    """
+    return mascara_a_prefijo(mascara.decode("ascii"))
+
+
+class ImportadorConfig:
+    """
+    Extrae las redes de interfaz (IPv4 e IPv6) de configuraciones de
+    routers y switches para planear alrededor de lo que ya está desplegado.
+
+    Los archivos se leen en bloques de 1 MiB y la expresión regular
+    (precompilada, sobre bytes) recorre el bloque completo de una vez en
+    lugar de línea por línea. Las máscaras se normalizan a prefijo con
+    mascara_a_prefijo, cada dirección se lleva a su red y las redes
+    repetidas (los dos extremos de un enlace, la misma VLAN en varios
+    switches) se descartan. Las redes IPv4 quedan en `redes` y las IPv6
+    (enteros de 128 bits) en `redes6`.
+
+        importador = ImportadorConfig()
+        for red_entero, prefijo, bits in importador.importar(["configs/"]):
+            ...
+        importador.reservar_en(calculadora)
+    """
+
+    def __init__(self, cualquier_linea: bool = False):
+        """
+        cualquier_linea: además de las líneas "address", acepta cualquier
+        "A.B.C.D/NN" o "IPv6/NN" (rutas estáticas, listas de prefijos...).
+        """
+        self._patron = _PATRON_CIDR if cualquier_linea else _PATRON_INTERFAZ
+        self.redes = set()
+        self.redes6 = set()
+        self.archivos = 0
+        self.bytes = 0
+        self.coincidencias = 0
+        self.invalidas = 0
+
+    def _extraer(self, texto: bytes):
+        """
+        Entrega las redes nuevas encontradas en un bloque de texto.
+        """
+        redes = self.redes
+        redes6 = self.redes6
+        for encontrada in self._patron.finditer(texto):
+            self.coincidencias += 1
+            grupos = encontrada.groups()
+            ip, prefijo = grupos[0], grupos[1]
+            try:
+                if ip is None:
+                    ip_entero = ipv6_a_entero(grupos[-2].decode("ascii"))
+                    prefijo = int(grupos[-1])
+                    if prefijo > 128:
+                        raise ValueError("Prefijo debe estar entre 0 y 128")
+                    red = ip_entero & ~((1 << (128 - prefijo)) - 1)
+                    if (red, prefijo) not in redes6:
+                        redes6.add((red, prefijo))
+                        yield red, prefijo, 128
+                    continue
+                ip_entero = ip_a_entero(ip.decode("ascii"))
+                if prefijo is not None:
+                    prefijo = int(prefijo)
+                    if prefijo > 32:
+                        raise ValueError("Prefijo debe estar entre 0 y 32")
+                else:
+                    prefijo = _prefijo_de_mascara(grupos[2])
+            except ValueError:
+                self.invalidas += 1
+                continue
+
+            red = (ip_entero & (0xFFFFFFFF << (32 - prefijo)) & 0xFFFFFFFF, prefijo)
+            if red not in redes:
+                redes.add(red)
+                yield red[0], prefijo, 32
+
+    def procesar(self, flujo):
+        """
+        Procesa un flujo binario (archivo abierto en "rb", sys.stdin.buffer...)
+        y entrega cada red nueva como (red_entero, prefijo, bits). Los
+        bloques se cortan en el último salto de línea para no partir una
+        dirección.
+        """
+        resto = b""
+        while True:
+            bloque = flujo.read(TAM_BLOQUE_LECTURA)
+            if not bloque:
+                break
+            self.bytes += len(bloque)
+            bloque = resto + bloque
+            corte = bloque.rfind(b"\n") + 1
+            resto = bloque[corte:]
+            yield from self._extraer(bloque[:corte])
+        if resto:
+            yield from self._extraer(resto)
+
+    def procesar_archivo(self, ruta: str):
+        """
+        Procesa un archivo de configuración.
+        """
+        with open(ruta, "rb") as archivo:
+            self.archivos += 1
+            yield from self.procesar(archivo)
+
+    def importar(self, rutas):
+        """
+        Procesa archivos y directorios (recorridos recursivamente, en orden
+        alfabético) y entrega cada red nueva como (red_entero, prefijo, bits).
+        """
+        if isinstance(rutas, str):
+            rutas = [rutas]
+        for ruta in rutas:
+            if not os.path.isdir(ruta):
+                yield from self.procesar_archivo(ruta)
+                continue
+            for directorio, subdirectorios, archivos in os.walk(ruta):
+                subdirectorios.sort()
+                for nombre in sorted(archivos):
+                    yield from self.procesar_archivo(os.path.join(directorio, nombre))
+
+    def redes_ordenadas(self, bits: int = 32) -> list:
+        """
+        Las redes únicas IPv4 (bits=32) o IPv6 (bits=128) encontradas como
+        (red_entero, prefijo), ordenadas por dirección (y a igual
+        dirección, la más grande primero).
+        """
+        return sorted(self.redes6 if bits == 128 else self.redes)
+
+    def reservas_para(self, red_base: int, prefijo_base: int, bits: int = 32) -> list:
+        """
+        Las redes encontradas de la versión de `bits` que caen dentro de la
+        red base, listas para reservar: sin las que quedan dentro de otra ya
+        reservada (el asignador no acepta reservas solapadas). Si alguna red
+        contiene a toda la red base, la reserva es la red base completa.
+        """
+        fin_base = red_base + (1 << (bits - prefijo_base)) - 1
+        reservas = []
+        fin_anterior = -1
+        for red, prefijo in self.redes_ordenadas(bits):
+            fin = red + (1 << (bits - prefijo)) - 1
+            if red <= red_base and fin >= fin_base:
+                return [(red_base, prefijo_base)]
+            if red < red_base or fin > fin_base or fin <= fin_anterior:
+                continue
+            reservas.append((red, prefijo))
+            fin_anterior = fin
+        return reservas
+
+    def reservar_en(self, calculadora) -> int:
+        """
+        Reserva en una CalculadoraVLSM (con la red base configurada, IPv4 o
+        IPv6) las redes encontradas de la misma versión dentro de su red
+        base. Regresa el número de reservas agregadas.
+        """
+        if not calculadora.red_base or calculadora.prefijo_base is None:
+            raise ValueError("Debe configurar la red base primero")
+        reservas = self.reservas_para(calculadora._red_base_alineada(), calculadora.prefijo_base,
+                                      calculadora.bits)
+        existentes = set(calculadora.reservas)
+        nuevas = [reserva for reserva in reservas if reserva not in existentes]
+        calculadora.reservas.extend(nuevas)
+        return len(nuevas)
+
+    def estadisticas(self) -> dict:
+        return {
+            "archivos": self.archivos,
+            "bytes": self.bytes,
+            "coincidencias": self.coincidencias,
+            "invalidas": self.invalidas,
+            "redes": len(self.redes),
+            "redes6": len(self.redes6),
+        }
+
+
+def importar_redes(rutas, cualquier_linea: bool = False, bits: int = 32) -> list:
+    """
+    Redes únicas (red_entero, prefijo) IPv4 (bits=32) o IPv6 (bits=128) de
+    los archivos o directorios dados, ordenadas por dirección.
+    """
+    importador = ImportadorConfig(cualquier_linea)
+    for _ in importador.importar(rutas):
+        pass
+    return importador.redes_ordenadas(bits)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Extrae las redes de interfaz de configuraciones de equipos")
+    parser.add_argument("rutas", nargs="+", help="Archivos o directorios ('-' para stdin)")
+    parser.add_argument("--red", help="Red base (IP/prefijo): escribe solo las reservas dentro de ella")
+    parser.add_argument("--cualquier-linea", action="store_true",
+                        help="Acepta cualquier A.B.C.D/NN o IPv6/NN, no solo las líneas 'address'")
+    args = parser.parse_args()
+
+    importador = ImportadorConfig(args.cualquier_linea)
+    inicio = time.perf_counter()
+    try:
+        for ruta in args.rutas:
+            redes = (importador.procesar(sys.stdin.buffer) if ruta == "-"
+                     else importador.importar(ruta))
+            for _ in redes:
+                pass
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    segundos = time.perf_counter() - inicio
+
+    if args.red:
+        from vlsm_calculator import CalculadoraVLSM
+
+        calculadora = CalculadoraVLSM()
+        try:
+            calculadora.configurar_red_base(args.red)
+            importador.reservar_en(calculadora)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        redes = [(red, prefijo, calculadora.bits) for red, prefijo in calculadora.reservas]
+    else:
+        redes = ([red + (32,) for red in importador.redes_ordenadas()]
+                 + [red + (128,) for red in importador.redes_ordenadas(128)])
+
+    sys.stdout.write("".join(f"{entero_a_direccion(red, bits)}/{prefijo}\n"
+                             for red, prefijo, bits in redes))
+    for clave, valor in importador.estadisticas().items():
+        print(f"{clave + ':':<15} {valor}", file=sys.stderr)
+    print(f"Tiempo: {segundos:.2f} s", file=sys.stderr)
@@ -0,0 +1,135 @@
+from bisect import bisect_right
+
+from ip_utils import *
+from ip_utils import _importar_numpy
+
+
+class IndicePrefijos:
+    """
+    Índice de coincidencia de prefijo más largo sobre un plan calculado.
+
+    Las redes (que pueden anidarse) se aplanan en segmentos disjuntos
+    ordenados, cada uno con su red más específica. Una búsqueda es una
+    bisección sobre los inicios de segmento: O(log n) para una dirección y
+    un solo searchsorted de NumPy para un lote completo. Un índice es de
+    redes IPv4 o de redes IPv6 (las búsquedas por lote solo en IPv4).
+    """
+
+    def __init__(self, registros):
+        """
+        Construye el índice a partir de registros con nombre, red y prefijo
+        (los resultados de calcular_vlsm o dicts equivalentes).
+        """
+        self.registros = list(registros)
+        self.bits = None
+
+        intervalos = []
+        for indice, registro in enumerate(self.registros):
+            red_entero = getattr(registro, "red_entero", None)
+            if red_entero is None:
+                red_entero, bits = analizar_direccion(registro["red"])
+            else:
+                bits = registro.bits
+            if self.bits is None:
+                self.bits = bits
+            elif bits != self.bits:
+                raise ValueError("Todas las redes del índice deben ser de la misma versión de IP")
+            prefijo = registro["prefijo"]
+            tamano = 1 << (self.bits - prefijo)
+            red_entero &= ~(tamano - 1)
+            intervalos.append((red_entero, prefijo, red_entero + tamano - 1, indice))
+
+        # Orden por inicio y, a igual inicio, primero el bloque más grande
+        intervalos.sort()
+
+        self.bits = self.bits or 32
+
+        # El primer segmento cubre desde la dirección 0 sin dueño, así toda
+        # dirección cae en algún segmento
+        self._inicios = [0]
+        self._duenos = [-1]
+        self._arreglos = None
+
+        abiertos = []  # pila de (fin, indice) de redes que contienen la actual
+        for inicio, _, fin, indice in intervalos:
+            while abiertos and abiertos[-1][0] < inicio:
+                fin_cerrado = abiertos.pop()[0]
+                self._agregar_segmento(fin_cerrado + 1, abiertos[-1][1] if abiertos else -1)
+            abiertos.append((fin, indice))
+            self._agregar_segmento(inicio, indice)
+
+        while abiertos:
+            fin_cerrado = abiertos.pop()[0]
+            self._agregar_segmento(fin_cerrado + 1, abiertos[-1][1] if abiertos else -1)
+
+    @classmethod
+    def desde_calculadora(cls, calculadora) -> "IndicePrefijos":
+        """
+        Construye el índice con los resultados de una CalculadoraVLSM.
+        """
+        if not calculadora.resultados:
+            raise ValueError("No hay resultados. Ejecute calcular_vlsm() primero.")
+        return cls(calculadora.resultados)
+
+    def _agregar_segmento(self, inicio: int, dueno: int):
+        if self._inicios[-1] == inicio:
+            # Segmento vacío: lo reemplaza el que empieza en el mismo punto
+            self._inicios.pop()
+            self._duenos.pop()
+        if self._duenos and self._duenos[-1] == dueno:
+            return
+        self._inicios.append(inicio)
+        self._duenos.append(dueno)
+
+    def __len__(self):
+        return len(self.registros)
+
+    def buscar_indice(self, ip) -> int:
+        """
+        Regresa el índice (en self.registros) de la red más específica que
+        contiene la IP (string o entero), o -1 si ninguna la contiene (o el
+        entero está fuera del espacio de direcciones del índice).
+        """
+        if isinstance(ip, str):
+            ip, bits = analizar_direccion(ip)
+            if bits != self.bits:
+                return -1
+        elif not 0 <= ip < 1 << self.bits:
+            return -1
+        return self._duenos[bisect_right(self._inicios, ip) - 1]
+
+    def buscar(self, ip):
+        """
+        Regresa el registro de la red más específica que contiene la IP, o
+        None si ninguna la contiene.
+        """
+        indice = self.buscar_indice(ip)
+        return self.registros[indice] if indice >= 0 else None
+
+    def buscar_lote(self, ips):
+        """
+        Busca un lote de IPs (lista de strings, buffer de bytes o arreglo de
+        enteros) y regresa un arreglo NumPy con el índice del registro de
+        cada una (-1 si ninguna red la contiene o la IP es inválida).
+        """
+        np = _importar_numpy()
+
+        if self.bits != 32:
+            raise ValueError("La búsqueda por lotes solo admite índices de redes IPv4")
+        if self._arreglos is None:
+            self._arreglos = (np.array(self._inicios, dtype=np.int64),
+                              np.array(self._duenos, dtype=np.int64))
+        inicios, duenos = self._arreglos
+
+        enteros, validos = ips_a_enteros(ips)
+        indices = duenos[np.searchsorted(inicios, enteros, side="right") - 1]
+        indices[~validos] = -1
+        return indices
+
+    def nombres_lote(self, ips) -> list:
+        """
+        Igual que buscar_lote, pero regresa el nombre de la subred de cada IP
+        (None si no pertenece a ninguna).
+        """
+        nombres = [registro["nombre"] for registro in self.registros] + [None]
+        return [nombres[i] for i in self.buscar_lote(ips).tolist()]
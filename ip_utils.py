@@ -1,96 +1,450 @@
-import re
-import math
-
-def ip_a_entero(ip: str) -> int:
-    """
-    Convierte una dirección IP en formato string a entero de 32 bits.
-    """
-    octetos = ip.split('.')
-    if len(octetos) != 4:
-        raise ValueError("La IP debe tener 4 octetos")
-    
-    resultado = 0
-    for i, octeto in enumerate(octetos):
-        valor = int(octeto)
-        if valor < 0 or valor > 255:
-            raise ValueError(f"Octeto {i+1} fuera de rango (0-255)")
-        resultado = (resultado << 8) | valor
-    
-    return resultado
-
-def entero_a_ip(entero: int) -> str:
-    """
-    Convierte un entero de 32 bits a dirección IP en formato string.
-    """
-    if entero < 0 or entero > 0xFFFFFFFF:
-        raise ValueError("Entero fuera de rango para dirección IP")
-    
-    octetos = []
-    for i in range(3, -1, -1):
-        octeto = (entero >> (8 * i)) & 0xFF
-        octetos.append(str(octeto))
-    
-    return ".".join(octetos)
-
-def mascara_a_prefijo(mascara: str) -> int:
-    """
-    Convierte máscara en formato decimal punteado a prefijo CIDR.
-    """
-    entero = ip_a_entero(mascara)
-    
-    # Verificar que sea una máscara válida
-    binario = bin(entero)[2:].zfill(32)
-    
-    # Buscar transición de 1 a 0
-    encontrado_cero = False
-    for bit in binario:
-        if bit == '0':
-            encontrado_cero = True
-        elif encontrado_cero and bit == '1':
-            raise ValueError("Máscara inválida: los 1s deben ser contiguos")
-    
-    return binario.count('1')
-
-def prefijo_a_mascara(prefijo: int) -> str:
-    """
-    Convierte prefijo CIDR a máscara en formato decimal punteado.
-    """
-    if prefijo < 0 or prefijo > 32:
-        raise ValueError("Prefijo debe estar entre 0 y 32")
-    
-    mascara_entero = (0xFFFFFFFF << (32 - prefijo)) & 0xFFFFFFFF
-    return entero_a_ip(mascara_entero)
-
-def validar_ip(ip: str) -> bool:
-    """
-    Valida que una dirección IP sea correcta.
-    """
-    patron = r'^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$'
-    match = re.match(patron, ip)
-    
-    if not match:
-        return False
-    
-    for grupo in match.groups():
-        if int(grupo) > 255:
-            return False
-    
-    return True
-
-def validar_prefijo(prefijo: str) -> bool:
-    """
-    Valida que un prefijo CIDR sea correcto.
-    """
-    try:
-        p = int(prefijo)
-        return 0 <= p <= 32
-    except ValueError:
-        return False
-
-def obtener_binario_ip(ip: str) -> str:
-    """
-    Obtiene la representación binaria de una IP.
-    """
-    octetos = ip.split('.')
-    binarios = [bin(int(o))[2:].zfill(8) for o in octetos]
-    return ".".join(binarios)
\ No newline at end of file
+import re
+import math
+
+
+def _importar_numpy():
+    """
+    Importa NumPy solo cuando se usan las funciones por lotes.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Las operaciones por lotes requieren NumPy (pip install numpy)")
+    return numpy
+
+def ip_a_entero(ip: str) -> int:
+    """
+    Convierte una dirección IP en formato string a entero de 32 bits.
+    """
+    octetos = ip.split('.')
+    if len(octetos) != 4:
+        raise ValueError("La IP debe tener 4 octetos")
+    
+    resultado = 0
+    for i, octeto in enumerate(octetos):
+        valor = int(octeto)
+        if valor < 0 or valor > 255:
+            raise ValueError(f"Octeto {i+1} fuera de rango (0-255)")
+        resultado = (resultado << 8) | valor
+    
+    return resultado
+
+def entero_a_ip(entero: int) -> str:
+    """
+    Convierte un entero de 32 bits a dirección IP en formato string.
+    """
+    if entero < 0 or entero > 0xFFFFFFFF:
+        raise ValueError("Entero fuera de rango para dirección IP")
+    
+    # Formateo directo de los cuatro octetos (sin lista intermedia)
+    return f"{entero >> 24}.{(entero >> 16) & 0xFF}.{(entero >> 8) & 0xFF}.{entero & 0xFF}"
+
+def mascara_a_prefijo(mascara: str) -> int:
+    """
+    Convierte máscara en formato decimal punteado a prefijo CIDR.
+    """
+    entero = ip_a_entero(mascara)
+    
+    # Verificar que sea una máscara válida
+    binario = bin(entero)[2:].zfill(32)
+    
+    # Buscar transición de 1 a 0
+    encontrado_cero = False
+    for bit in binario:
+        if bit == '0':
+            encontrado_cero = True
+        elif encontrado_cero and bit == '1':
+            raise ValueError("Máscara inválida: los 1s deben ser contiguos")
+    
+    return binario.count('1')
+
+def prefijo_a_mascara(prefijo: int) -> str:
+    """
+    Convierte prefijo CIDR a máscara en formato decimal punteado.
+    """
+    if prefijo < 0 or prefijo > 32:
+        raise ValueError("Prefijo debe estar entre 0 y 32")
+    
+    mascara_entero = (0xFFFFFFFF << (32 - prefijo)) & 0xFFFFFFFF
+    return entero_a_ip(mascara_entero)
+
+def prefijo_para_hosts(hosts_requeridos: int) -> int:
+    """
+    Calcula el prefijo mínimo que aloja los hosts requeridos más la
+    dirección de red y la de broadcast.
+    """
+    if hosts_requeridos <= 0:
+        raise ValueError("El número de hosts debe ser mayor a 0")
+    
+    return 32 - math.ceil(math.log2(hosts_requeridos + 2))
+
+_PATRON_IP = re.compile(r'^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$')
+
+def validar_ip(ip: str) -> bool:
+    """
+    Valida que una dirección IP sea correcta.
+    """
+    match = _PATRON_IP.match(ip)
+    
+    if not match:
+        return False
+    
+    for grupo in match.groups():
+        if int(grupo) > 255:
+            return False
+    
+    return True
+
+def validar_prefijo(prefijo: str) -> bool:
+    """
+    Valida que un prefijo CIDR sea correcto.
+    """
+    try:
+        p = int(prefijo)
+        return 0 <= p <= 32
+    except ValueError:
+        return False
+
+def obtener_binario_ip(ip: str) -> str:
+    """
+    Obtiene la representación binaria de una IP.
+    """
+    octetos = ip.split('.')
+    binarios = [bin(int(o))[2:].zfill(8) for o in octetos]
+    return ".".join(binarios)
+
+# ---------------------------------------------------------------------------
+# IPv6 (enteros de 128 bits)
+# ---------------------------------------------------------------------------
+
+_PATRON_GRUPO_V6 = re.compile(r'[0-9A-Fa-f]{1,4}')
+_MASCARA_128 = (1 << 128) - 1
+
+def _grupos_ipv6(texto: str, final: bool) -> list:
+    """
+    Valores de los grupos de una parte de una IPv6 (a un lado del "::").
+    Si la parte es el final de la dirección puede terminar en IPv4.
+    """
+    if not texto:
+        return []
+    grupos = texto.split(':')
+    valores = []
+    for i, grupo in enumerate(grupos):
+        if final and i == len(grupos) - 1 and '.' in grupo:
+            if not validar_ip(grupo):
+                raise ValueError("Dirección IPv6 inválida: IPv4 final incorrecta")
+            ipv4 = ip_a_entero(grupo)
+            valores.extend((ipv4 >> 16, ipv4 & 0xFFFF))
+        elif _PATRON_GRUPO_V6.fullmatch(grupo):
+            valores.append(int(grupo, 16))
+        else:
+            raise ValueError(f"Dirección IPv6 inválida: grupo '{grupo}' incorrecto")
+    return valores
+
+def ipv6_a_entero(ip: str) -> int:
+    """
+    Convierte una dirección IPv6 (con "::" y con los últimos 32 bits en
+    notación IPv4 opcionales) a entero de 128 bits.
+    """
+    if ip.count('::') > 1:
+        raise ValueError("Dirección IPv6 inválida: solo puede tener un '::'")
+
+    if '::' in ip:
+        izquierda, derecha = ip.split('::')
+        grupos_izquierda = _grupos_ipv6(izquierda, False)
+        grupos_derecha = _grupos_ipv6(derecha, True)
+        faltantes = 8 - len(grupos_izquierda) - len(grupos_derecha)
+        if faltantes < 1:
+            raise ValueError("Dirección IPv6 inválida: demasiados grupos")
+        grupos = grupos_izquierda + [0] * faltantes + grupos_derecha
+    else:
+        grupos = _grupos_ipv6(ip, True)
+        if len(grupos) != 8:
+            raise ValueError("Dirección IPv6 inválida: debe tener 8 grupos")
+
+    resultado = 0
+    for grupo in grupos:
+        resultado = (resultado << 16) | grupo
+    return resultado
+
+def entero_a_ipv6(entero: int) -> str:
+    """
+    Convierte un entero de 128 bits a IPv6 en formato comprimido (RFC 5952):
+    minúsculas, sin ceros a la izquierda y con "::" en la racha de grupos
+    en cero más larga (de al menos dos grupos).
+    """
+    if entero < 0 or entero > _MASCARA_128:
+        raise ValueError("Entero fuera de rango para dirección IPv6")
+
+    grupos = [(entero >> desplazamiento) & 0xFFFF for desplazamiento in range(112, -1, -16)]
+    mejor_inicio, mejor_largo = 0, 0
+    inicio = None
+    for i, grupo in enumerate(grupos + [1]):
+        if grupo == 0:
+            if inicio is None:
+                inicio = i
+        elif inicio is not None:
+            if i - inicio > mejor_largo:
+                mejor_inicio, mejor_largo = inicio, i - inicio
+            inicio = None
+
+    textos = [format(grupo, 'x') for grupo in grupos]
+    if mejor_largo < 2:
+        return ':'.join(textos)
+    return (':'.join(textos[:mejor_inicio]) + '::'
+            + ':'.join(textos[mejor_inicio + mejor_largo:]))
+
+def validar_ipv6(ip: str) -> bool:
+    """
+    Valida que una dirección IPv6 sea correcta.
+    """
+    try:
+        ipv6_a_entero(ip)
+    except ValueError:
+        return False
+    return True
+
+def prefijo_a_mascara_v6(prefijo: int) -> str:
+    """
+    Máscara IPv6 del prefijo, en formato comprimido.
+    """
+    if prefijo < 0 or prefijo > 128:
+        raise ValueError("Prefijo debe estar entre 0 y 128")
+    return entero_a_ipv6(_MASCARA_128 ^ ((1 << (128 - prefijo)) - 1))
+
+def obtener_binario_ipv6(entero: int) -> str:
+    """
+    Representación binaria de una IPv6 (como entero), en grupos de 16 bits.
+    """
+    binario = format(entero, '0128b')
+    return ":".join(binario[i:i + 16] for i in range(0, 128, 16))
+
+def analizar_direccion(ip: str) -> tuple:
+    """
+    Convierte una dirección IPv4 o IPv6 a (entero, bits), con bits 32 o 128.
+    """
+    if ':' in ip:
+        return ipv6_a_entero(ip), 128
+    if not validar_ip(ip):
+        raise ValueError("Dirección IP inválida")
+    return ip_a_entero(ip), 32
+
+def entero_a_direccion(entero: int, bits: int = 32) -> str:
+    """
+    Convierte un entero a dirección IPv4 (bits=32) o IPv6 (bits=128).
+    """
+    return entero_a_ipv6(entero) if bits == 128 else entero_a_ip(entero)
+
+def bits_host_para(hosts_requeridos: int, bits: int = 32) -> int:
+    """
+    Bits de host del bloque mínimo para los hosts requeridos. En IPv4 se
+    suman la red y el broadcast; en IPv6 todas las direcciones son usables
+    pero el bloque mínimo es un /64 (identificadores de interfaz de 64 bits).
+    """
+    if hosts_requeridos <= 0:
+        raise ValueError("El número de hosts debe ser mayor a 0")
+    if bits == 128:
+        return max(64, (hosts_requeridos - 1).bit_length())
+    return (hosts_requeridos + 1).bit_length()
+
+# ---------------------------------------------------------------------------
+# Operaciones por lotes (NumPy)
+# ---------------------------------------------------------------------------
+
+def _matriz_caracteres(valores):
+    """
+    Convierte una lista, arreglo NumPy o buffer de bytes de cadenas en una
+    matriz (n, ancho) con el código de cada carácter (0 = relleno).
+    """
+    np = _importar_numpy()
+    
+    # Buffer de bytes: una dirección por línea o separadas por espacios
+    if isinstance(valores, (bytes, bytearray, memoryview)):
+        valores = bytes(valores).split()
+    
+    arreglo = np.asarray(valores)
+    if arreglo.dtype.kind not in 'SU':
+        # Listas vacías o con objetos: convertir elemento por elemento
+        arreglo = np.array([str(v) for v in arreglo.ravel()], dtype='U')
+    
+    arreglo = np.ascontiguousarray(arreglo.ravel())
+    n = arreglo.shape[0]
+    # Se reinterpreta el buffer sin copiar: 1 byte por carácter en 'S',
+    # 4 bytes (UCS-4) en 'U'
+    tipo = np.uint8 if arreglo.dtype.kind == 'S' else np.uint32
+    ancho = arreglo.dtype.itemsize // np.dtype(tipo).itemsize
+    if n == 0 or ancho == 0:
+        return np.zeros((n, 1), dtype=tipo)
+    return arreglo.view(tipo).reshape(n, ancho)
+
+def _parsear_punteado(caracteres, campos: int, max_digitos: int):
+    """
+    Interpreta una matriz de caracteres con `campos` números decimales
+    separados por puntos. Regresa (valores, validos) donde valores es una
+    matriz (n, campos) de enteros y validos una máscara booleana por fila.
+    """
+    np = _importar_numpy()
+    
+    n, ancho = caracteres.shape
+    es_punto = caracteres == 46
+    es_nulo = caracteres == 0
+    es_digito = (caracteres >= 48) & (caracteres <= 57)
+    
+    # Cada carácter debe ser dígito, punto o relleno final, y el relleno
+    # nulo sólo puede aparecer al final de la cadena
+    invalido = ~(es_digito | es_punto | es_nulo)
+    invalido[:, 1:] |= es_nulo[:, :-1] & ~es_nulo[:, 1:]
+    validos = ~invalido.any(axis=1)
+    validos &= np.count_nonzero(es_punto, axis=1) == campos - 1
+    
+    valores = np.zeros((n, campos), dtype=np.int64)
+    filas = np.flatnonzero(validos)
+    if filas.size == 0:
+        return valores, validos
+    
+    # Caso común: todas las filas son válidas y se evita copiar la matriz
+    if filas.size == n:
+        filas = slice(None)
+        total = n
+    else:
+        total = filas.size
+    
+    # Posiciones de los puntos de las filas válidas (campos - 1 por fila)
+    puntos = np.nonzero(es_punto[filas])[1].reshape(total, campos - 1)
+    longitud = ancho - np.count_nonzero(es_nulo[filas], axis=1)
+    inicios = np.concatenate([np.zeros((total, 1), dtype=np.int64), puntos + 1], axis=1)
+    finales = np.concatenate([puntos, longitud[:, None]], axis=1)
+    
+    digitos = finales - inicios
+    correctos = np.all((digitos >= 1) & (digitos <= max_digitos), axis=1)
+    
+    # Cada campo se arma desde su último dígito hacia atrás
+    codigos = caracteres[filas].astype(np.int32) - 48
+    acumulado = np.zeros((total, campos), dtype=np.int64)
+    peso = 1
+    for j in range(max_digitos):
+        posicion = finales - 1 - j
+        presente = posicion >= inicios
+        digito = np.take_along_axis(codigos, np.maximum(posicion, 0), axis=1)
+        acumulado += np.where(presente, digito, 0) * peso
+        peso *= 10
+    
+    validos[filas] = correctos
+    valores[filas] = np.where(correctos[:, None], acumulado, 0)
+    return valores, validos
+
+def ips_a_enteros(ips):
+    """
+    Convierte un lote de IPs (lista de strings, arreglo NumPy o buffer de
+    bytes) a un arreglo uint32. Regresa (enteros, validos): las filas
+    inválidas quedan en 0 y marcadas en False, sin lanzar ValueError.
+    """
+    np = _importar_numpy()
+    
+    if not isinstance(ips, (bytes, bytearray, memoryview)):
+        ips = np.asarray(ips)
+        # Arreglo que ya contiene enteros: solo validar el rango
+        if ips.dtype.kind in 'iu':
+            ips = ips.ravel()
+            validos = (ips >= 0) & (ips <= 0xFFFFFFFF)
+            enteros = np.where(validos, ips, 0).astype(np.uint32)
+            return enteros, validos
+    
+    caracteres = _matriz_caracteres(ips)
+    octetos, validos = _parsear_punteado(caracteres, 4, 3)
+    validos &= np.all(octetos <= 255, axis=1)
+    octetos[~validos] = 0
+    
+    enteros = ((octetos[:, 0] << 24) | (octetos[:, 1] << 16) |
+               (octetos[:, 2] << 8) | octetos[:, 3]).astype(np.uint32)
+    return enteros, validos
+
+_OCTETOS_TEXTO = [str(i) for i in range(256)]
+
+def enteros_a_ips(enteros) -> list:
+    """
+    Convierte un lote de enteros de 32 bits a una lista de IPs en formato string.
+    """
+    np = _importar_numpy()
+    
+    arreglo = np.asarray(enteros, dtype=np.int64).ravel()
+    if arreglo.size and (arreglo.min() < 0 or arreglo.max() > 0xFFFFFFFF):
+        raise ValueError("Entero fuera de rango para dirección IP")
+    
+    t = _OCTETOS_TEXTO
+    return [f"{t[a]}.{t[b]}.{t[c]}.{t[d]}" for a, b, c, d in zip(
+        (arreglo >> 24).tolist(), ((arreglo >> 16) & 0xFF).tolist(),
+        ((arreglo >> 8) & 0xFF).tolist(), (arreglo & 0xFF).tolist())]
+
+def textos_a_prefijos(textos):
+    """
+    Convierte un lote de prefijos en texto ("24", "8", ...) a enteros.
+    Regresa (prefijos, validos) con los prefijos fuera de 0-32 en False.
+    """
+    np = _importar_numpy()
+    
+    valores, validos = _parsear_punteado(_matriz_caracteres(textos), 1, 3)
+    validos &= valores[:, 0] <= 32
+    return np.where(validos, valores[:, 0], 0), validos
+
+def prefijos_a_mascaras(prefijos):
+    """
+    Convierte un lote de prefijos CIDR (0-32) a máscaras uint32.
+    """
+    np = _importar_numpy()
+    
+    p = np.asarray(prefijos, dtype=np.int64)
+    if p.size and (p.min() < 0 or p.max() > 32):
+        raise ValueError("Prefijo debe estar entre 0 y 32")
+    
+    # Se usa aritmética de 64 bits para que el prefijo 0 no desborde
+    return ((np.int64(0xFFFFFFFF) << (32 - p)) & 0xFFFFFFFF).astype(np.uint32)
+
+def mascaras_a_prefijos(mascaras):
+    """
+    Convierte un lote de máscaras (strings o enteros) a prefijos CIDR.
+    Regresa (prefijos, validos): las máscaras con 1s no contiguos quedan
+    marcadas en False.
+    """
+    np = _importar_numpy()
+    
+    enteros, validos = ips_a_enteros(mascaras)
+    comodin = (~enteros).astype(np.int64)
+    
+    # Una máscara es válida si su comodín es de la forma 2^k - 1
+    validos &= (comodin & (comodin + 1)) == 0
+    bits_host = np.frexp((comodin + 1).astype(np.float64))[1] - 1
+    prefijos = np.where(validos, 32 - bits_host, 0).astype(np.uint8)
+    return prefijos, validos
+
+def calcular_redes(ips, prefijos):
+    """
+    Calcula las direcciones de red de un lote de IPs (uint32) y prefijos.
+    """
+    np = _importar_numpy()
+    return np.asarray(ips, dtype=np.uint32) & prefijos_a_mascaras(prefijos)
+
+def calcular_broadcasts(ips, prefijos):
+    """
+    Calcula las direcciones de broadcast de un lote de IPs (uint32) y prefijos.
+    """
+    np = _importar_numpy()
+    mascaras = prefijos_a_mascaras(prefijos)
+    return (np.asarray(ips, dtype=np.uint32) & mascaras) | ~mascaras
+
+def calcular_tamanos_bloque(prefijos):
+    """
+    Calcula el número de direcciones de cada bloque para un lote de prefijos.
+    """
+    np = _importar_numpy()
+    return np.int64(1) << (32 - np.asarray(prefijos, dtype=np.int64))
+
+def prefijos_para_hosts(hosts_requeridos):
+    """
+    Calcula el prefijo mínimo que aloja cada cantidad de hosts del lote
+    (hosts + red + broadcast), igual que calcular_vlsm.
+    """
+    np = _importar_numpy()
+    necesarios = np.asarray(hosts_requeridos, dtype=np.int64) + 2
+    bits_host = np.frexp((necesarios - 1).astype(np.float64))[1]
+    return (32 - bits_host).astype(np.int64)
@@ -0,0 +1,147 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from registro_subred import crear_registro
+from vlsm_calculator import CalculadoraVLSM
+
+
+def calcular_plan(especificacion: dict) -> dict:
+    """
+    Calcula un plan VLSM a partir de una especificación (dict o su texto
+    JSON):
+    {"id": ..., "red_base": "IP/prefijo", "reservas": ["IP/prefijo", ...],
+     "subredes": [{"nombre": ..., "hosts_requeridos": ...}, ...]}
+
+    Nunca lanza: los errores se regresan en el campo "error" para que un plan
+    inválido no detenga el lote. Las subredes se regresan como tuplas
+    (nombre, hosts_requeridos, red_entero, prefijo, bits), que viajan entre
+    procesos mucho más rápido que los registros completos; crear_registro
+    las convierte de vuelta.
+    """
+    identificador = None
+    try:
+        if isinstance(especificacion, str):
+            especificacion = json.loads(especificacion)
+        identificador = especificacion.get("id")
+
+        calculadora = CalculadoraVLSM()
+        calculadora.configurar_red_base(especificacion["red_base"])
+        for reserva in especificacion.get("reservas", []):
+            calculadora.reservar_red(reserva)
+        for subred in especificacion["subredes"]:
+            calculadora.agregar_subred(subred["nombre"], int(subred["hosts_requeridos"]))
+
+        subredes = [(r.nombre, r.hosts_requeridos, r.red_entero, r.prefijo, r.bits)
+                    for r in calculadora.iterar_vlsm()]
+    except ValueError as e:
+        return {"id": identificador, "ok": False, "error": str(e)}
+    except (KeyError, TypeError, AttributeError) as e:
+        return {"id": identificador, "ok": False,
+                "error": f"Especificación inválida: {type(e).__name__}: {e}"}
+
+    return {
+        "id": identificador,
+        "ok": True,
+        "subredes": subredes,
+        "espacio_total": calculadora.espacio_total,
+        "espacio_usado": calculadora.espacio_usado,
+        "espacio_restante": calculadora.espacio_restante,
+    }
+
+
+def _repartir(funcion, elementos, procesos: int, tam_lote: int):
+    """
+    Aplica `funcion` a cada elemento en un grupo de procesos, en bloques de
+    `tam_lote` elementos por envío, y entrega los resultados en orden. La
+    entrada se consume por ventanas para no cargarla toda en memoria.
+    """
+    if tam_lote <= 0:
+        raise ValueError("El tamaño de lote debe ser mayor a 0")
+
+    procesos = procesos or os.cpu_count() or 1
+    elementos = iter(elementos)
+
+    if procesos == 1:
+        for elemento in elementos:
+            yield funcion(elemento)
+        return
+
+    ventana = procesos * tam_lote * 4
+    with ProcessPoolExecutor(max_workers=procesos) as grupo:
+        while True:
+            bloque = list(islice(elementos, ventana))
+            if not bloque:
+                break
+            yield from grupo.map(funcion, bloque, chunksize=tam_lote)
+
+
+def calcular_planes(especificaciones, procesos: int = None, tam_lote: int = 64):
+    """
+    Calcula muchos planes independientes repartiéndolos entre un grupo de
+    procesos (por defecto uno por núcleo; con procesos=1 todo corre en el
+    proceso actual). Entrega los resultados en el mismo orden de entrada,
+    con las subredes convertidas a RegistroSubred (RegistroSubred6 en IPv6).
+    """
+    for resultado in _repartir(calcular_plan, especificaciones, procesos, tam_lote):
+        if resultado["ok"]:
+            resultado["subredes"] = [crear_registro(*s) for s in resultado["subredes"]]
+        yield resultado
+
+
+def _calcular_plan_json(especificacion) -> tuple:
+    """
+    Calcula un plan y lo serializa en el mismo proceso de trabajo, para que
+    el proceso principal solo tenga que escribir la línea.
+    """
+    resultado = calcular_plan(especificacion)
+    if resultado["ok"]:
+        resultado["subredes"] = [dict(crear_registro(*s)) for s in resultado["subredes"]]
+    return resultado["ok"], json.dumps(resultado, ensure_ascii=False)
+
+
+def ejecutar_lote(argumentos: list = None):
+    """
+    Línea de comandos: python lote_vlsm.py ARCHIVO.jsonl|- [--salida ARCHIVO]
+    [--procesos N] [--lote N]. Escribe un objeto JSON por plan y un resumen
+    en stderr.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Cálculo de muchos planes VLSM en paralelo")
+    parser.add_argument("entrada", help="Especificaciones JSONL ('-' para stdin)")
+    parser.add_argument("--salida", default="-", help="Archivo de salida ('-' para stdout)")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos (por defecto: núcleos)")
+    parser.add_argument("--lote", type=int, default=64, help="Planes por envío a cada proceso")
+    args = parser.parse_args(argumentos)
+
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+
+    inicio = time.perf_counter()
+    planes = 0
+    errores = 0
+    try:
+        # Las líneas se envían como texto: cada proceso interpreta su JSON
+        especificaciones = (linea for linea in entrada if linea.strip())
+        for ok, linea in _repartir(_calcular_plan_json, especificaciones,
+                                   args.procesos, args.lote):
+            planes += 1
+            errores += not ok
+            salida.write(linea + "\n")
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+    segundos = time.perf_counter() - inicio
+    print(f"Planes: {planes}  Con error: {errores}  Tiempo: {segundos:.2f} s  "
+          f"({planes / segundos if segundos > 0 else 0:,.0f} planes/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    ejecutar_lote()
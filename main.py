@@ -1,127 +1,294 @@
-from cidr_calculator import CalculadoraCIDR
-from vlsm_calculator import CalculadoraVLSM
-import os
-
-def limpiar_pantalla():
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-def mostrar_menu():
-    print("\n" + "="*50)
-    print("CALCULADORAS DE RED - CIDR y VLSM")
-    print("="*50)
-    print("1. Calculadora CIDR")
-    print("2. Calculadora VLSM")
-    print("3. Ejecutar casos de prueba")
-    print("4. Acerca del proyecto")
-    print("5. Salir")
-    print("="*50)
-
-def ejecutar_casos_prueba():
-    print("\n" + "="*50)
-    print("CASOS DE PRUEBA")
-    print("="*50)
-    
-    # Caso de prueba CIDR
-    print("\n1. CASO CIDR: 192.168.10.0/24")
-    print("-" * 40)
-    try:
-        cidr = CalculadoraCIDR("192.168.10.0/24")
-        resultados = cidr.calcular()
-        cidr.imprimir_resultados(resultados)
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    # Caso de prueba VLSM
-    print("\n2. CASO VLSM: 192.168.0.0/24 con A=100, B=50, C=25, D=10")
-    print("-" * 40)
-    try:
-        vlsm = CalculadoraVLSM()
-        vlsm.configurar_red_base("192.168.0.0/24")
-        vlsm.agregar_subred("A", 100)
-        vlsm.agregar_subred("B", 50)
-        vlsm.agregar_subred("C", 25)
-        vlsm.agregar_subred("D", 10)
-        vlsm.calcular_vlsm()
-        vlsm.imprimir_resultados()
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    # Caso límite VLSM
-    print("\n3. CASO LÍMITE VLSM: Red pequeña con muchos hosts")
-    print("-" * 40)
-    try:
-        vlsm2 = CalculadoraVLSM()
-        vlsm2.configurar_red_base("192.168.0.0/30")  # Solo 4 direcciones
-        vlsm2.agregar_subred("S1", 10)  # Requiere 12 direcciones
-        vlsm2.calcular_vlsm()
-        vlsm2.imprimir_resultados()
-    except ValueError as e:
-        print(f"Error esperado: {e}")
-    
-    input("\nPresione Enter para continuar...")
-
-def mostrar_acerca():
-    """Muestra información sobre el proyecto."""
-    limpiar_pantalla()
-    print("\n" + "="*50)
-    print("ACERCA DEL PROYECTO")
-    print("="*50)
-    print("\nCalculadoras de Red - CIDR y VLSM")
-    print("Proyecto 3: Redes de Computadoras")
-    print("\nIntegrantes del equipo:")
-    print("- Blanco Resendiz Cuauhtemoc - 2024630579")
-    print("\nFuncionalidades:")
-    print("• Calculadora CIDR completa")
-    print("• Calculadora VLSM")
-    print("• Validación de entradas")
-    print("• Manejo de errores")
-    print("• Interfaz de consola")
-    print("\nInstrucciones:")
-    print("1. Ejecutar: python main.py")
-    print("2. Seleccionar opción del menú")
-    print("3. Seguir las instrucciones en pantalla")
-    print("\n" + "="*50)
-    input("\nPresione Enter para continuar...")
-
-def main():
-    """Función principal del programa."""
-    while True:
-        limpiar_pantalla()
-        mostrar_menu()
-        
-        opcion = input("\nSeleccione una opción (1-5): ").strip()
-        
-        if opcion == '1':
-            limpiar_pantalla()
-            cidr = CalculadoraCIDR()
-            cidr.ejecutar_desde_consola()
-        
-        elif opcion == '2':
-            limpiar_pantalla()
-            vlsm = CalculadoraVLSM()
-            vlsm.ejecutar_desde_consola()
-        
-        elif opcion == '3':
-            limpiar_pantalla()
-            ejecutar_casos_prueba()
-        
-        elif opcion == '4':
-            mostrar_acerca()
-        
-        elif opcion == '5':
-            limpiar_pantalla()
-            print("\n¡Gracias por usar las Calculadoras de Red!")
-            print("Hasta luego.\n")
-            break
-        
-        else:
-            print("\nOpción inválida. Intente nuevamente.")
-            input("Presione Enter para continuar...")
-
-if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print("\n\nPrograma interrumpido por el usuario.")
-    except Exception as e:
+import time
+
+_INICIO = time.perf_counter()
+
+import os
+import sys
+
+# Las calculadoras se importan dentro de cada función: el modo de línea de
+# comandos solo carga lo que usa
+
+def limpiar_pantalla():
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # Secuencia ANSI: limpia sin lanzar un shell en cada pantalla
+        print("\033[2J\033[H", end="", flush=True)
+
+def mostrar_menu():
+    print("\n" + "="*50)
+    print("CALCULADORAS DE RED - CIDR y VLSM")
+    print("="*50)
+    print("1. Calculadora CIDR")
+    print("2. Calculadora VLSM")
+    print("3. Ejecutar casos de prueba")
+    print("4. Acerca del proyecto")
+    print("5. Salir")
+    print("="*50)
+
+def ejecutar_casos_prueba():
+    from cidr_calculator import CalculadoraCIDR
+    from vlsm_calculator import CalculadoraVLSM
+    
+    print("\n" + "="*50)
+    print("CASOS DE PRUEBA")
+    print("="*50)
+    
+    # Caso de prueba CIDR
+    print("\n1. CASO CIDR: 192.168.10.0/24")
+    print("-" * 40)
+    try:
+        cidr = CalculadoraCIDR("192.168.10.0/24")
+        resultados = cidr.calcular()
+        cidr.imprimir_resultados(resultados)
+    except Exception as e:
+        print(f"Error: {e}")
+    
+    # Caso de prueba VLSM
+    print("\n2. CASO VLSM: 192.168.0.0/24 con A=100, B=50, C=25, D=10")
+    print("-" * 40)
+    try:
+        vlsm = CalculadoraVLSM()
+        vlsm.configurar_red_base("192.168.0.0/24")
+        vlsm.agregar_subred("A", 100)
+        vlsm.agregar_subred("B", 50)
+        vlsm.agregar_subred("C", 25)
+        vlsm.agregar_subred("D", 10)
+        vlsm.calcular_vlsm()
+        vlsm.imprimir_resultados()
+    except Exception as e:
+        print(f"Error: {e}")
+    
+    # Caso límite VLSM
+    print("\n3. CASO LÍMITE VLSM: Red pequeña con muchos hosts")
+    print("-" * 40)
+    try:
+        vlsm2 = CalculadoraVLSM()
+        vlsm2.configurar_red_base("192.168.0.0/30")  # Solo 4 direcciones
+        vlsm2.agregar_subred("S1", 10)  # Requiere 12 direcciones
+        vlsm2.calcular_vlsm()
+        vlsm2.imprimir_resultados()
+    except ValueError as e:
+        print(f"Error esperado: {e}")
+    
+    input("\nPresione Enter para continuar...")
+
+def mostrar_acerca():
+    """Muestra información sobre el proyecto."""
+    limpiar_pantalla()
+    print("\n" + "="*50)
+    print("ACERCA DEL PROYECTO")
+    print("="*50)
+    print("\nCalculadoras de Red - CIDR y VLSM")
+    print("Proyecto 3: Redes de Computadoras")
+    print("\nIntegrantes del equipo:")
+    print("- Blanco Resendiz Cuauhtemoc - 2024630579")
+    print("\nFuncionalidades:")
+    print("• Calculadora CIDR completa")
+    print("• Calculadora VLSM")
+    print("• Validación de entradas")
+    print("• Manejo de errores")
+    print("• Interfaz de consola")
+    print("\nInstrucciones:")
+    print("1. Ejecutar: python main.py")
+    print("2. Seleccionar opción del menú")
+    print("3. Seguir las instrucciones en pantalla")
+    print("\nUso desde scripts (salida JSON):")
+    print("  python main.py cidr 192.168.1.0/24")
+    print("  python main.py vlsm --red 192.168.0.0/24 A=100 B=50")
+    print("\n" + "="*50)
+    input("\nPresione Enter para continuar...")
+
+def main():
+    """Función principal del programa."""
+    while True:
+        limpiar_pantalla()
+        mostrar_menu()
+        
+        opcion = input("\nSeleccione una opción (1-5): ").strip()
+        
+        if opcion == '1':
+            from cidr_calculator import CalculadoraCIDR
+            limpiar_pantalla()
+            cidr = CalculadoraCIDR()
+            cidr.ejecutar_desde_consola()
+        
+        elif opcion == '2':
+            from vlsm_calculator import CalculadoraVLSM
+            limpiar_pantalla()
+            vlsm = CalculadoraVLSM()
+            vlsm.ejecutar_desde_consola()
+        
+        elif opcion == '3':
+            limpiar_pantalla()
+            ejecutar_casos_prueba()
+        
+        elif opcion == '4':
+            mostrar_acerca()
+        
+        elif opcion == '5':
+            limpiar_pantalla()
+            print("\n¡Gracias por usar las Calculadoras de Red!")
+            print("Hasta luego.\n")
+            break
+        
+        else:
+            print("\nOpción inválida. Intente nuevamente.")
+            input("Presione Enter para continuar...")
+
+def _comando_cidr(args) -> int:
+    """
+    Calcula cada entrada (argumentos o una por línea de stdin) y escribe un
+    objeto JSON por línea. Regresa 1 si alguna entrada fue inválida.
+    """
+    import json
+    from cidr_calculator import CalculadoraCIDR
+    
+    entradas = args.entradas
+    if not entradas or entradas == ["-"]:
+        entradas = (linea for linea in sys.stdin if linea.strip())
+    
+    codigo = 0
+    calculadora = CalculadoraCIDR()
+    for entrada in entradas:
+        try:
+            calculadora.analizar_entrada(entrada)
+            resultados = calculadora.calcular()
+        except ValueError as e:
+            codigo = 1
+            if args.formato == "texto":
+                print(f"Error: {entrada.strip()}: {e}")
+            else:
+                print(json.dumps({"entrada": entrada.strip(), "error": str(e)}, ensure_ascii=False))
+            continue
+        
+        if args.formato == "texto":
+            calculadora.imprimir_resultados(resultados)
+        else:
+            print(json.dumps(resultados, ensure_ascii=False))
+    return codigo
+
+def _leer_subredes(args, parser) -> list:
+    """
+    Regresa [(nombre, hosts), ...] de los argumentos "nombre=hosts" o, si no
+    hay, del archivo de --subredes (o stdin) con líneas "nombre hosts" o
+    "nombre,hosts".
+    """
+    subredes = []
+    for texto in args.subredes:
+        nombre, separador, hosts = texto.replace(":", "=").partition("=")
+        if not separador or not hosts.strip().isdigit():
+            parser.error(f"Subred inválida '{texto}'. Use nombre=hosts")
+        subredes.append((nombre.strip(), int(hosts)))
+    if subredes:
+        return subredes
+    
+    entrada = sys.stdin if args.archivo in (None, "-") else open(args.archivo, encoding="utf-8")
+    try:
+        for numero, linea in enumerate(entrada, 1):
+            partes = linea.replace(",", " ").split()
+            if not partes:
+                continue
+            if len(partes) != 2 or not partes[1].isdigit():
+                parser.error(f"Línea {numero}: use 'nombre hosts'")
+            subredes.append((partes[0], int(partes[1])))
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+    return subredes
+
+def _comando_vlsm(args, parser) -> int:
+    """
+    Calcula un plan VLSM y lo escribe como un objeto JSON (o en el formato
+    pedido). Regresa 1 si el plan no se pudo calcular.
+    """
+    import json
+    from vlsm_calculator import CalculadoraVLSM
+    
+    calculadora = CalculadoraVLSM()
+    try:
+        calculadora.configurar_red_base(args.red)
+        for reserva in args.reserva:
+            calculadora.reservar_red(reserva)
+        for nombre, hosts in _leer_subredes(args, parser):
+            calculadora.agregar_subred(nombre, hosts)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    try:
+        if args.formato in ("csv", "jsonl", "ancho"):
+            from escritores import ESCRITORES
+            ESCRITORES[args.formato](calculadora.iterar_vlsm(), sys.stdout)
+            return 0
+        calculadora.calcular_vlsm()
+    except ValueError as e:
+        if args.formato == "json":
+            print(json.dumps({"red_base": args.red, "error": str(e)}, ensure_ascii=False))
+        else:
+            print(f"Error en el cálculo: {e}", file=sys.stderr)
+        return 1
+    
+    if args.formato == "texto":
+        calculadora.imprimir_resultados()
+    else:
+        print(json.dumps({
+            "red_base": f"{calculadora.red_base}/{calculadora.prefijo_base}",
+            "espacio_total": calculadora.espacio_total,
+            "espacio_usado": calculadora.espacio_usado,
+            "espacio_reservado": calculadora.espacio_reservado,
+            "espacio_restante": calculadora.espacio_restante,
+            "subredes": [dict(registro) for registro in calculadora.resultados],
+        }, ensure_ascii=False))
+    return 0
+
+def ejecutar_linea_comandos(argumentos: list = None) -> int:
+    """
+    Modo no interactivo:
+    python main.py cidr [ENTRADA ...]            (sin entradas: una por línea de stdin)
+    python main.py vlsm --red IP/prefijo [nombre=hosts ...] [--subredes ARCHIVO|-]
+    Escribe JSON en stdout; --tiempo muestra en stderr cuánto tardó el proceso.
+    """
+    import argparse
+    
+    comunes = argparse.ArgumentParser(add_help=False)
+    comunes.add_argument("--tiempo", action="store_true",
+                         help="Muestra en stderr el tiempo desde el inicio del programa")
+    
+    parser = argparse.ArgumentParser(prog="main.py", description="Calculadoras de red CIDR y VLSM")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    
+    cidr = subcomandos.add_parser("cidr", parents=[comunes],
+                                  help="Análisis CIDR de una o más direcciones")
+    cidr.add_argument("entradas", nargs="*",
+                      help="'IP/prefijo' o 'IP máscara' (sin entradas o '-': stdin)")
+    cidr.add_argument("--formato", choices=("json", "texto"), default="json")
+    
+    vlsm = subcomandos.add_parser("vlsm", parents=[comunes], help="Plan VLSM de una red base")
+    vlsm.add_argument("--red", required=True, help="Red base (IP/prefijo)")
+    vlsm.add_argument("subredes", nargs="*", help="Subredes como nombre=hosts")
+    vlsm.add_argument("--subredes", dest="archivo",
+                      help="Archivo con 'nombre hosts' por línea ('-' para stdin)")
+    vlsm.add_argument("--reserva", action="append", default=[], help="Red ya asignada (IP/prefijo)")
+    vlsm.add_argument("--formato", choices=("json", "csv", "jsonl", "ancho", "texto"), default="json")
+    
+    args = parser.parse_args(argumentos)
+    
+    if args.comando == "cidr":
+        codigo = _comando_cidr(args)
+    else:
+        codigo = _comando_vlsm(args, vlsm)
+    
+    if args.tiempo:
+        print(f"Tiempo: {(time.perf_counter() - _INICIO) * 1000:.1f} ms", file=sys.stderr)
+    return codigo
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(ejecutar_linea_comandos())
+    
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\nPrograma interrumpido por el usuario.")
+    except Exception as e:
         print(f"\nError inesperado: {e}")
\ No newline at end of file
@@ -16,12 +16,14 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
+# Distribución en carpeta (onedir): el ejecutable no tiene que extraerse a
+# un directorio temporal en cada arranque, lo que importa cuando se invoca
+# miles de veces desde scripts
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='main',
     debug=False,
     bootloader_ignore_signals=False,
@@ -29,10 +31,20 @@ exe = EXE(
     upx=True,
     upx_exclude=[],
     runtime_tmpdir=None,
-    console=False,
+    console=True,
     disable_windowed_traceback=False,
     argv_emulation=False,
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='main',
+)
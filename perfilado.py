@@ -0,0 +1,199 @@
+import os
+import threading
+import time
+
+
+class _EtapaNula:
+    """
+    Contexto vacío que se usa mientras el perfilador está desactivado.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        return False
+
+
+_ETAPA_NULA = _EtapaNula()
+
+
+class _Etapa:
+    __slots__ = ("perfilador", "nombre", "inicio")
+
+    def __init__(self, perfilador, nombre: str):
+        self.perfilador = perfilador
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excepcion):
+        self.perfilador.registrar(self.nombre, time.perf_counter() - self.inicio)
+        return False
+
+
+class Perfilador:
+    """
+    Temporizadores por etapa y contadores para instrumentar las
+    calculadoras. Desactivado, etapa() regresa un contexto vacío compartido
+    y contar() solo revisa una bandera, así que las llamadas pueden quedarse
+    en el código sin costo apreciable. Activado, las mediciones se acumulan
+    bajo un candado y se pueden registrar desde varios hilos a la vez (el
+    perfil de cProfile, en cambio, solo cubre el hilo que lo activó).
+
+    Uso:
+        PERFILADOR.activar()
+        calculadora.calcular_vlsm()
+        print(PERFILADOR.reporte())
+    """
+
+    def __init__(self):
+        self.activo = False
+        self.tiempos = {}
+        self.llamadas = {}
+        self.contadores = {}
+        self._perfil = None
+        self._candado = threading.Lock()
+
+    def activar(self, cprofile: bool = False):
+        """
+        Activa la medición. Con cprofile=True también corre cProfile hasta
+        desactivar(), para obtener el detalle por función.
+        """
+        self.activo = True
+        if cprofile and self._perfil is None:
+            import cProfile
+            self._perfil = cProfile.Profile()
+            self._perfil.enable()
+
+    def desactivar(self):
+        self.activo = False
+        if self._perfil is not None:
+            self._perfil.disable()
+
+    def reiniciar(self):
+        """
+        Borra las mediciones y el perfil de cProfile acumulados.
+        """
+        with self._candado:
+            self.tiempos = {}
+            self.llamadas = {}
+            self.contadores = {}
+        if self._perfil is not None:
+            self._perfil.disable()
+            self._perfil = None
+            if self.activo:
+                self.activar(cprofile=True)
+
+    def etapa(self, nombre: str):
+        """
+        Contexto que mide el tiempo de una etapa con nombre:
+        with PERFILADOR.etapa("vlsm.ordenar"): ...
+        """
+        if not self.activo:
+            return _ETAPA_NULA
+        return _Etapa(self, nombre)
+
+    def registrar(self, nombre: str, segundos: float):
+        with self._candado:
+            self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + segundos
+            self.llamadas[nombre] = self.llamadas.get(nombre, 0) + 1
+
+    def contar(self, nombre: str, cantidad: int = 1):
+        if self.activo:
+            with self._candado:
+                self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def _copia(self) -> tuple:
+        with self._candado:
+            return dict(self.tiempos), dict(self.llamadas), dict(self.contadores)
+
+    def resumen(self) -> dict:
+        tiempos, llamadas, contadores = self._copia()
+        return {
+            "etapas": {nombre: {"segundos": tiempos[nombre], "llamadas": llamadas[nombre]}
+                       for nombre in tiempos},
+            "contadores": contadores,
+        }
+
+    def reporte(self) -> str:
+        """
+        Tabla de texto con el tiempo por etapa (de mayor a menor) y los
+        contadores. Las etapas pueden anidarse (vlsm.calcular incluye a
+        vlsm.ordenar), así que los tiempos no se suman.
+        """
+        tiempos, todas_llamadas, contadores = self._copia()
+        lineas = [f"{'Etapa':<28} {'Llamadas':>9} {'Segundos':>10} {'ms/llamada':>11}", "-" * 61]
+        for nombre, segundos in sorted(tiempos.items(), key=lambda t: -t[1]):
+            llamadas = todas_llamadas[nombre]
+            lineas.append(f"{nombre:<28} {llamadas:>9} {segundos:>10.4f} "
+                          f"{segundos / llamadas * 1000:>11.3f}")
+        if contadores:
+            lineas.append("-" * 61)
+            for nombre, cantidad in sorted(contadores.items()):
+                lineas.append(f"{nombre:<28} {cantidad:>9}")
+        return "\n".join(lineas)
+
+    def volcar_cprofile(self, ruta: str):
+        """
+        Guarda las estadísticas de cProfile en `ruta` (formato pstats; se
+        leen con python -m pstats RUTA).
+        """
+        if self._perfil is None:
+            raise ValueError("cProfile no está activo. Use activar(cprofile=True).")
+        self._perfil.dump_stats(ruta)
+
+    def reporte_cprofile(self, limite: int = 20, orden: str = "cumulative") -> str:
+        """
+        Las `limite` funciones más costosas según cProfile, como texto.
+        """
+        import io
+        import pstats
+
+        if self._perfil is None:
+            raise ValueError("cProfile no está activo. Use activar(cprofile=True).")
+        texto = io.StringIO()
+        pstats.Stats(self._perfil, stream=texto).sort_stats(orden).print_stats(limite)
+        return texto.getvalue()
+
+
+def agregar_argumentos(parser):
+    """
+    Agrega --perfil y --cprofile a un ArgumentParser de línea de comandos.
+    """
+    parser.add_argument("--perfil", action="store_true",
+                        help="Muestra en stderr el tiempo por etapa y los contadores")
+    parser.add_argument("--cprofile", metavar="ARCHIVO",
+                        help="Guarda un perfil de cProfile (formato pstats) en ARCHIVO")
+
+
+def iniciar_desde_argumentos(args):
+    """
+    Activa el perfilador compartido según las opciones de agregar_argumentos.
+    """
+    if args.perfil or args.cprofile:
+        PERFILADOR.activar(cprofile=bool(args.cprofile))
+
+
+def reportar_desde_argumentos(args, flujo):
+    """
+    Escribe el reporte en `flujo` y guarda el perfil de cProfile pedidos
+    con las opciones de agregar_argumentos.
+    """
+    if args.cprofile:
+        PERFILADOR.desactivar()
+        PERFILADOR.volcar_cprofile(args.cprofile)
+    if args.perfil:
+        print(PERFILADOR.reporte(), file=flujo)
+
+
+# Perfilador compartido por las calculadoras. Se activa con la variable de
+# entorno CALCULADORAS_PERFIL=1 (o =cprofile para incluir cProfile).
+PERFILADOR = Perfilador()
+
+if os.environ.get("CALCULADORAS_PERFIL"):
+    PERFILADOR.activar(cprofile=os.environ["CALCULADORAS_PERFIL"].lower() == "cprofile")
@@ -0,0 +1,166 @@
+from ip_utils import *
+from asignador_bloques import AsignadorBuddy
+from registro_subred import RegistroSubred, crear_registro
+from vlsm_calculator import CalculadoraVLSM
+
+
+class PlanIncremental:
+    """
+    Plan VLSM que se actualiza de forma incremental.
+
+    Agregar, redimensionar o eliminar una subred solo modifica la asignación
+    afectada (O(bits) operaciones sobre el asignador buddy) y regresa la
+    lista de cambios. Las subredes existentes conservan su lugar siempre
+    que sea posible. Los textos de cada subred se generan solo al
+    consultarlos. Acepta redes base IPv4 e IPv6.
+    """
+
+    def __init__(self, red_base: str, reservas: list = None):
+        calculadora = CalculadoraVLSM()
+        calculadora.configurar_red_base(red_base)
+        for reserva in reservas or []:
+            calculadora.reservar_red(reserva)
+        self._iniciar(calculadora)
+
+    @classmethod
+    def desde_calculadora(cls, calculadora: CalculadoraVLSM) -> "PlanIncremental":
+        """
+        Crea un plan incremental con la red base, las reservas y las subredes
+        ya configuradas en una CalculadoraVLSM.
+        """
+        if not calculadora.red_base or calculadora.prefijo_base is None:
+            raise ValueError("Debe configurar la red base primero")
+
+        plan = cls.__new__(cls)
+        plan._iniciar(calculadora)
+
+        # Carga inicial de mayor a menor para un acomodo compacto
+        for subred in sorted(calculadora.subredes,
+                             key=lambda x: x["hosts_requeridos"], reverse=True):
+            plan.agregar(subred["nombre"], subred["hosts_requeridos"])
+        return plan
+
+    def _iniciar(self, calculadora: CalculadoraVLSM):
+        self.red_base = calculadora.red_base
+        self.prefijo_base = calculadora.prefijo_base
+        self.bits = calculadora.bits
+
+        self._asignador = AsignadorBuddy(calculadora._red_base_alineada(),
+                                         self.prefijo_base, self.bits)
+        for red_entero, prefijo in calculadora.reservas:
+            self._asignador.reservar(red_entero, prefijo)
+
+        # nombre -> [red_entero, prefijo, hosts_requeridos]
+        self._asignaciones = {}
+
+    def __len__(self):
+        return len(self._asignaciones)
+
+    def _prefijo_para(self, hosts_requeridos: int) -> int:
+        return self.bits - bits_host_para(hosts_requeridos, self.bits)
+
+    def __contains__(self, nombre):
+        return nombre in self._asignaciones
+
+    def agregar(self, nombre: str, hosts_requeridos: int) -> list:
+        """
+        Agrega una subred y regresa los cambios producidos.
+        """
+        if nombre in self._asignaciones:
+            raise ValueError(f"Ya existe una subred llamada '{nombre}'")
+
+        prefijo = self._prefijo_para(hosts_requeridos)
+        red_entero = self._asignador.asignar(prefijo)
+        if red_entero is None:
+            raise ValueError(
+                f"No hay espacio suficiente para la subred '{nombre}'. "
+                f"Espacio insuficiente en la red base."
+            )
+
+        self._asignaciones[nombre] = [red_entero, prefijo, hosts_requeridos]
+        return [{"accion": "agregada", "nombre": nombre,
+                 "red": red_entero, "prefijo": prefijo}]
+
+    def eliminar(self, nombre: str) -> list:
+        """
+        Elimina una subred, devuelve su bloque al espacio libre y regresa los
+        cambios producidos.
+        """
+        if nombre not in self._asignaciones:
+            raise ValueError(f"No existe la subred '{nombre}'")
+
+        red_entero, prefijo, _ = self._asignaciones.pop(nombre)
+        self._asignador.liberar(red_entero, prefijo)
+        return [{"accion": "eliminada", "nombre": nombre,
+                 "red": red_entero, "prefijo": prefijo}]
+
+    def redimensionar(self, nombre: str, hosts_requeridos: int) -> list:
+        """
+        Cambia los hosts requeridos de una subred. Si el bloque cambia de
+        tamaño se intenta conservar la misma dirección de red; solo si no
+        cabe ahí se mueve. Regresa los cambios producidos.
+        """
+        if nombre not in self._asignaciones:
+            raise ValueError(f"No existe la subred '{nombre}'")
+
+        asignacion = self._asignaciones[nombre]
+        red_anterior, prefijo_anterior, _ = asignacion
+        prefijo = self._prefijo_para(hosts_requeridos)
+
+        if prefijo == prefijo_anterior:
+            asignacion[2] = hosts_requeridos
+            return []
+
+        # Liberar el bloque actual y volver a ocuparlo en la misma posición
+        # (alineada al nuevo tamaño) cuando sea posible
+        self._asignador.liberar(red_anterior, prefijo_anterior)
+        red_entero = red_anterior & ~((1 << (self.bits - prefijo)) - 1)
+        try:
+            self._asignador.reservar(red_entero, prefijo)
+        except ValueError:
+            red_entero = self._asignador.asignar(prefijo)
+
+        if red_entero is None:
+            self._asignador.reservar(red_anterior, prefijo_anterior)
+            raise ValueError(
+                f"No hay espacio suficiente para la subred '{nombre}'. "
+                f"Espacio insuficiente en la red base."
+            )
+
+        self._asignaciones[nombre] = [red_entero, prefijo, hosts_requeridos]
+        return [{"accion": "movida" if red_entero != red_anterior else "redimensionada",
+                 "nombre": nombre, "red": red_entero, "prefijo": prefijo,
+                 "red_anterior": red_anterior, "prefijo_anterior": prefijo_anterior}]
+
+    def resultado(self, nombre: str) -> RegistroSubred:
+        """
+        Regresa el registro de resultados de una subred.
+        """
+        if nombre not in self._asignaciones:
+            raise ValueError(f"No existe la subred '{nombre}'")
+
+        red_entero, prefijo, hosts = self._asignaciones[nombre]
+        return crear_registro(nombre, hosts, red_entero, prefijo, self.bits)
+
+    def resultados(self) -> list:
+        """
+        Regresa los registros de todas las subredes ordenados por dirección.
+        """
+        orden = sorted(self._asignaciones.items(), key=lambda x: x[1][0])
+        return [crear_registro(nombre, hosts, red_entero, prefijo, self.bits)
+                for nombre, (red_entero, prefijo, hosts) in orden]
+
+    @property
+    def espacio_total(self) -> int:
+        return self._asignador.espacio_total
+
+    @property
+    def espacio_restante(self) -> int:
+        return self._asignador.espacio_libre
+
+    def mapa_libre(self) -> AsignadorBuddy:
+        """
+        El espacio libre actual del plan, con las mismas consultas que
+        CalculadoraVLSM.mapa_libre(); se mantiene al día con cada cambio.
+        """
+        return self._asignador
@@ -0,0 +1,111 @@
+import argparse
+import copy
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from api import calcular_cidr, calcular_vlsm
+from cidr_calculator import CacheRedes
+from ip_utils import *
+
+
+def _generar_operaciones(cantidad: int, generador: random.Random) -> list:
+    """
+    Mezcla de operaciones CIDR (sobre pocas redes, para que la caché se
+    comparta) y VLSM (algunas sin espacio, que deben lanzar ValueError).
+    Los requerimientos VLSM son listas de dicts mutables, para detectar si
+    alguna llamada los modifica.
+    """
+    redes = [generador.getrandbits(32) for _ in range(200)]
+    operaciones = []
+    for _ in range(cantidad):
+        if generador.random() < 0.7:
+            ip = entero_a_ip(generador.choice(redes) ^ generador.getrandbits(8))
+            prefijo = generador.randint(0, 32)
+            if generador.random() < 0.5:
+                operaciones.append(("cidr", f"{ip}/{prefijo}"))
+            else:
+                operaciones.append(("cidr", f"{ip} {prefijo_a_mascara(prefijo)}"))
+        else:
+            prefijo_base = generador.randint(16, 26)
+            red_base = f"{entero_a_ip(generador.getrandbits(32))}/{prefijo_base}"
+            subredes = [{"nombre": f"S{i}", "hosts_requeridos": generador.randint(1, 300)}
+                        for i in range(generador.randint(1, 30))]
+            operaciones.append(("vlsm", red_base, subredes))
+    return operaciones
+
+
+def _ejecutar(operacion, cache):
+    try:
+        if operacion[0] == "cidr":
+            return dict(calcular_cidr(operacion[1], cache=cache))
+        plan = calcular_vlsm(operacion[1], operacion[2])
+        return plan._replace(subredes=tuple(tuple(s.values()) for s in plan.subredes))
+    except ValueError as e:
+        return ("error", str(e))
+
+
+def ejecutar_prueba(hilos: int = 32, operaciones: int = 20000, repeticiones: int = 3,
+                    semilla: int = 1) -> dict:
+    """
+    Prueba de estrés de api.py: calcula cada operación en un solo hilo y sin
+    caché, y después la repite mezclada desde un grupo de hilos que
+    comparten una caché de redes pequeña (para forzar aciertos y desalojos
+    concurrentes). Regresa un resumen; "errores" (resultados distintos o
+    excepciones inesperadas) y "requerimientos_modificados" (operaciones
+    cuyas entradas cambiaron durante la prueba) deben ser 0.
+    """
+    generador = random.Random(semilla)
+    lista = _generar_operaciones(operaciones, generador)
+    originales = copy.deepcopy(lista)
+
+    esperados = [_ejecutar(operacion, None) for operacion in lista]
+
+    trabajos = [i for i in range(len(lista)) for _ in range(repeticiones)]
+    generador.shuffle(trabajos)
+    cache = CacheRedes(tamano=64)
+
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Cambios de hilo frecuentes: más intercalado
+    try:
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=hilos) as grupo:
+            obtenidos = list(grupo.map(lambda i: _ejecutar(lista[i], cache), trabajos,
+                                       chunksize=16))
+        segundos = time.perf_counter() - inicio
+    finally:
+        sys.setswitchinterval(intervalo)
+
+    errores = sum(1 for i, obtenido in zip(trabajos, obtenidos) if obtenido != esperados[i])
+    modificados = sum(1 for operacion, original in zip(lista, originales) if operacion != original)
+
+    return {
+        "hilos": hilos,
+        "llamadas": len(trabajos),
+        "segundos": segundos,
+        "llamadas_por_segundo": len(trabajos) / segundos if segundos else 0.0,
+        "errores": errores,
+        "requerimientos_modificados": modificados,
+        "cache": cache.estadisticas(),
+        "gil": getattr(sys, "_is_gil_enabled", lambda: True)(),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prueba de estrés multihilo de api.py")
+    parser.add_argument("--hilos", type=int, default=32)
+    parser.add_argument("--operaciones", type=int, default=20000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args()
+
+    resultado = ejecutar_prueba(args.hilos, args.operaciones, args.repeticiones, args.semilla)
+    print(f"Hilos: {resultado['hilos']} (GIL {'activo' if resultado['gil'] else 'desactivado'})")
+    print(f"Llamadas: {resultado['llamadas']} en {resultado['segundos']:.2f} s "
+          f"({resultado['llamadas_por_segundo']:.0f}/s)")
+    print(f"Caché: {resultado['cache']['aciertos']} aciertos, "
+          f"{resultado['cache']['desalojos']} desalojos")
+    print(f"Resultados distintos: {resultado['errores']}")
+    print(f"Requerimientos modificados: {resultado['requerimientos_modificados']}")
+    sys.exit(1 if resultado["errores"] or resultado["requerimientos_modificados"] else 0)
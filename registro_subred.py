@@ -0,0 +1,233 @@
+from collections.abc import Mapping
+from ip_utils import *
+
+_MASCARAS_TEXTO = [prefijo_a_mascara(p) for p in range(33)]
+
+
+class RegistroSubred(Mapping):
+    """
+    Resultado compacto de una subred asignada.
+
+    Solo guarda el nombre, los hosts requeridos, la red como entero y el
+    prefijo; los demás campos (textos, broadcast, rango, etc.) se calculan al
+    consultarlos. Se usa igual que el dict que generaba calcular_vlsm:
+    registro['notacion_cidr'], registro.get('mascara'), dict(registro)...
+    """
+
+    __slots__ = ("nombre", "hosts_requeridos", "red_entero", "prefijo")
+
+    # Ancho de la dirección en bits
+    bits = 32
+
+    CAMPOS = ("nombre", "hosts_requeridos", "red", "prefijo", "mascara",
+              "broadcast", "primer_host", "ultimo_host", "hosts_validos",
+              "tam_bloque", "desperdicio", "rango_hosts", "notacion_cidr")
+
+    def __init__(self, nombre, hosts_requeridos, red_entero: int, prefijo: int):
+        object.__setattr__(self, "nombre", nombre)
+        object.__setattr__(self, "hosts_requeridos", hosts_requeridos)
+        object.__setattr__(self, "red_entero", red_entero)
+        object.__setattr__(self, "prefijo", prefijo)
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("RegistroSubred es inmutable")
+
+    def __delattr__(self, nombre):
+        raise AttributeError("RegistroSubred es inmutable")
+
+    # Valores numéricos derivados
+
+    @property
+    def tam_bloque(self) -> int:
+        return 1 << (32 - self.prefijo)
+
+    @property
+    def broadcast_entero(self) -> int:
+        return self.red_entero + (1 << (32 - self.prefijo)) - 1
+
+    @property
+    def primer_host_entero(self) -> int:
+        return self.red_entero if self.prefijo >= 31 else self.red_entero + 1
+
+    @property
+    def ultimo_host_entero(self) -> int:
+        # /32: el único host es la red; /31 (RFC 3021): ambas direcciones
+        if self.prefijo == 32:
+            return self.red_entero
+        if self.prefijo == 31:
+            return self.red_entero + 1
+        return self.broadcast_entero - 1
+
+    @property
+    def hosts_validos(self) -> int:
+        if self.prefijo >= 31:
+            return 1 << (32 - self.prefijo)
+        return (1 << (32 - self.prefijo)) - 2
+
+    @property
+    def desperdicio(self) -> int:
+        return 2 if self.prefijo < 31 else 0
+
+    def __getitem__(self, clave):
+        try:
+            calcular = _CAMPOS[clave]
+        except KeyError:
+            raise KeyError(clave) from None
+        return calcular(self)
+
+    def __iter__(self):
+        return iter(self.CAMPOS)
+
+    def __len__(self):
+        return len(self.CAMPOS)
+
+    def __contains__(self, clave):
+        return clave in self.CAMPOS
+
+    def __hash__(self):
+        return hash((self.nombre, self.hosts_requeridos, self.red_entero, self.prefijo))
+
+    def __repr__(self):
+        return (f"RegistroSubred({self.nombre!r}, {self.hosts_requeridos!r}, "
+                f"'{entero_a_ip(self.red_entero)}/{self.prefijo}')")
+
+    def __reduce__(self):
+        return (RegistroSubred, (self.nombre, self.hosts_requeridos,
+                                 self.red_entero, self.prefijo))
+
+
+# Cálculo de cada campo al consultarlo (los textos no se guardan)
+_CAMPOS = {
+    "nombre": lambda r: r.nombre,
+    "hosts_requeridos": lambda r: r.hosts_requeridos,
+    "red": lambda r: entero_a_ip(r.red_entero),
+    "prefijo": lambda r: r.prefijo,
+    "mascara": lambda r: _MASCARAS_TEXTO[r.prefijo],
+    "broadcast": lambda r: entero_a_ip(r.broadcast_entero),
+    "primer_host": lambda r: entero_a_ip(r.primer_host_entero),
+    "ultimo_host": lambda r: entero_a_ip(r.ultimo_host_entero),
+    "hosts_validos": lambda r: r.hosts_validos,
+    "tam_bloque": lambda r: r.tam_bloque,
+    "desperdicio": lambda r: r.desperdicio,
+    "rango_hosts": lambda r: (f"{entero_a_ip(r.primer_host_entero)} - "
+                              f"{entero_a_ip(r.ultimo_host_entero)}"),
+    "notacion_cidr": lambda r: f"{entero_a_ip(r.red_entero)}/{r.prefijo}",
+}
+
+
+class RegistroSubred6(RegistroSubred):
+    """
+    RegistroSubred de una subred IPv6 (red_entero de 128 bits). Tiene las
+    mismas claves; como IPv6 no tiene broadcast, todas las direcciones del
+    bloque son hosts válidos, "broadcast" es la última dirección y no hay
+    desperdicio de red/broadcast.
+    """
+
+    __slots__ = ()
+
+    bits = 128
+
+    @property
+    def tam_bloque(self) -> int:
+        return 1 << (128 - self.prefijo)
+
+    @property
+    def broadcast_entero(self) -> int:
+        return self.red_entero + (1 << (128 - self.prefijo)) - 1
+
+    @property
+    def primer_host_entero(self) -> int:
+        return self.red_entero
+
+    @property
+    def ultimo_host_entero(self) -> int:
+        return self.broadcast_entero
+
+    @property
+    def hosts_validos(self) -> int:
+        return 1 << (128 - self.prefijo)
+
+    @property
+    def desperdicio(self) -> int:
+        return 0
+
+    def __getitem__(self, clave):
+        try:
+            calcular = _CAMPOS6[clave]
+        except KeyError:
+            raise KeyError(clave) from None
+        return calcular(self)
+
+    def __repr__(self):
+        return (f"RegistroSubred6({self.nombre!r}, {self.hosts_requeridos!r}, "
+                f"'{entero_a_ipv6(self.red_entero)}/{self.prefijo}')")
+
+    def __reduce__(self):
+        return (RegistroSubred6, (self.nombre, self.hosts_requeridos,
+                                  self.red_entero, self.prefijo))
+
+
+_CAMPOS6 = dict(_CAMPOS)
+_CAMPOS6.update({
+    "red": lambda r: entero_a_ipv6(r.red_entero),
+    "mascara": lambda r: prefijo_a_mascara_v6(r.prefijo),
+    "broadcast": lambda r: entero_a_ipv6(r.broadcast_entero),
+    "primer_host": lambda r: entero_a_ipv6(r.primer_host_entero),
+    "ultimo_host": lambda r: entero_a_ipv6(r.ultimo_host_entero),
+    "rango_hosts": lambda r: (f"{entero_a_ipv6(r.primer_host_entero)} - "
+                              f"{entero_a_ipv6(r.ultimo_host_entero)}"),
+    "notacion_cidr": lambda r: f"{entero_a_ipv6(r.red_entero)}/{r.prefijo}",
+})
+
+
+def crear_registro(nombre, hosts_requeridos, red_entero: int, prefijo: int,
+                   bits: int = 32) -> RegistroSubred:
+    """
+    Registro de una subred asignada: RegistroSubred para IPv4 (bits=32) o
+    RegistroSubred6 para IPv6 (bits=128). Es la forma única de los
+    resultados de los planes; los mismos cinco valores sirven como tupla
+    para enviar registros entre procesos.
+    """
+    clase = RegistroSubred6 if bits == 128 else RegistroSubred
+    return clase(nombre, hosts_requeridos, red_entero, prefijo)
+
+
+def medir_memoria(cantidad: int = 100000) -> dict:
+    """
+    Mide con tracemalloc los bytes por subred de los dicts con textos que
+    generaba calcular_vlsm contra RegistroSubred.
+    """
+    import tracemalloc
+
+    def medir(fabrica):
+        tracemalloc.start()
+        datos = [fabrica(i) for i in range(cantidad)]
+        actual, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del datos
+        return actual / cantidad
+
+    base = 0x0A000000
+    # Mismo nombre para ambas mediciones: solo se compara el registro
+    nombres = [f"Subred{i}" for i in range(cantidad)]
+
+    # dict(registro) produce exactamente el dict de 13 claves con textos
+    por_dict = medir(lambda i: dict(RegistroSubred(nombres[i], 50, base + 64 * i, 26)))
+    por_registro = medir(lambda i: RegistroSubred(nombres[i], 50, base + 64 * i, 26))
+
+    return {
+        "subredes": cantidad,
+        "bytes_por_dict": por_dict,
+        "bytes_por_registro": por_registro,
+        "ahorro_por_subred": por_dict - por_registro,
+        "proporcion": por_dict / por_registro,
+    }
+
+
+if __name__ == "__main__":
+    resultado = medir_memoria()
+    print(f"Subredes medidas:    {resultado['subredes']}")
+    print(f"Dict con textos:     {resultado['bytes_por_dict']:.0f} bytes por subred")
+    print(f"RegistroSubred:      {resultado['bytes_por_registro']:.0f} bytes por subred")
+    print(f"Ahorro:              {resultado['ahorro_por_subred']:.0f} bytes por subred "
+          f"({resultado['proporcion']:.1f}x menos)")
@@ -0,0 +1,234 @@
+import asyncio
+import bisect
+import functools
+import json
+import time
+
+from cidr_calculator import CACHE_REDES, CalculadoraCIDR
+from lote_vlsm import calcular_plan
+from registro_subred import crear_registro
+
+# Límites superiores (en milisegundos) de cada cubeta del histograma
+CUBETAS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+TAMANO_MAXIMO_CUERPO = 16 * 1024 * 1024
+
+_TEXTOS_ESTADO = {200: "OK", 400: "Bad Request", 404: "Not Found",
+                  405: "Method Not Allowed", 413: "Payload Too Large",
+                  500: "Internal Server Error"}
+
+
+class HistogramaLatencia:
+    """
+    Histograma acumulado de latencias de solicitud.
+    """
+
+    def __init__(self):
+        self.conteos = [0] * (len(CUBETAS_MS) + 1)
+        self.total = 0
+        self.suma_ms = 0.0
+        self.maximo_ms = 0.0
+
+    def observar(self, segundos: float):
+        ms = segundos * 1000
+        self.conteos[bisect.bisect_left(CUBETAS_MS, ms)] += 1
+        self.total += 1
+        self.suma_ms += ms
+        self.maximo_ms = max(self.maximo_ms, ms)
+
+    def a_dict(self) -> dict:
+        cubetas = {f"<={limite}ms": conteo for limite, conteo in zip(CUBETAS_MS, self.conteos)}
+        cubetas[f">{CUBETAS_MS[-1]}ms"] = self.conteos[-1]
+        return {
+            "solicitudes": self.total,
+            "promedio_ms": self.suma_ms / self.total if self.total else 0.0,
+            "maximo_ms": self.maximo_ms,
+            "cubetas": cubetas,
+        }
+
+
+class ServicioCalculadoras:
+    """
+    Servicio HTTP/JSON de larga duración para las calculadoras, sin
+    dependencias fuera de la biblioteca estándar.
+
+    POST /cidr   {"entrada": "IP/prefijo"} o {"entradas": [...]}
+    POST /vlsm   una especificación de plan (ver lote_vlsm.calcular_plan)
+                 o {"planes": [...]}
+    GET  /metricas  histogramas de latencia por ruta y estado de la caché
+    GET  /salud
+
+    Las consultas repetidas se sirven desde una caché LRU de `tam_cache`
+    entradas por calculadora. Los cálculos de /cidr y /vlsm corren en el
+    ejecutor de hilos del loop, para que un plan grande no detenga las
+    demás conexiones.
+    """
+
+    def __init__(self, tam_cache: int = 4096):
+        self._cidr = functools.lru_cache(maxsize=tam_cache)(self._calcular_cidr)
+        self._vlsm = functools.lru_cache(maxsize=tam_cache)(self._calcular_vlsm)
+        self.latencias = {}
+
+    # Cálculos (resultados listos para JSON; no se modifican tras cachearse)
+
+    @staticmethod
+    def _calcular_cidr(entrada: str) -> dict:
+        try:
+            return {"ok": True, **CalculadoraCIDR(entrada).calcular()}
+        except ValueError as e:
+            return {"ok": False, "entrada": entrada, "error": str(e)}
+
+    @staticmethod
+    def _calcular_vlsm(especificacion_json: str) -> dict:
+        resultado = calcular_plan(especificacion_json)
+        if resultado["ok"]:
+            resultado["subredes"] = [dict(crear_registro(*s)) for s in resultado["subredes"]]
+        return resultado
+
+    def atender_cidr(self, cuerpo) -> object:
+        if isinstance(cuerpo, dict) and isinstance(cuerpo.get("entradas"), list):
+            return {"resultados": [self._cidr(str(e)) for e in cuerpo["entradas"]]}
+        if isinstance(cuerpo, dict) and "entrada" in cuerpo:
+            return self._cidr(str(cuerpo["entrada"]))
+        raise ValueError("Se esperaba {\"entrada\": ...} o {\"entradas\": [...]}")
+
+    def atender_vlsm(self, cuerpo) -> object:
+        if not isinstance(cuerpo, dict):
+            raise ValueError("Se esperaba un objeto JSON")
+        if isinstance(cuerpo.get("planes"), list):
+            return {"resultados": [self._vlsm(self._clave(plan)) for plan in cuerpo["planes"]]}
+        return self._vlsm(self._clave(cuerpo))
+
+    @staticmethod
+    def _clave(especificacion) -> str:
+        # Texto JSON canónico: dos especificaciones iguales comparten entrada
+        return json.dumps(especificacion, sort_keys=True, ensure_ascii=False)
+
+    def metricas(self) -> dict:
+        return {
+            "latencias": {ruta: h.a_dict() for ruta, h in self.latencias.items()},
+            "cache": {
+                "cidr": self._cidr.cache_info()._asdict(),
+                "vlsm": self._vlsm.cache_info()._asdict(),
+                "redes": CACHE_REDES.estadisticas(),
+            },
+        }
+
+    # HTTP
+
+    # Ruta -> (método, manejador, si se ejecuta fuera del loop)
+    def _rutas(self) -> dict:
+        return {
+            "/cidr": ("POST", self.atender_cidr, True),
+            "/vlsm": ("POST", self.atender_vlsm, True),
+            "/metricas": ("GET", lambda _: self.metricas(), False),
+            "/salud": ("GET", lambda _: {"ok": True}, False),
+        }
+
+    @staticmethod
+    def _ejecutar(manejador, cuerpo: bytes) -> tuple:
+        try:
+            datos = json.loads(cuerpo) if cuerpo else None
+            return 200, manejador(datos)
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            # Cualquier otro error también recibe respuesta
+            return 500, {"error": f"Error interno: {type(e).__name__}: {e}"}
+
+    async def _despachar(self, metodo: str, ruta: str, cuerpo: bytes) -> tuple:
+        rutas = self._rutas()
+        if ruta not in rutas:
+            return 404, {"error": f"Ruta desconocida: {ruta}"}
+        metodo_esperado, manejador, en_hilo = rutas[ruta]
+        if metodo != metodo_esperado:
+            return 405, {"error": f"Use {metodo_esperado} para {ruta}"}
+
+        if not en_hilo:
+            return self._ejecutar(manejador, cuerpo)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._ejecutar, manejador, cuerpo)
+
+    async def _atender_conexion(self, lector, escritor):
+        try:
+            while True:
+                try:
+                    encabezado = await lector.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+
+                inicio = time.perf_counter()
+                lineas = encabezado.decode("latin-1").split("\r\n")
+                partes = lineas[0].split()
+                if len(partes) != 3:
+                    break
+                metodo, ruta, version = partes
+                ruta = ruta.split("?", 1)[0]
+
+                cabeceras = {}
+                for linea in lineas[1:]:
+                    if ":" in linea:
+                        nombre, valor = linea.split(":", 1)
+                        cabeceras[nombre.strip().lower()] = valor.strip()
+
+                try:
+                    longitud = int(cabeceras.get("content-length", "0") or 0)
+                except ValueError:
+                    break
+                if longitud > TAMANO_MAXIMO_CUERPO:
+                    estado, respuesta = 413, {"error": "Cuerpo demasiado grande"}
+                    cerrar = True
+                else:
+                    cuerpo = await lector.readexactly(longitud) if longitud else b""
+                    estado, respuesta = await self._despachar(metodo, ruta, cuerpo)
+                    conexion = cabeceras.get("connection", "").lower()
+                    cerrar = conexion == "close" or (version == "HTTP/1.0" and conexion != "keep-alive")
+
+                datos = json.dumps(respuesta, ensure_ascii=False).encode("utf-8")
+                escritor.write(
+                    f"HTTP/1.1 {estado} {_TEXTOS_ESTADO[estado]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(datos)}\r\n"
+                    f"Connection: {'close' if cerrar else 'keep-alive'}\r\n\r\n".encode("latin-1")
+                    + datos
+                )
+                await escritor.drain()
+
+                self.latencias.setdefault(ruta if estado != 404 else "otras",
+                                          HistogramaLatencia()).observar(time.perf_counter() - inicio)
+                if cerrar:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 8080):
+        """
+        Inicia el servidor y lo regresa (asyncio.Server). Con puerto=0 el
+        sistema elige un puerto libre: server.sockets[0].getsockname()[1].
+        """
+        return await asyncio.start_server(self._atender_conexion, host, puerto)
+
+
+async def _servir(host: str, puerto: int, tam_cache: int):
+    servicio = ServicioCalculadoras(tam_cache)
+    servidor = await servicio.iniciar(host, puerto)
+    direccion = servidor.sockets[0].getsockname()
+    print(f"Servicio escuchando en http://{direccion[0]}:{direccion[1]}")
+    async with servidor:
+        await servidor.serve_forever()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON de las calculadoras CIDR y VLSM")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8080)
+    parser.add_argument("--cache", type=int, default=4096, help="Entradas de la caché LRU")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_servir(args.host, args.puerto, args.cache))
+    except KeyboardInterrupt:
+        print("\nServicio detenido.")
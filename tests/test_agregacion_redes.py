@@ -0,0 +1,73 @@
+import ipaddress
+import random
+
+import pytest
+
+from agregacion_redes import (colapsar_enteros, colapsar_redes, detectar_solapamientos,
+                              rango_a_prefijos)
+
+
+def _redes_aleatorias(semilla, cantidad, prefijo_minimo=16):
+    aleatorio = random.Random(semilla)
+    redes = []
+    for _ in range(cantidad):
+        prefijo = aleatorio.randint(prefijo_minimo, 32)
+        red = aleatorio.getrandbits(32) >> (32 - prefijo) << (32 - prefijo)
+        redes.append(f"{ipaddress.IPv4Address(red)}/{prefijo}")
+    return redes
+
+
+@pytest.mark.parametrize("semilla, cantidad, prefijo_minimo", [
+    (1, 1, 16), (2, 50, 24), (3, 2000, 16), (4, 2000, 28), (5, 500, 1),
+])
+def test_colapsar_contra_ipaddress(semilla, cantidad, prefijo_minimo):
+    redes = _redes_aleatorias(semilla, cantidad, prefijo_minimo)
+    esperado = [str(r) for r in ipaddress.collapse_addresses(
+        ipaddress.IPv4Network(red) for red in redes)]
+    assert colapsar_redes(redes) == esperado
+
+
+def test_colapsar_contiguas_y_contenidas():
+    redes = ["10.0.0.0/25", "10.0.0.128/25", "10.0.1.0/24", "10.0.0.64/26", "10.0.3.0/24"]
+    assert colapsar_redes(redes) == ["10.0.0.0/23", "10.0.3.0/24"]
+    assert colapsar_enteros([(0x0A000000, 24), (0x0A000100, 24)]) == [(0x0A000000, 23)]
+    assert colapsar_redes([]) == []
+
+
+def test_rango_a_prefijos():
+    assert rango_a_prefijos(0x0A000001, 0x0A000006) == [
+        (0x0A000001, 32), (0x0A000002, 31), (0x0A000004, 31), (0x0A000006, 32)]
+    assert rango_a_prefijos(0, 0xFFFFFFFF) == [(0, 0)]
+    assert rango_a_prefijos(0, (1 << 128) - 1, bits=128) == [(0, 0)]
+
+
+def test_detectar_solapamientos():
+    redes = ["10.0.0.0/16", "10.0.1.0/24", "192.168.0.0/24", "10.0.1.0/24", "10.0.1.128/25"]
+    solapamientos = sorted((s["contenida"], s["contiene"], s["tipo"])
+                           for s in detectar_solapamientos(redes))
+    assert solapamientos == [
+        (1, 0, "contenida"), (3, 0, "contenida"), (3, 1, "igual"),
+        (4, 0, "contenida"), (4, 1, "contenida"), (4, 3, "contenida")]
+
+
+def test_detectar_solapamientos_contra_ipaddress():
+    redes = _redes_aleatorias(9, 300, 8)
+    redes_ip = [ipaddress.IPv4Network(red) for red in redes]
+    esperados = {frozenset((i, j)) for i in range(len(redes)) for j in range(i)
+                 if redes_ip[i].overlaps(redes_ip[j])}
+    encontrados = [frozenset((s["contenida"], s["contiene"])) for s in detectar_solapamientos(redes)]
+    assert len(encontrados) == len(esperados)
+    assert set(encontrados) == esperados
+
+
+@pytest.mark.parametrize("redes, mensaje", [
+    (["10.0.0.0/8", "2001:db8::/32"], "solo admiten redes IPv4"),
+    ([(0x20010DB8 << 96, 32)], "solo admiten redes IPv4"),
+    (["10.0.0.0"], "formato incorrecto"),
+    (["10.0.0.0/8", "10.0.0.300/24"], "Red 2: dirección o prefijo inválido"),
+])
+def test_redes_invalidas(redes, mensaje):
+    with pytest.raises(ValueError, match=mensaje):
+        colapsar_redes(redes)
+    with pytest.raises(ValueError, match=mensaje):
+        detectar_solapamientos(redes)
@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api import calcular_cidr, calcular_vlsm
+from perfilado import Perfilador
+from registro_subred import RegistroSubred6
+
+
+def test_calcular_cidr_es_de_solo_lectura():
+    resultado = calcular_cidr("192.168.1.77/26")
+    assert resultado["red"] == "192.168.1.64"
+    assert resultado["broadcast"] == "192.168.1.127"
+    with pytest.raises(TypeError):
+        resultado["red"] = "10.0.0.0"
+
+
+def test_calcular_vlsm_ipv4():
+    plan = calcular_vlsm("192.168.1.0/24", [("A", 50), {"nombre": "B", "hosts_requeridos": 20}])
+    assert plan.red_base == "192.168.1.0/24"
+    assert [s["notacion_cidr"] for s in plan.subredes] == ["192.168.1.0/26", "192.168.1.64/27"]
+    assert plan.espacio_usado == 96
+    assert plan.espacio_restante == 160
+
+
+def test_calcular_vlsm_ipv4_con_reservas():
+    plan = calcular_vlsm("192.168.1.0/24", [("A", 100)], reservas=["192.168.1.0/25"])
+    assert [s["notacion_cidr"] for s in plan.subredes] == ["192.168.1.128/25"]
+    assert plan.espacio_reservado == 128
+
+
+def test_calcular_vlsm_ipv6():
+    plan = calcular_vlsm("2001:db8::/48", [("A", 100), ("B", 2 ** 70)])
+    assert all(isinstance(s, RegistroSubred6) for s in plan.subredes)
+    assert [s["notacion_cidr"] for s in plan.subredes] == ["2001:db8::/58", "2001:db8:0:40::/64"]
+
+
+def test_calcular_vlsm_sin_espacio():
+    with pytest.raises(ValueError, match="No hay espacio suficiente"):
+        calcular_vlsm("10.0.0.0/30", [("A", 100)])
+
+
+def test_calcular_vlsm_desde_varios_hilos():
+    planes = [("10.0.0.0/16", [(f"S{j}", 10 + i * j) for j in range(20)]) for i in range(16)]
+    planes.append(("2001:db8::/56", [("A", 10), ("B", 1000)]))
+    esperados = [calcular_vlsm(*plan) for plan in planes]
+
+    with ThreadPoolExecutor(max_workers=8) as grupo:
+        for _ in range(5):
+            assert list(grupo.map(lambda plan: calcular_vlsm(*plan), planes)) == esperados
+
+
+def test_perfilador_desde_varios_hilos():
+    perfilador = Perfilador()
+    perfilador.activar()
+
+    def trabajar():
+        for _ in range(500):
+            with perfilador.etapa("etapa"):
+                perfilador.contar("contador")
+
+    hilos = [threading.Thread(target=trabajar) for _ in range(8)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    resumen = perfilador.resumen()
+    assert resumen["etapas"]["etapa"]["llamadas"] == 4000
+    assert resumen["contadores"]["contador"] == 4000
@@ -0,0 +1,83 @@
+import pytest
+
+from asignador_bloques import AsignadorBuddy
+
+BASE = 0x0A000000  # 10.0.0.0/24
+
+
+def test_asignar_en_orden_de_direccion():
+    asignador = AsignadorBuddy(BASE, 24)
+    assert asignador.asignar(26) == BASE
+    assert asignador.asignar(26) == BASE + 64
+    assert asignador.asignar(25) == BASE + 128
+    assert asignador.asignar(30) is None
+    assert asignador.espacio_libre == 0
+
+
+def test_asignar_usa_el_bloque_libre_mas_pequeno():
+    asignador = AsignadorBuddy(BASE, 24)
+    asignador.reservar(BASE, 26)
+    # Quedan libres el /26 en .64 y el /25 en .128: un /27 parte el /26
+    assert asignador.asignar(27) == BASE + 64
+    assert asignador.bloques_libres() == [(BASE + 96, 27), (BASE + 128, 25)]
+
+
+def test_liberar_fusiona_con_su_companero():
+    asignador = AsignadorBuddy(BASE, 24)
+    bloques = [asignador.asignar(26) for _ in range(4)]
+    asignador.liberar(bloques[1], 26)
+    asignador.liberar(bloques[2], 26)
+    # .64 y .128 no son compañeros: no se fusionan
+    assert asignador.bloques_libres() == [(BASE + 64, 26), (BASE + 128, 26)]
+    asignador.liberar(bloques[0], 26)
+    assert asignador.bloques_libres() == [(BASE, 25), (BASE + 128, 26)]
+    asignador.liberar(bloques[3], 26)
+    assert asignador.bloques_libres() == [(BASE, 24)]
+    assert asignador.espacio_libre == asignador.espacio_total == 256
+    assert asignador.fragmentacion()["fragmentacion"] == 0
+
+
+def test_reservar_divide_el_bloque_libre():
+    asignador = AsignadorBuddy(BASE, 24)
+    asignador.reservar(BASE + 64, 26)
+    assert asignador.bloques_libres() == [(BASE, 26), (BASE + 128, 25)]
+    assert asignador.bloque_libre_en(BASE + 70) is None
+    assert asignador.bloque_libre_en(BASE + 200) == (BASE + 128, 25)
+    assert asignador.bloque_mas_grande() == (BASE + 128, 25)
+    assert asignador.cabe(25) and not asignador.cabe(24)
+
+
+@pytest.mark.parametrize("red, prefijo, mensaje", [
+    (BASE + 64, 26, "se solapa"),
+    (BASE + 96, 27, "se solapa"),
+    (BASE, 25, "se solapa"),
+    (BASE + 1, 26, "alineada"),
+    (BASE + 256, 26, "fuera de la red base"),
+    (BASE, 23, "no cabe"),
+])
+def test_reserva_invalida(red, prefijo, mensaje):
+    asignador = AsignadorBuddy(BASE, 24)
+    asignador.reservar(BASE + 64, 26)
+    with pytest.raises(ValueError, match=mensaje):
+        asignador.reservar(red, prefijo)
+
+
+def test_ipv6():
+    base = 0x20010DB8 << 96
+    asignador = AsignadorBuddy(base, 48, 128)
+    assert asignador.asignar(64) == base
+    assert asignador.asignar(56) == base + (1 << 72)
+    assert asignador.espacio_libre == (1 << 80) - (1 << 72) - (1 << 64)
+
+
+def test_monticulos_no_crecen_con_entradas_obsoletas():
+    # Asignar y liberar muchas veces deja entradas obsoletas en los
+    # montículos; _quitar_libre debe reconstruirlos antes de que crezcan
+    asignador = AsignadorBuddy(BASE, 16)
+    bloques = [asignador.asignar(24) for _ in range(128)]
+    for _ in range(200):
+        for red in bloques:
+            asignador.liberar(red, 24)
+        bloques = [asignador.asignar(24) for _ in bloques]
+    for nivel, monticulo in enumerate(asignador._monticulos):
+        assert len(monticulo) <= 2 * len(asignador._libres[nivel]) + 16
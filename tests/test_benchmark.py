@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from benchmark import CASOS, comparar, ejecutar_linea_comandos, ejecutar_suite
+
+
+def test_suite_con_todos_los_casos():
+    resultado = ejecutar_suite(tamanos=(10,), repeticiones=1)
+    assert set(resultado["resultados"]) == {f"{caso}/10" for caso in CASOS}
+    assert all(m["mejor"] >= 0 for m in resultado["resultados"].values())
+    assert resultado["meta"]["semilla"] == 1
+
+
+def test_suite_caso_desconocido():
+    with pytest.raises(ValueError, match="Caso desconocido"):
+        ejecutar_suite(["no_existe"], tamanos=(10,))
+
+
+def _ejecucion(tiempos: dict) -> dict:
+    return {"resultados": {caso: {"mejor": mejor} for caso, mejor in tiempos.items()}}
+
+
+def test_comparar_marca_regresiones():
+    base = _ejecucion({"a/10": 1.0, "b/10": 1.0, "c/10": 1.0})
+    nuevo = _ejecucion({"a/10": 1.1, "b/10": 1.5, "d/10": 1.0})
+    filas = {fila["caso"]: fila for fila in comparar(base, nuevo, umbral=0.15)}
+    assert set(filas) == {"a/10", "b/10", "c/10"}
+    assert not filas["a/10"]["regresion"]
+    assert filas["b/10"]["regresion"]
+    assert filas["b/10"]["cambio"] == pytest.approx(0.5)
+    # Un caso que falta en la ejecución nueva no desaparece del reporte
+    assert filas["c/10"]["faltante"]
+    assert filas["c/10"]["regresion"]
+    assert filas["c/10"]["nuevo"] is None
+
+
+def test_linea_de_comandos_caso_faltante(tmp_path, capsys):
+    base = tmp_path / "base.json"
+    nuevo = tmp_path / "nuevo.json"
+    base.write_text(json.dumps(_ejecucion({"a/10": 1.0, "b/10": 1.0})), encoding="utf-8")
+    nuevo.write_text(json.dumps(_ejecucion({"a/10": 1.0})), encoding="utf-8")
+    assert ejecutar_linea_comandos(["comparar", str(base), str(nuevo)]) == 1
+    assert "FALTANTE" in capsys.readouterr().out
+
+
+def test_linea_de_comandos(tmp_path, capsys):
+    base = tmp_path / "base.json"
+    assert ejecutar_linea_comandos(["ejecutar", "--casos", "ip_a_entero", "--tamanos", "10",
+                                    "--repeticiones", "1", "--salida", str(base)]) == 0
+    resultado = json.loads(base.read_text(encoding="utf-8"))
+    assert list(resultado["resultados"]) == ["ip_a_entero/10"]
+
+    lenta = tmp_path / "lenta.json"
+    medicion = resultado["resultados"]["ip_a_entero/10"]
+    medicion["mejor"] = medicion["mejor"] * 10 + 1
+    lenta.write_text(json.dumps(resultado), encoding="utf-8")
+    assert ejecutar_linea_comandos(["comparar", str(base), str(base)]) == 0
+    assert ejecutar_linea_comandos(["comparar", str(base), str(lenta)]) == 1
+    assert "REGRESIÓN" in capsys.readouterr().out
@@ -0,0 +1,48 @@
+import io
+import json
+
+from cidr_calculator import CAMPOS_LOTE, CalculadoraCIDR
+
+LINEAS = [
+    "10.0.0.1/24",
+    "2001:db8::1/64",
+    "",
+    "192.168.1.5 255.255.255.0",
+    "2001:db8::/129",
+    "fe80::1/10",
+    "texto",
+    "1.2.3.4/32",
+    "::/0",
+]
+
+
+def _procesar(formato: str) -> tuple:
+    salida = io.StringIO()
+    entrada = io.BytesIO("".join(linea + "\n" for linea in LINEAS).encode("ascii"))
+    estadisticas = CalculadoraCIDR().procesar_flujo(entrada, salida, formato, lineas_por_bloque=4)
+    return estadisticas, salida.getvalue().splitlines()
+
+
+def test_lote_ipv4_e_ipv6_en_orden():
+    estadisticas, filas = _procesar("jsonl")
+    assert (estadisticas["procesadas"], estadisticas["rechazadas"]) == (6, 2)
+
+    esperadas = [CalculadoraCIDR(linea).calcular() for linea in LINEAS
+                 if linea and linea not in ("2001:db8::/129", "texto")]
+    obtenidas = [json.loads(fila) for fila in filas]
+    assert obtenidas == [{campo: esperada[campo] for campo in CAMPOS_LOTE} for esperada in esperadas]
+
+
+def test_lote_csv():
+    _, filas = _procesar("csv")
+    assert filas[0] == ",".join(CAMPOS_LOTE)
+    assert filas[2].startswith("2001:db8::1,64,ffff:ffff:ffff:ffff::,2001:db8::,")
+    assert len(filas) == 7
+
+
+def test_calcular_lote_separa_ipv6():
+    lote = CalculadoraCIDR().calcular_lote([b"10.0.0.1/8", b"::1/128", b"10.0.0.2/8"])
+    assert lote["posicion"].tolist() == [0, 2]
+    [(posicion, resultado)] = lote["ipv6"]
+    assert posicion == 1
+    assert resultado["notacion_cidr"] == "::1/128"
@@ -0,0 +1,106 @@
+import pytest
+
+from diferencias import TIPOS_CAMBIO, comparar_planes, resumen
+from ip_utils import ip_a_entero
+from registro_subred import crear_registro
+from vlsm_calculator import CalculadoraVLSM
+
+
+def _plan(*subredes):
+    return [{"nombre": nombre, "red": red, "prefijo": prefijo, "hosts_requeridos": hosts}
+            for nombre, red, prefijo, hosts in subredes]
+
+
+ANTERIOR = _plan(
+    ("igual", "10.0.0.0", 26, 50),
+    ("movida", "10.0.0.64", 27, 20),
+    ("crece", "10.0.0.96", 28, 10),
+    ("crece_y_se_mueve", "10.0.0.112", 28, 10),
+    ("reduce", "10.0.0.128", 26, 50),
+    ("nombre_viejo", "10.0.0.192", 28, 10),
+    ("borrada", "10.0.0.208", 28, 10),
+    ("desplazada", "10.0.0.224", 28, 10),
+)
+NUEVO = _plan(
+    ("igual", "10.0.0.0", 26, 50),
+    ("movida", "10.1.0.0", 27, 20),
+    ("crece", "10.0.0.96", 27, 20),
+    ("crece_y_se_mueve", "10.1.0.64", 27, 20),
+    ("reduce", "10.0.0.128", 27, 20),
+    ("nombre_nuevo", "10.0.0.192", 28, 10),
+    ("agregada", "10.0.0.224", 27, 20),
+)
+
+
+def test_cada_tipo_de_cambio():
+    cambios = comparar_planes(ANTERIOR, NUEVO)
+    assert cambios["sin_cambios"] == 1
+    assert cambios["movidas"] == [{"nombre": "movida", "anterior": "10.0.0.64/27",
+                                   "nueva": "10.1.0.0/27", "hosts_anterior": 20,
+                                   "hosts_nuevo": 20}]
+    assert [(c["nombre"], c["anterior"], c["nueva"], c["movida"]) for c in cambios["crecidas"]] == [
+        ("crece", "10.0.0.96/28", "10.0.0.96/27", False),
+        ("crece_y_se_mueve", "10.0.0.112/28", "10.1.0.64/27", True)]
+    assert [(c["nombre"], c["nueva"], c["movida"]) for c in cambios["reducidas"]] == [
+        ("reduce", "10.0.0.128/27", False)]
+    assert cambios["renombradas"] == [{"nombre_anterior": "nombre_viejo", "nombre": "nombre_nuevo",
+                                       "red": "10.0.0.192/28", "hosts_anterior": 10,
+                                       "hosts_nuevo": 10}]
+    assert cambios["nuevas"] == [{"nombre": "agregada", "red": "10.0.0.224/27", "hosts": 20,
+                                  "ocupaba": ["desplazada"]}]
+    assert [c["nombre"] for c in cambios["eliminadas"]] == ["borrada", "desplazada"]
+
+
+def test_resumen():
+    assert resumen(comparar_planes(ANTERIOR, NUEVO)) == {
+        "nuevas": 1, "eliminadas": 2, "movidas": 1, "crecidas": 2, "reducidas": 1,
+        "renombradas": 1, "sin_cambios": 1}
+
+
+def test_planes_iguales_y_vacios():
+    cambios = comparar_planes(ANTERIOR, list(reversed(ANTERIOR)))
+    assert cambios["sin_cambios"] == len(ANTERIOR)
+    assert not any(cambios[tipo] for tipo in TIPOS_CAMBIO)
+
+    assert len(comparar_planes([], NUEVO)["nuevas"]) == len(NUEVO)
+    assert len(comparar_planes(ANTERIOR, [])["eliminadas"]) == len(ANTERIOR)
+
+
+def test_registros_y_dicts_dan_lo_mismo():
+    registros = [crear_registro(r["nombre"], r["hosts_requeridos"], ip_a_entero(r["red"]),
+                                r["prefijo"]) for r in NUEVO]
+    assert comparar_planes(ANTERIOR, registros) == comparar_planes(ANTERIOR, NUEVO)
+
+
+def test_desde_calculadoras():
+    def calcular(subredes):
+        calculadora = CalculadoraVLSM()
+        calculadora.configurar_red_base("192.168.1.0/24")
+        for nombre, hosts in subredes:
+            calculadora.agregar_subred(nombre, hosts)
+        calculadora.calcular_vlsm()
+        return calculadora
+
+    anterior = calcular([("A", 50), ("B", 20)])
+    nuevo = calcular([("A", 50), ("B", 50)])
+    cambios = comparar_planes(anterior, nuevo)
+    assert cambios["sin_cambios"] == 1
+    assert [(c["nombre"], c["anterior"], c["nueva"]) for c in cambios["crecidas"]] == [
+        ("B", "192.168.1.64/27", "192.168.1.64/26")]
+
+
+def test_ipv6():
+    anterior = _plan(("A", "2001:db8::", 64, 100), ("B", "2001:db8:0:1::", 64, 100))
+    nuevo = _plan(("A", "2001:db8::", 63, 2 ** 64 + 1), ("C", "2001:db8:0:2::", 64, 100))
+    cambios = comparar_planes(anterior, nuevo)
+    assert cambios["crecidas"][0]["nueva"] == "2001:db8::/63"
+    assert cambios["nuevas"] == [{"nombre": "C", "red": "2001:db8:0:2::/64", "hosts": 100,
+                                  "ocupaba": []}]
+    assert cambios["eliminadas"] == [{"nombre": "B", "red": "2001:db8:0:1::/64", "hosts": 100}]
+
+
+def test_versiones_mezcladas():
+    with pytest.raises(ValueError, match="misma versión de IP"):
+        comparar_planes(ANTERIOR, _plan(("A", "2001:db8::", 64, 100)))
+    with pytest.raises(ValueError, match="misma versión de IP"):
+        comparar_planes(ANTERIOR + _plan(("A", "2001:db8::", 64, 100)), NUEVO)
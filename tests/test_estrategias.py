@@ -0,0 +1,102 @@
+import ipaddress
+import random
+
+import pytest
+
+from estrategias import ESTRATEGIAS, asignar, es_factible, verificar_factibilidad
+from vlsm_calculator import CalculadoraVLSM
+
+
+def _calculadora(red_base, subredes, reservas=()):
+    calculadora = CalculadoraVLSM()
+    calculadora.configurar_red_base(red_base)
+    for reserva in reservas:
+        calculadora.reservar_red(reserva)
+    for nombre, hosts in subredes:
+        calculadora.agregar_subred(nombre, hosts)
+    return calculadora
+
+
+def _reservas_aleatorias(aleatorio, base, cantidad):
+    # Bloques alineados dentro de la red base que no se solapan entre sí
+    reservas = []
+    for _ in range(cantidad):
+        candidata = ipaddress.ip_network(
+            (int(base.network_address) + aleatorio.randrange(base.num_addresses),
+             aleatorio.randint(base.prefixlen + 1, base.max_prefixlen)), strict=False)
+        if not any(candidata.overlaps(r) for r in reservas):
+            reservas.append(candidata)
+    return [str(r) for r in reservas]
+
+
+def _calcula(calculadora) -> bool:
+    try:
+        calculadora.calcular_vlsm()
+    except ValueError as e:
+        assert "No hay espacio suficiente" in str(e)
+        return False
+    return True
+
+
+@pytest.mark.parametrize("red_base, con_reservas", [
+    ("10.0.0.0/22", False), ("10.0.0.0/22", True),
+    ("2001:db8::/60", False), ("2001:db8::/60", True),
+])
+def test_factibilidad_coincide_con_calcular_vlsm(red_base, con_reservas):
+    aleatorio = random.Random(11)
+    base = ipaddress.ip_network(red_base)
+    factibles = 0
+    for caso in range(300):
+        reservas = []
+        if con_reservas:
+            reservas = _reservas_aleatorias(aleatorio, base, aleatorio.randint(1, 6))
+        subredes = [(f"S{i}", aleatorio.randint(1, base.num_addresses // 4))
+                    for i in range(aleatorio.randint(1, 12))]
+        calculadora = _calculadora(red_base, subredes, reservas)
+        factibilidad = verificar_factibilidad(calculadora)
+        assert factibilidad["factible"] == _calcula(calculadora), (caso, reservas, subredes)
+        assert es_factible(calculadora) == factibilidad["factible"]
+        assert (factibilidad["prefijo_sin_espacio"] is None) == factibilidad["factible"]
+        factibles += factibilidad["factible"]
+    # Que haya casos de los dos lados
+    assert 0 < factibles < 300
+
+
+def test_factibilidad_detalle():
+    calculadora = _calculadora("192.168.1.0/24", [("A", 100), ("B", 100), ("C", 2)],
+                               reservas=["192.168.1.0/26"])
+    assert verificar_factibilidad(calculadora) == {
+        "factible": False, "espacio_requerido": 260, "espacio_libre": 192,
+        "prefijo_sin_espacio": 25}
+
+    calculadora = _calculadora("192.168.1.0/24", [("A", 1000)])
+    assert verificar_factibilidad(calculadora)["prefijo_sin_espacio"] == 22
+
+
+@pytest.mark.parametrize("estrategia", list(ESTRATEGIAS))
+def test_estrategias(estrategia):
+    calculadora = _calculadora("10.0.0.0/24", [("A", 100), ("B", 50), ("C", 50), ("D", 10)],
+                               reservas=["10.0.0.64/26"])
+    resultado = asignar(calculadora, estrategia)
+    asignadas = resultado["asignadas"]
+    redes = [ipaddress.ip_network(r["notacion_cidr"]) for r in asignadas]
+    ocupadas = sorted(redes + [ipaddress.ip_network("10.0.0.64/26")])
+    assert not any(a.overlaps(b) for a, b in zip(ocupadas, ocupadas[1:]))
+    assert len(asignadas) + len(resultado["sin_asignar"]) == 4
+    assert resultado["hosts_sin_usar"] == sum(r.tam_bloque - r.hosts_requeridos for r in asignadas)
+    assert resultado["espacio_restante"] == 192 - sum(r.tam_bloque for r in asignadas)
+    assert calculadora.resultados == []
+
+
+def test_maximizar_asigna_el_mayor_numero_de_subredes():
+    calculadora = _calculadora("10.0.0.0/24", [("A", 200), ("B", 60), ("C", 60), ("D", 60)])
+    assert [r["nombre"] for r in asignar(calculadora, "alineado")["asignadas"]] == ["A"]
+    resultado = asignar(calculadora, "maximizar")
+    assert sorted(r["nombre"] for r in resultado["asignadas"]) == ["B", "C", "D"]
+    assert [s["nombre"] for s in resultado["sin_asignar"]] == ["A"]
+    assert resultado["hosts_sin_usar"] == 3 * (64 - 60)
+
+
+def test_estrategia_desconocida():
+    with pytest.raises(ValueError, match="Estrategia desconocida"):
+        asignar(_calculadora("10.0.0.0/24", [("A", 10)]), "otra")
@@ -0,0 +1,70 @@
+import io
+
+from importador_config import ImportadorConfig
+from ip_utils import ip_a_entero, ipv6_a_entero
+from vlsm_calculator import CalculadoraVLSM
+
+CONFIGURACION = b"""\
+interface Gi0/1
+ ip address 10.1.2.1 255.255.255.0
+ ip address 10.1.3.1 255.255.255.0 secondary
+ ipv6 address 2001:db8:0:1::1/64
+ ipv6 address FE80::1 link-local
+interface Gi0/2
+ ipv6 address 2001:DB8:0:2::1/64 eui-64
+ ipv6 address 2001:db8::1/129
+set interfaces ge-0/0/0 unit 0 family inet address 10.1.2.2/24;
+set interfaces ge-0/0/0 unit 0 family inet6 address 2001:db8:0:1::2/64;
+ip route 10.9.0.0/16 Null0
+ip route 2001:db8:ff::/48 Null0
+description address
+10.7.0.1 255.255.255.0
+"""
+
+
+def _importar(cualquier_linea=False) -> ImportadorConfig:
+    importador = ImportadorConfig(cualquier_linea)
+    for _ in importador.procesar(io.BytesIO(CONFIGURACION)):
+        pass
+    return importador
+
+
+def test_redes_de_interfaz_ipv4_e_ipv6():
+    importador = _importar()
+    assert importador.redes_ordenadas() == [(ip_a_entero("10.1.2.0"), 24),
+                                            (ip_a_entero("10.1.3.0"), 24)]
+    assert importador.redes_ordenadas(128) == [(ipv6_a_entero("2001:db8:0:1::"), 64),
+                                               (ipv6_a_entero("2001:db8:0:2::"), 64)]
+    estadisticas = importador.estadisticas()
+    assert estadisticas["coincidencias"] == 7
+    assert estadisticas["invalidas"] == 1
+    assert (estadisticas["redes"], estadisticas["redes6"]) == (2, 2)
+
+
+def test_procesar_entrega_la_version():
+    redes = list(ImportadorConfig().procesar(io.BytesIO(CONFIGURACION)))
+    assert [bits for _, _, bits in redes] == [32, 32, 128, 128]
+
+
+def test_cualquier_linea():
+    importador = _importar(cualquier_linea=True)
+    assert (ip_a_entero("10.9.0.0"), 16) in importador.redes
+    assert (ipv6_a_entero("2001:db8:ff::"), 48) in importador.redes6
+
+
+def test_reservar_en_ipv4_e_ipv6():
+    importador = _importar()
+
+    calculadora = CalculadoraVLSM()
+    calculadora.configurar_red_base("10.1.0.0/16")
+    assert importador.reservar_en(calculadora) == 2
+    calculadora.agregar_subred("A", 200)
+    assert calculadora.calcular_vlsm()[0]["notacion_cidr"] == "10.1.0.0/24"
+
+    calculadora6 = CalculadoraVLSM()
+    calculadora6.configurar_red_base("2001:db8::/56")
+    assert importador.reservar_en(calculadora6) == 2
+    calculadora6.agregar_subred("A", 10)
+    calculadora6.agregar_subred("B", 10)
+    assert [r["notacion_cidr"] for r in calculadora6.calcular_vlsm()] == [
+        "2001:db8::/64", "2001:db8:0:3::/64"]
@@ -0,0 +1,108 @@
+import ipaddress
+import random
+
+import numpy as np
+import pytest
+
+from indice_prefijos import IndicePrefijos
+from vlsm_calculator import CalculadoraVLSM
+
+# Redes anidadas: una /16 con una /24 dentro, y dentro de ésta una /26 y una /30
+ANIDADAS = [
+    {"nombre": "campus", "red": "10.1.0.0", "prefijo": 16},
+    {"nombre": "edificio", "red": "10.1.2.0", "prefijo": 24},
+    {"nombre": "piso", "red": "10.1.2.64", "prefijo": 26},
+    {"nombre": "enlace", "red": "10.1.2.100", "prefijo": 30},
+    {"nombre": "otro", "red": "192.168.0.0", "prefijo": 24},
+]
+
+
+def _lpm(redes, ip):
+    # Referencia: la red más larga que contiene la IP, con ipaddress
+    direccion = ipaddress.ip_address(ip)
+    candidatas = [(r["prefijo"], i) for i, r in enumerate(redes)
+                  if direccion in ipaddress.ip_network(f"{r['red']}/{r['prefijo']}")]
+    return max(candidatas)[1] if candidatas else -1
+
+
+@pytest.mark.parametrize("ip, nombre", [
+    ("10.1.0.1", "campus"),
+    ("10.1.2.1", "edificio"),
+    ("10.1.2.64", "piso"),
+    ("10.1.2.99", "piso"),
+    ("10.1.2.101", "enlace"),
+    ("10.1.2.104", "piso"),
+    ("10.1.2.128", "edificio"),
+    ("10.1.3.0", "campus"),
+    ("10.1.255.255", "campus"),
+    ("192.168.0.7", "otro"),
+    ("10.2.0.0", None),
+    ("0.0.0.0", None),
+    ("255.255.255.255", None),
+])
+def test_prefijo_mas_largo_con_redes_anidadas(ip, nombre):
+    indice = IndicePrefijos(ANIDADAS)
+    registro = indice.buscar(ip)
+    assert (registro["nombre"] if registro else None) == nombre
+
+
+def test_contra_ipaddress_aleatorio():
+    aleatorio = random.Random(7)
+    redes = []
+    for i in range(200):
+        prefijo = aleatorio.randint(8, 30)
+        red = aleatorio.getrandbits(32) >> (32 - prefijo) << (32 - prefijo)
+        redes.append({"nombre": f"R{i}", "red": str(ipaddress.IPv4Address(red)), "prefijo": prefijo})
+    indice = IndicePrefijos(redes)
+    ips = [str(ipaddress.IPv4Address(aleatorio.getrandbits(32))) for _ in range(500)]
+    ips += [r["red"] for r in redes]
+    esperados = [_lpm(redes, ip) for ip in ips]
+    assert [indice.buscar_indice(ip) for ip in ips] == esperados
+    assert indice.buscar_lote(ips).tolist() == esperados
+
+
+@pytest.mark.parametrize("ip", [-1, 1 << 32, 1 << 40, "2001:db8::1"])
+def test_fuera_del_espacio_de_direcciones(ip):
+    assert IndicePrefijos(ANIDADAS).buscar_indice(ip) == -1
+
+
+def test_lotes():
+    indice = IndicePrefijos(ANIDADAS)
+    ips = ["10.1.2.101", "no es ip", "10.9.0.0", "192.168.0.1"]
+    assert indice.buscar_lote(ips).tolist() == [3, -1, -1, 4]
+    assert indice.nombres_lote(ips) == ["enlace", None, None, "otro"]
+    enteros = np.array([0x0A010201, 0x0A010240], dtype=np.int64)
+    assert indice.buscar_lote(enteros).tolist() == [1, 2]
+
+
+def test_desde_calculadora():
+    calculadora = CalculadoraVLSM()
+    calculadora.configurar_red_base("192.168.1.0/24")
+    calculadora.agregar_subred("A", 50)
+    calculadora.agregar_subred("B", 100)
+    calculadora.calcular_vlsm()
+    indice = IndicePrefijos.desde_calculadora(calculadora)
+    assert indice.buscar("192.168.1.10")["nombre"] == "B"
+    assert indice.buscar("192.168.1.130")["nombre"] == "A"
+    assert indice.buscar("192.168.1.200") is None
+
+
+def test_ipv6():
+    indice = IndicePrefijos([
+        {"nombre": "sitio", "red": "2001:db8::", "prefijo": 48},
+        {"nombre": "lan", "red": "2001:db8:0:1::", "prefijo": 64},
+    ])
+    assert indice.bits == 128
+    assert indice.buscar("2001:db8:0:1::5")["nombre"] == "lan"
+    assert indice.buscar("2001:db8:0:2::5")["nombre"] == "sitio"
+    assert indice.buscar("2001:db9::") is None
+    assert indice.buscar_indice("10.1.2.3") == -1
+    assert indice.buscar_indice(1 << 128) == -1
+    with pytest.raises(ValueError, match="solo admite índices de redes IPv4"):
+        indice.buscar_lote(["2001:db8::1"])
+
+
+def test_versiones_mezcladas():
+    with pytest.raises(ValueError, match="misma versión de IP"):
+        IndicePrefijos([{"nombre": "a", "red": "10.0.0.0", "prefijo": 8},
+                        {"nombre": "b", "red": "2001:db8::", "prefijo": 32}])
@@ -0,0 +1,63 @@
+import json
+
+from lote_vlsm import _calcular_plan_json, calcular_plan, calcular_planes
+from registro_subred import RegistroSubred, RegistroSubred6
+
+PLAN_IPV4 = {"id": 1, "red_base": "192.168.1.0/24",
+             "subredes": [{"nombre": "A", "hosts_requeridos": 50},
+                          {"nombre": "B", "hosts_requeridos": 20}]}
+PLAN_IPV6 = {"id": 2, "red_base": "2001:db8::/48",
+             "subredes": [{"nombre": "A", "hosts_requeridos": 100},
+                          {"nombre": "B", "hosts_requeridos": 5}]}
+PLAN_SIN_ESPACIO = {"id": 3, "red_base": "10.0.0.0/30",
+                    "subredes": [{"nombre": "A", "hosts_requeridos": 100}]}
+
+
+def test_calcular_plan_ipv4():
+    resultado = calcular_plan(PLAN_IPV4)
+    assert resultado["ok"]
+    assert resultado["subredes"] == [("A", 50, 0xC0A80100, 26, 32), ("B", 20, 0xC0A80140, 27, 32)]
+    assert resultado["espacio_usado"] == 96
+
+
+def test_calcular_plan_acepta_texto_json():
+    assert calcular_plan(json.dumps(PLAN_IPV4)) == calcular_plan(PLAN_IPV4)
+
+
+def test_calcular_planes_ipv4_e_ipv6():
+    ipv4, ipv6 = calcular_planes([PLAN_IPV4, PLAN_IPV6], procesos=1)
+
+    assert [type(r) for r in ipv4["subredes"]] == [RegistroSubred, RegistroSubred]
+    assert [r["notacion_cidr"] for r in ipv4["subredes"]] == ["192.168.1.0/26", "192.168.1.64/27"]
+
+    assert [type(r) for r in ipv6["subredes"]] == [RegistroSubred6, RegistroSubred6]
+    assert [r["notacion_cidr"] for r in ipv6["subredes"]] == ["2001:db8::/64", "2001:db8:0:1::/64"]
+
+
+def test_un_plan_invalido_no_detiene_el_lote():
+    resultados = list(calcular_planes([PLAN_IPV4, PLAN_SIN_ESPACIO, {"id": 4}, PLAN_IPV6],
+                                      procesos=1))
+    assert [r["id"] for r in resultados] == [1, 3, 4, 2]
+    assert [r["ok"] for r in resultados] == [True, False, False, True]
+    assert "No hay espacio suficiente" in resultados[1]["error"]
+    assert resultados[2]["error"].startswith("Especificación inválida")
+
+
+def test_calcular_planes_en_procesos_conserva_el_orden():
+    especificaciones = [dict(PLAN_IPV4, id=i) for i in range(6)] + [PLAN_IPV6]
+    resultados = list(calcular_planes(especificaciones, procesos=2, tam_lote=2))
+    assert [r["id"] for r in resultados] == list(range(6)) + [2]
+    assert resultados[-1]["subredes"][0]["red"] == "2001:db8::"
+
+
+def test_calcular_plan_json_ipv6():
+    ok, linea = _calcular_plan_json(json.dumps(PLAN_IPV6))
+    assert ok
+    resultado = json.loads(linea)
+    assert [s["notacion_cidr"] for s in resultado["subredes"]] == ["2001:db8::/64", "2001:db8:0:1::/64"]
+
+
+def test_calcular_plan_json_error():
+    ok, linea = _calcular_plan_json(PLAN_SIN_ESPACIO)
+    assert not ok
+    assert json.loads(linea)["id"] == 3
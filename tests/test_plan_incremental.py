@@ -0,0 +1,87 @@
+import pytest
+
+from plan_incremental import PlanIncremental
+from registro_subred import RegistroSubred6
+
+
+def _cidrs(plan):
+    return {r["nombre"]: r["notacion_cidr"] for r in plan.resultados()}
+
+
+def test_agregar_y_eliminar():
+    plan = PlanIncremental("192.168.1.0/24")
+    cambios = plan.agregar("A", 50)
+    assert cambios == [{"accion": "agregada", "nombre": "A", "red": 0xC0A80100, "prefijo": 26}]
+    plan.agregar("B", 20)
+    assert _cidrs(plan) == {"A": "192.168.1.0/26", "B": "192.168.1.64/27"}
+    assert plan.espacio_restante == 256 - 96
+
+    assert plan.eliminar("A")[0]["accion"] == "eliminada"
+    assert "A" not in plan and len(plan) == 1
+    # El bloque liberado vuelve a usarse
+    plan.agregar("C", 60)
+    assert _cidrs(plan)["C"] == "192.168.1.0/26"
+
+
+def test_redimensionar_en_el_mismo_lugar():
+    plan = PlanIncremental("10.0.0.0/24")
+    plan.agregar("A", 50)  # 10.0.0.0/26, su compañero .64/26 sigue libre
+    plan.agregar("B", 100)  # 10.0.0.128/25
+    cambios = plan.redimensionar("A", 120)
+    assert cambios == [{"accion": "redimensionada", "nombre": "A",
+                        "red": 0x0A000000, "prefijo": 25,
+                        "red_anterior": 0x0A000000, "prefijo_anterior": 26}]
+    assert _cidrs(plan) == {"A": "10.0.0.0/25", "B": "10.0.0.128/25"}
+
+
+def test_redimensionar_moviendo_la_subred():
+    plan = PlanIncremental("10.0.0.0/24")
+    plan.agregar("A", 50)  # 10.0.0.0/26
+    plan.agregar("B", 50)  # 10.0.0.64/26: ocupa el compañero de A
+    cambios = plan.redimensionar("A", 120)
+    assert cambios[0]["accion"] == "movida"
+    assert (cambios[0]["red_anterior"], cambios[0]["prefijo_anterior"]) == (0x0A000000, 26)
+    assert _cidrs(plan) == {"A": "10.0.0.128/25", "B": "10.0.0.64/26"}
+
+
+def test_redimensionar_sin_cambio_de_bloque():
+    plan = PlanIncremental("10.0.0.0/24")
+    plan.agregar("A", 50)
+    assert plan.redimensionar("A", 60) == []
+    assert plan.resultado("A")["hosts_requeridos"] == 60
+
+
+def test_redimensionar_sin_espacio_conserva_la_subred():
+    plan = PlanIncremental("10.0.0.0/24")
+    plan.agregar("A", 50)
+    plan.agregar("B", 100)
+    with pytest.raises(ValueError, match="No hay espacio suficiente"):
+        plan.redimensionar("A", 250)
+    assert _cidrs(plan) == {"A": "10.0.0.0/26", "B": "10.0.0.128/25"}
+    assert plan.espacio_restante == 64
+
+
+def test_respeta_las_reservas():
+    plan = PlanIncremental("10.0.0.0/24", reservas=["10.0.0.0/25"])
+    plan.agregar("A", 100)
+    assert _cidrs(plan) == {"A": "10.0.0.128/25"}
+    with pytest.raises(ValueError, match="No hay espacio suficiente"):
+        plan.agregar("B", 2)
+
+
+@pytest.mark.parametrize("operacion", ["eliminar", "redimensionar", "resultado"])
+def test_subred_inexistente(operacion):
+    plan = PlanIncremental("10.0.0.0/24")
+    argumentos = ("X", 10) if operacion == "redimensionar" else ("X",)
+    with pytest.raises(ValueError, match="No existe la subred 'X'"):
+        getattr(plan, operacion)(*argumentos)
+
+
+def test_ipv6():
+    plan = PlanIncremental("2001:db8::/48")
+    plan.agregar("A", 100)
+    plan.agregar("B", 2 ** 65)
+    assert all(type(r) is RegistroSubred6 for r in plan.resultados())
+    assert _cidrs(plan) == {"A": "2001:db8::/64", "B": "2001:db8:0:2::/63"}
+    assert plan.redimensionar("A", 2 ** 64 + 1)[0]["accion"] == "redimensionada"
+    assert _cidrs(plan)["A"] == "2001:db8::/63"
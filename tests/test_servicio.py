@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+from servicio import ServicioCalculadoras
+
+
+async def _peticion(puerto: int, metodo: str, ruta: str, cuerpo=None) -> tuple:
+    datos = b"" if cuerpo is None else json.dumps(cuerpo).encode("utf-8")
+    lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: prueba\r\nConnection: close\r\n"
+                   f"Content-Length: {len(datos)}\r\n\r\n".encode("latin-1") + datos)
+    await escritor.drain()
+    respuesta = await lector.read()
+    escritor.close()
+    encabezado, _, contenido = respuesta.partition(b"\r\n\r\n")
+    return int(encabezado.split()[1]), json.loads(contenido)
+
+
+def _servir(servicio: ServicioCalculadoras, peticiones: list) -> list:
+    """
+    Inicia el servicio en un puerto libre, envía las peticiones
+    (metodo, ruta, cuerpo) en orden y regresa las respuestas (estado, json).
+    """
+    async def principal():
+        servidor = await servicio.iniciar(puerto=0)
+        puerto = servidor.sockets[0].getsockname()[1]
+        async with servidor:
+            return [await _peticion(puerto, *peticion) for peticion in peticiones]
+
+    return asyncio.run(principal())
+
+
+def test_cidr():
+    [(estado, respuesta)] = _servir(ServicioCalculadoras(),
+                                    [("POST", "/cidr", {"entrada": "192.168.1.10/24"})])
+    assert estado == 200
+    assert respuesta["ok"]
+    assert respuesta["red"] == "192.168.1.0"
+    assert respuesta["hosts_validos"] == 254
+
+
+def test_cidr_por_lotes_con_entrada_invalida():
+    [(estado, respuesta)] = _servir(ServicioCalculadoras(),
+                                    [("POST", "/cidr", {"entradas": ["10.0.0.1/8", "300.0.0.1/8"]})])
+    assert estado == 200
+    assert [r["ok"] for r in respuesta["resultados"]] == [True, False]
+
+
+def test_vlsm_ipv4_e_ipv6():
+    planes = [
+        {"red_base": "192.168.1.0/24", "subredes": [{"nombre": "A", "hosts_requeridos": 50}]},
+        {"red_base": "2001:db8::/48", "subredes": [{"nombre": "A", "hosts_requeridos": 50},
+                                                   {"nombre": "B", "hosts_requeridos": 5}]},
+    ]
+    (estado4, ipv4), (estado6, ipv6) = _servir(ServicioCalculadoras(),
+                                               [("POST", "/vlsm", plan) for plan in planes])
+    assert estado4 == estado6 == 200
+    assert [s["notacion_cidr"] for s in ipv4["subredes"]] == ["192.168.1.0/26"]
+    assert [s["notacion_cidr"] for s in ipv6["subredes"]] == ["2001:db8::/64", "2001:db8:0:1::/64"]
+
+
+def test_vlsm_sin_espacio():
+    plan = {"red_base": "10.0.0.0/30", "subredes": [{"nombre": "A", "hosts_requeridos": 100}]}
+    [(estado, respuesta)] = _servir(ServicioCalculadoras(), [("POST", "/vlsm", plan)])
+    assert estado == 200
+    assert not respuesta["ok"]
+    assert "No hay espacio suficiente" in respuesta["error"]
+
+
+def test_errores_http():
+    respuestas = _servir(ServicioCalculadoras(), [
+        ("POST", "/cidr", {"otra": 1}),
+        ("GET", "/cidr"),
+        ("GET", "/no-existe"),
+        ("GET", "/salud"),
+    ])
+    assert [estado for estado, _ in respuestas] == [400, 405, 404, 200]
+
+
+def test_error_interno_responde_500():
+    servicio = ServicioCalculadoras()
+    servicio.atender_cidr = lambda cuerpo: 1 / 0
+    [(estado, respuesta), (estado_salud, _)] = _servir(servicio, [
+        ("POST", "/cidr", {"entrada": "10.0.0.0/8"}),
+        ("GET", "/salud"),
+    ])
+    assert estado == 500
+    assert respuesta["error"].startswith("Error interno: ZeroDivisionError")
+    assert estado_salud == 200
+
+
+def test_metricas():
+    servicio = ServicioCalculadoras()
+    respuestas = _servir(servicio, [("POST", "/cidr", {"entrada": "10.0.0.0/8"}),
+                                    ("POST", "/cidr", {"entrada": "10.0.0.0/8"}),
+                                    ("GET", "/metricas")])
+    estado, metricas = respuestas[-1]
+    assert estado == 200
+    assert metricas["cache"]["cidr"]["hits"] == 1
+    assert metricas["latencias"]["/cidr"]["solicitudes"] == 2
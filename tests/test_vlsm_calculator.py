@@ -0,0 +1,94 @@
+import ipaddress
+
+import pytest
+
+from diferencial import ejecutar_caso
+from registro_subred import RegistroSubred, RegistroSubred6
+import vlsm_calculator
+from vlsm_calculator import MINIMO_LOTE_NUMPY, CalculadoraVLSM
+
+
+def _calcular(red_base, subredes, reservas=()):
+    calculadora = CalculadoraVLSM()
+    calculadora.configurar_red_base(red_base)
+    for reserva in reservas:
+        calculadora.reservar_red(reserva)
+    for nombre, hosts in subredes:
+        calculadora.agregar_subred(nombre, hosts)
+    return calculadora, calculadora.calcular_vlsm()
+
+
+def _verificar_plan(red_base, reservas, registros):
+    # Dentro de la red base, sin solaparse entre sí ni con las reservas, y
+    # con hosts suficientes para cada requerimiento
+    base = ipaddress.ip_network(red_base, strict=False)
+    redes = [ipaddress.ip_network(r["notacion_cidr"]) for r in registros]
+    assert all(red.subnet_of(base) for red in redes)
+    ocupadas = sorted(redes + [ipaddress.ip_network(r, strict=False) for r in reservas])
+    assert not any(a.overlaps(b) for a, b in zip(ocupadas, ocupadas[1:]))
+    assert all(r["hosts_validos"] >= r["hosts_requeridos"] for r in registros)
+
+
+def test_vlsm_ipv4():
+    _, registros = _calcular("192.168.1.0/24", [("A", 50), ("B", 100), ("C", 20), ("D", 2)])
+    assert all(type(r) is RegistroSubred for r in registros)
+    assert [(r["nombre"], r["notacion_cidr"]) for r in registros] == [
+        ("B", "192.168.1.0/25"), ("A", "192.168.1.128/26"),
+        ("C", "192.168.1.192/27"), ("D", "192.168.1.224/30")]
+    assert registros[0]["primer_host"] == "192.168.1.1"
+    assert registros[0]["ultimo_host"] == "192.168.1.126"
+
+
+def test_vlsm_ipv4_con_reservas():
+    reservas = ["10.0.0.0/26", "10.0.0.192/27"]
+    subredes = [("A", 60), ("B", 20), ("C", 10)]
+    _, registros = _calcular("10.0.0.0/24", subredes, reservas)
+    _verificar_plan("10.0.0.0/24", reservas, registros)
+
+
+def test_vlsm_ipv6():
+    calculadora, registros = _calcular("2001:db8::/56", [("A", 10), ("B", 2 ** 66), ("C", 300)])
+    assert all(type(r) is RegistroSubred6 for r in registros)
+    assert [(r["nombre"], r["notacion_cidr"]) for r in registros] == [
+        ("B", "2001:db8::/62"), ("C", "2001:db8:0:4::/64"), ("A", "2001:db8:0:5::/64")]
+    assert calculadora.espacio_usado == 6 << 64
+    _verificar_plan("2001:db8::/56", [], registros)
+
+
+def test_vlsm_ipv6_con_reservas():
+    reservas = ["2001:db8::/58", "2001:db8:0:c0::/60"]
+    _, registros = _calcular("2001:db8::/56", [(f"S{i}", 1000) for i in range(100)], reservas)
+    _verificar_plan("2001:db8::/56", reservas, registros)
+
+
+@pytest.mark.parametrize("red_base, subredes", [
+    ("10.0.0.0/30", [("A", 100)]),
+    ("10.0.0.0/24", [("A", 100), ("B", 100), ("C", 2)]),
+    ("2001:db8::/63", [("A", 1), ("B", 1), ("C", 1)]),
+])
+def test_vlsm_sin_espacio(red_base, subredes):
+    with pytest.raises(ValueError, match="No hay espacio suficiente"):
+        _calcular(red_base, subredes)
+
+
+def test_vlsm_lote_grande_usa_el_mismo_acomodo(monkeypatch):
+    # Por encima de MINIMO_LOTE_NUMPY el dimensionado va por NumPy; el
+    # acomodo debe ser el mismo que el del camino en Python
+    subredes = [(f"S{i}", 1 + (i * 7919) % 500) for i in range(MINIMO_LOTE_NUMPY + 10)]
+    _, registros = _calcular("10.0.0.0/8", subredes)
+    monkeypatch.setattr(vlsm_calculator, "MINIMO_LOTE_NUMPY", len(subredes) + 1)
+    _, en_python = _calcular("10.0.0.0/8", subredes)
+    assert [dict(r) for r in registros] == [dict(r) for r in en_python]
+    _verificar_plan("10.0.0.0/8", [], registros)
+
+
+def test_vlsm_recalcular_desde_cero():
+    calculadora, primeros = _calcular("10.0.0.0/24", [("A", 50), ("B", 20)])
+    segundos = calculadora.calcular_vlsm()
+    assert [dict(r) for r in segundos] == [dict(r) for r in primeros]
+
+
+@pytest.mark.parametrize("caso", ["cidr", "cidr6", "vlsm"])
+def test_diferencial_contra_ipaddress(caso):
+    resultado = ejecutar_caso(caso, 300 if caso == "vlsm" else 2000)
+    assert resultado["diferencias"] == 0, resultado["ejemplos"]
@@ -1,242 +1,533 @@
-from ip_utils import *
-import math
-
-
-class CalculadoraVLSM:
-    """
-    Calculadora para VLSM (Variable Length Subnet Masking).
-    """
-    
-    def __init__(self):
-        self.red_base = None
-        self.prefijo_base = None
-        self.subredes = []
-        self.resultados = []
-    
-    def configurar_red_base(self, red_base: str):
-        """
-        Configura la red base para el cálculo VLSM.
-        """
-        if '/' not in red_base:
-            raise ValueError("Formato incorrecto. Use: IP/prefijo (ej: 10.0.0.0/16)")
-        
-        partes = red_base.split('/')
-        ip = partes[0].strip()
-        prefijo_str = partes[1].strip()
-        
-        if not validar_ip(ip):
-            raise ValueError("Dirección IP inválida")
-        
-        try:
-            prefijo = int(prefijo_str)
-        except ValueError:
-            raise ValueError("Prefijo debe ser un número")
-        
-        if not 0 <= prefijo <= 32:
-            raise ValueError("Prefijo debe estar entre 0 y 32")
-        
-        self.red_base = ip
-        self.prefijo_base = prefijo
-    
-    def agregar_subred(self, nombre: str, hosts_requeridos: int):
-        """
-        Agrega una subred a la lista de requerimientos.
-        """
-        if hosts_requeridos <= 0:
-            raise ValueError("El número de hosts debe ser mayor a 0")
-        
-        self.subredes.append({
-            "nombre": nombre,
-            "hosts_requeridos": hosts_requeridos
-        })
-    
-    def calcular_vlsm(self):
-        """
-        Ejecuta el algoritmo VLSM y calcula las asignaciones.
-        """
-        if not self.red_base or self.prefijo_base is None:
-            raise ValueError("Debe configurar la red base primero")
-        
-        if not self.subredes:
-            raise ValueError("Debe agregar al menos una subred")
-        
-        # 1. Preparar lista: calcular hosts_necesarios (hosts + 2)
-        for subred in self.subredes:
-            subred["hosts_necesarios"] = subred["hosts_requeridos"] + 2
-        
-        # 2. Ordenar subredes por tamaño descendente
-        subredes_ordenadas = sorted(self.subredes, 
-                                    key=lambda x: x["hosts_necesarios"], 
-                                    reverse=True)
-        
-        # 3. Inicializar puntero
-        ip_actual_entero = ip_a_entero(self.red_base)
-        espacio_total = 2 ** (32 - self.prefijo_base)
-        limite_superior = ip_actual_entero + espacio_total
-        
-        self.resultados = []
-        
-        # 4. Asignar subredes
-        for subred in subredes_ordenadas:
-            # Calcular bits de host necesarios
-            bits_host = math.ceil(math.log2(subred["hosts_necesarios"]))
-            bits_red = 32 - bits_host
-            
-            # Calcular tamaño del bloque
-            bloque = 2 ** bits_host
-            
-            # Verificar que haya espacio suficiente
-            if ip_actual_entero + bloque > limite_superior:
-                raise ValueError(
-                    f"No hay espacio suficiente para la subred '{subred['nombre']}'. "
-                    f"Espacio insuficiente en la red base."
-                )
-            
-            # Calcular propiedades de la subred
-            red = entero_a_ip(ip_actual_entero)
-            broadcast_entero = ip_actual_entero + bloque - 1
-            broadcast = entero_a_ip(broadcast_entero)
-            
-            # Calcular primer y último host (excepto para /31 y /32)
-            if bits_red == 32:  # /32
-                primer_host = red
-                ultimo_host = red
-                hosts_validos = 1
-            elif bits_red == 31:  # /31 (RFC 3021)
-                primer_host = red
-                ultimo_host = broadcast
-                hosts_validos = 2
-            else:
-                primer_host_entero = ip_actual_entero + 1
-                ultimo_host_entero = broadcast_entero - 1
-                primer_host = entero_a_ip(primer_host_entero)
-                ultimo_host = entero_a_ip(ultimo_host_entero)
-                hosts_validos = ultimo_host_entero - primer_host_entero + 1
-            
-            # Calcular desperdicio
-            desperdicio = bloque - hosts_validos if bits_red < 31 else 0
-            
-            # Guardar resultados
-            self.resultados.append({
-                "nombre": subred["nombre"],
-                "hosts_requeridos": subred["hosts_requeridos"],
-                "red": red,
-                "prefijo": bits_red,
-                "mascara": prefijo_a_mascara(bits_red),
-                "broadcast": broadcast,
-                "primer_host": primer_host,
-                "ultimo_host": ultimo_host,
-                "hosts_validos": hosts_validos,
-                "tam_bloque": bloque,
-                "desperdicio": desperdicio,
-                "rango_hosts": f"{primer_host} - {ultimo_host}",
-                "notacion_cidr": f"{red}/{bits_red}"
-            })
-            
-            # Actualizar puntero
-            ip_actual_entero += bloque
-        
-        # 5. Calcular espacio restante
-        self.espacio_usado = ip_actual_entero - ip_a_entero(self.red_base)
-        self.espacio_total = espacio_total
-        self.espacio_restante = espacio_total - self.espacio_usado
-        
-        return self.resultados
-    
-    def imprimir_resultados(self):
-        """
-        Imprime los resultados del cálculo VLSM
-        """
-        if not self.resultados:
-            print("No hay resultados para mostrar. Ejecute calcular_vlsm() primero.")
-            return
-        
-        print("\n" + "="*70)
-        print("RESULTADOS CALCULADORA VLSM")
-        print("="*70)
-        print(f"Red base: {self.red_base}/{self.prefijo_base}")
-        print(f"Espacio total: {self.espacio_total} direcciones")
-        print(f"Espacio usado: {self.espacio_usado} direcciones")
-        print(f"Espacio restante: {self.espacio_restante} direcciones")
-        print("="*70)
-        
-        for i, subred in enumerate(self.resultados, 1):
-            print(f"\nSubred {i}: {subred['nombre']}")
-            print("-" * 40)
-            print(f"  Hosts requeridos:  {subred['hosts_requeridos']}")
-            print(f"  Dirección de red:  {subred['notacion_cidr']}")
-            print(f"  Máscara:           {subred['mascara']} (/{subred['prefijo']})")
-            print(f"  Rango de hosts:    {subred['rango_hosts']}")
-            print(f"  Broadcast:         {subred['broadcast']}")
-            print(f"  Hosts válidos:     {subred['hosts_validos']}")
-            print(f"  Tamaño de bloque:  {subred['tam_bloque']} direcciones")
-            print(f"  Desperdicio:       {subred['desperdicio']} direcciones")
-        
-        print("\n" + "="*70)
-        print("RESUMEN")
-        print("="*70)
-        
-        # Tabla resumen
-        print(f"\n{'No.':<4} {'Subred':<15} {'Red':<18} {'Hosts Req.':<12} {'Hosts Disp.':<12} {'Desperdicio':<12}")
-        print("-" * 75)
-        
-        for i, subred in enumerate(self.resultados, 1):
-            print(f"{i:<4} {subred['nombre']:<15} {subred['notacion_cidr']:<18} "
-                  f"{subred['hosts_requeridos']:<12} {subred['hosts_validos']:<12} "
-                  f"{subred['desperdicio']:<12}")
-        
-        print("-" * 75)
-        print(f"\nTotal hosts requeridos: {sum(s['hosts_requeridos'] for s in self.resultados)}")
-        print(f"Total hosts disponibles: {sum(s['hosts_validos'] for s in self.resultados)}")
-        print(f"Total desperdicio: {sum(s['desperdicio'] for s in self.resultados)} direcciones")
-        print("="*70 + "\n")
-    
-    def ejecutar_desde_consola(self):
-        """
-        Interfaz de consola para la calculadora VLSM.
-        """
-        print("\n" + "="*50)
-        print("CALCULADORA VLSM")
-        print("="*50)
-        
-        # Configurar red base
-        while True:
-            red_base = input("Ingrese red base (ej: 192.168.0.0/24): ").strip()
-            try:
-                self.configurar_red_base(red_base)
-                break
-            except ValueError as e:
-                print(f"Error: {e}")
-        
-        # Configurar subredes
-        self.subredes = []
-        print("\nIngrese las subredes (nombre y número de hosts requeridos)")
-        print("Ingrese 'fin' cuando termine")
-        
-        while True:
-            nombre = input("\nNombre de la subred (o 'fin'): ").strip()
-            if nombre.lower() == 'fin':
-                if not self.subredes:
-                    print("Debe agregar al menos una subred.")
-                    continue
-                break
-            
-            try:
-                hosts = input(f"Número de hosts para '{nombre}': ").strip()
-                hosts_int = int(hosts)
-                self.agregar_subred(nombre, hosts_int)
-                print(f"Subred '{nombre}' agregada con {hosts_int} hosts.")
-            except ValueError as e:
-                print(f"Error: {e}")
-        
-        # Calcular VLSM
-        try:
-            print("\nCalculando asignaciones VLSM...")
-            self.calcular_vlsm()
-            self.imprimir_resultados()
-        except ValueError as e:
-            print(f"\nError en el cálculo: {e}")
-
-if __name__ == "__main__":
-    calculadora = CalculadoraVLSM()
-    calculadora.ejecutar_desde_consola()
\ No newline at end of file
+from ip_utils import *
+from ip_utils import _importar_numpy
+from asignador_bloques import AsignadorBuddy
+from registro_subred import RegistroSubred, crear_registro
+from enumeracion import SubredesDe
+from perfilado import (PERFILADOR, agregar_argumentos, iniciar_desde_argumentos,
+                       reportar_desde_argumentos)
+import math
+
+
+# Desde cuántas subredes IPv4 se dimensiona con las operaciones por lotes
+MINIMO_LOTE_NUMPY = 4096
+
+
+def _dimensionar_lote(hosts_requeridos: list):
+    """
+    Orden de asignación (de mayor a menor, estable) y bits de host de
+    muchas subredes IPv4 con las operaciones por lotes de ip_utils. Regresa
+    None si NumPy no está instalado o algún requerimiento no cabe en 32 bits.
+    """
+    try:
+        np = _importar_numpy()
+    except ImportError:
+        return None
+    if max(hosts_requeridos) >= 1 << 32:
+        return None
+    
+    hosts = np.asarray(hosts_requeridos, dtype=np.int64)
+    orden = np.argsort(-hosts, kind="stable")
+    bits_hosts = 32 - prefijos_para_hosts(hosts[orden])
+    return orden.tolist(), bits_hosts.tolist()
+
+
+def _primera_sin_espacio(bits_hosts: list, espacio: int):
+    """
+    Índice de la primera subred (en orden de asignación) que ya no cabe al
+    asignarlas una tras otra en `espacio` direcciones, o None si caben todas.
+    """
+    if len(bits_hosts) >= MINIMO_LOTE_NUMPY:
+        try:
+            np = _importar_numpy()
+        except ImportError:
+            np = None
+        if np is not None and max(bits_hosts) <= 32:
+            finales = np.cumsum(calcular_tamanos_bloque(32 - np.asarray(bits_hosts)))
+            indice = int(np.searchsorted(finales, espacio, side="right"))
+            return indice if indice < len(bits_hosts) else None
+    
+    fin = 0
+    for i, bits_host in enumerate(bits_hosts):
+        fin += 1 << bits_host
+        if fin > espacio:
+            return i
+    return None
+
+
+def crear_resultado(subred: dict, red_entero: int, bits_red: int, bits: int = 32) -> RegistroSubred:
+    """
+    Construye el registro de resultados de una subred asignada (IPv6 con
+    bits=128). Los campos de texto se generan solo cuando se consultan.
+    """
+    return crear_registro(subred["nombre"], subred["hosts_requeridos"], red_entero, bits_red, bits)
+
+
+class CalculadoraVLSM:
+    """
+    Calculadora para VLSM (Variable Length Subnet Masking).
+    """
+    
+    def __init__(self):
+        self.red_base = None
+        self.prefijo_base = None
+        self.bits = 32
+        self.subredes = []
+        self.resultados = []
+        self.reservas = []
+        self._asignador = None
+        self._fin_asignado = None
+    
+    def configurar_red_base(self, red_base: str):
+        """
+        Configura la red base para el cálculo VLSM (IPv4 o IPv6).
+        """
+        if '/' not in red_base:
+            raise ValueError("Formato incorrecto. Use: IP/prefijo (ej: 10.0.0.0/16)")
+        
+        partes = red_base.split('/')
+        ip = partes[0].strip()
+        prefijo_str = partes[1].strip()
+        
+        if ':' in ip:
+            # IPv6: se guarda en formato comprimido
+            ip = entero_a_ipv6(ipv6_a_entero(ip))
+            bits = 128
+        elif not validar_ip(ip):
+            raise ValueError("Dirección IP inválida")
+        else:
+            bits = 32
+        
+        try:
+            prefijo = int(prefijo_str)
+        except ValueError:
+            raise ValueError("Prefijo debe ser un número")
+        
+        if not 0 <= prefijo <= bits:
+            raise ValueError(f"Prefijo debe estar entre 0 y {bits}")
+        
+        self.red_base = ip
+        self.prefijo_base = prefijo
+        self.bits = bits
+    
+    def agregar_subred(self, nombre: str, hosts_requeridos: int):
+        """
+        Agrega una subred a la lista de requerimientos.
+        """
+        if hosts_requeridos <= 0:
+            raise ValueError("El número de hosts debe ser mayor a 0")
+        
+        self.subredes.append({
+            "nombre": nombre,
+            "hosts_requeridos": hosts_requeridos
+        })
+    
+    def reservar_red(self, red_cidr: str):
+        """
+        Marca una red ya asignada (IP/prefijo) como ocupada dentro de la red
+        base, para que calcular_vlsm coloque las subredes alrededor de ella.
+        """
+        if '/' not in red_cidr:
+            raise ValueError("Formato incorrecto. Use: IP/prefijo (ej: 10.0.0.0/24)")
+        
+        partes = red_cidr.split('/')
+        ip_entero, bits = analizar_direccion(partes[0].strip())
+        if bits != self.bits:
+            raise ValueError("La reserva y la red base deben ser de la misma versión de IP")
+        
+        try:
+            prefijo = int(partes[1])
+        except ValueError:
+            prefijo = -1
+        if not 0 <= prefijo <= bits:
+            raise ValueError(f"Prefijo debe estar entre 0 y {bits}")
+        
+        mascara_entero = ((1 << bits) - 1) ^ ((1 << (bits - prefijo)) - 1)
+        self.reservas.append((ip_entero & mascara_entero, prefijo))
+    
+    def _red_base_alineada(self) -> int:
+        """
+        La red base como entero, alineada a su prefijo.
+        """
+        tam_bloque = 1 << (self.bits - self.prefijo_base)
+        return analizar_direccion(self.red_base)[0] & ~(tam_bloque - 1)
+    
+    def enumerar_subredes(self, prefijo: int) -> SubredesDe:
+        """
+        Todas las subredes /prefijo de la red base, como secuencia perezosa.
+        """
+        if not self.red_base or self.prefijo_base is None:
+            raise ValueError("Debe configurar la red base primero")
+        return SubredesDe(f"{self.red_base}/{self.prefijo_base}", prefijo)
+    
+    def calcular_vlsm(self):
+        """
+        Ejecuta el algoritmo VLSM y calcula las asignaciones.
+        """
+        self.resultados = []
+        with PERFILADOR.etapa("vlsm.calcular"):
+            for registro in self.iterar_vlsm():
+                self.resultados.append(registro)
+        
+        PERFILADOR.contar("vlsm.asignaciones", len(self.resultados))
+        return self.resultados
+    
+    def iterar_vlsm(self):
+        """
+        Versión generadora de calcular_vlsm: entrega cada subred en cuanto se
+        asigna, sin construir la lista completa. Sin reservas, la falta de
+        espacio se detecta con los tamaños de bloque antes de entregar
+        ninguna subred; con reservas, el ValueError se lanza después de las
+        subredes ya entregadas. Las estadísticas de espacio se actualizan al
+        terminar la iteración.
+        """
+        # Un cálculo nuevo descarta el plan anterior, aunque este falle
+        self.resultados = []
+        self._asignador = None
+        self._fin_asignado = None
+        
+        if not self.red_base or self.prefijo_base is None:
+            raise ValueError("Debe configurar la red base primero")
+        
+        if not self.subredes:
+            raise ValueError("Debe agregar al menos una subred")
+        
+        # 1. Preparar lista: calcular hosts_necesarios (hosts + 2) sin
+        # modificar los dicts de requerimientos
+        with PERFILADOR.etapa("vlsm.preparar"):
+            subredes = list(self.subredes)
+            hosts_necesarios = [subred["hosts_requeridos"] + 2 for subred in subredes]
+        
+        # Planes IPv4 grandes: orden y bits de host en bloque con NumPy
+        lote = None
+        if self.bits == 32 and len(subredes) >= MINIMO_LOTE_NUMPY:
+            with PERFILADOR.etapa("vlsm.dimensionar"):
+                lote = _dimensionar_lote([subred["hosts_requeridos"] for subred in subredes])
+        
+        if lote is not None:
+            orden, bits_hosts = lote
+            subredes_ordenadas = [subredes[i] for i in orden]
+        else:
+            # 2. Ordenar subredes por tamaño descendente
+            with PERFILADOR.etapa("vlsm.ordenar"):
+                orden = sorted(range(len(subredes)), 
+                               key=hosts_necesarios.__getitem__, 
+                               reverse=True)
+                subredes_ordenadas = [subredes[i] for i in orden]
+            
+            # Calcular bits de host necesarios de cada subred
+            with PERFILADOR.etapa("vlsm.dimensionar"):
+                if self.bits == 128:
+                    bits_hosts = [bits_host_para(subred["hosts_requeridos"], 128)
+                                  for subred in subredes_ordenadas]
+                else:
+                    bits_hosts = [math.ceil(math.log2(hosts_necesarios[i])) for i in orden]
+        
+        if self.reservas:
+            yield from self._iterar_con_reservas(subredes_ordenadas, bits_hosts)
+            return
+        
+        # 3. Inicializar puntero
+        bits = self.bits
+        red_base_entero = analizar_direccion(self.red_base)[0]
+        ip_actual_entero = red_base_entero
+        espacio_total = 2 ** (bits - self.prefijo_base)
+        
+        # 4. Verificar con los tamaños de bloque, antes de entregar ninguna
+        # subred, que todas quepan
+        sin_espacio = _primera_sin_espacio(bits_hosts, espacio_total)
+        if sin_espacio is not None:
+            raise ValueError(
+                f"No hay espacio suficiente para la subred "
+                f"'{subredes_ordenadas[sin_espacio]['nombre']}'. "
+                f"Espacio insuficiente en la red base."
+            )
+        
+        # 5. Asignar subredes
+        for subred, bits_host in zip(subredes_ordenadas, bits_hosts):
+            bits_red = bits - bits_host
+            
+            # Calcular tamaño del bloque
+            bloque = 2 ** bits_host
+            
+            # Entregar resultado
+            yield crear_resultado(subred, ip_actual_entero, bits_red, bits)
+            
+            # Actualizar puntero
+            ip_actual_entero += bloque
+        
+        # 6. Calcular espacio restante
+        self.espacio_usado = ip_actual_entero - red_base_entero
+        self.espacio_total = espacio_total
+        self.espacio_reservado = 0
+        self.espacio_restante = espacio_total - self.espacio_usado
+        self._asignador = None
+        self._fin_asignado = ip_actual_entero
+    
+    def _iterar_con_reservas(self, subredes_ordenadas: list, bits_hosts: list):
+        """
+        Asigna las subredes con el asignador buddy, respetando las redes
+        reservadas. Cada subred se coloca en el bloque libre más pequeño que
+        la aloje, en O(bits) operaciones.
+        """
+        bits = self.bits
+        with PERFILADOR.etapa("vlsm.reservar"):
+            asignador = AsignadorBuddy(self._red_base_alineada(), self.prefijo_base, bits)
+            
+            for red_entero, prefijo in self.reservas:
+                try:
+                    asignador.reservar(red_entero, prefijo)
+                except ValueError as e:
+                    raise ValueError(f"Reserva {entero_a_direccion(red_entero, bits)}/{prefijo} "
+                                     f"inválida: {e}")
+        
+        espacio_reservado = asignador.espacio_total - asignador.espacio_libre
+        
+        for subred, bits_host in zip(subredes_ordenadas, bits_hosts):
+            bits_red = bits - bits_host
+            red_entero = asignador.asignar(bits_red)
+            
+            if red_entero is None:
+                raise ValueError(
+                    f"No hay espacio suficiente para la subred '{subred['nombre']}'. "
+                    f"Espacio insuficiente en la red base."
+                )
+            
+            yield crear_resultado(subred, red_entero, bits_red, bits)
+        
+        self.espacio_total = asignador.espacio_total
+        self.espacio_reservado = espacio_reservado
+        self.espacio_usado = asignador.espacio_total - asignador.espacio_libre - espacio_reservado
+        self.espacio_restante = asignador.espacio_libre
+        self._asignador = asignador
+        self._fin_asignado = None
+    
+    def mapa_libre(self) -> AsignadorBuddy:
+        """
+        Mapa del espacio que quedó libre después de calcular_vlsm, para
+        consultarlo sin volver a planear: bloque_mas_grande(), cabe(prefijo),
+        bloques_de_al_menos(tamano), bloque_libre_en(direccion) y
+        fragmentacion(). Con reservas es el mismo asignador buddy del
+        cálculo; sin reservas se arma (una sola vez) a partir del espacio
+        después de la última subred, y en un plan cargado (almacen_plan), a
+        partir de las reservas y los resultados.
+        """
+        if self._asignador is None:
+            if self._fin_asignado is None and not self.resultados:
+                raise ValueError("No hay resultados. Ejecute calcular_vlsm() primero.")
+            
+            red_base = self._red_base_alineada()
+            asignador = AsignadorBuddy(red_base, self.prefijo_base, self.bits)
+            if self._fin_asignado is not None:
+                # Todo lo anterior a la última subred está ocupado
+                from agregacion_redes import rango_a_prefijos
+                
+                fin_asignado = min(self._fin_asignado, red_base + asignador.espacio_total)
+                if fin_asignado > red_base:
+                    for red_entero, prefijo in rango_a_prefijos(red_base, fin_asignado - 1,
+                                                                self.bits):
+                        asignador.reservar(red_entero, prefijo)
+            else:
+                for red_entero, prefijo in self.reservas:
+                    asignador.reservar(red_entero, prefijo)
+                for registro in self.resultados:
+                    asignador.reservar(registro.red_entero, registro.prefijo)
+            self._asignador = asignador
+        return self._asignador
+    
+    def imprimir_resultados(self):
+        """
+        Imprime los resultados del cálculo VLSM
+        """
+        if not self.resultados:
+            print("No hay resultados para mostrar. Ejecute calcular_vlsm() primero.")
+            return
+        
+        print("\n" + "="*70)
+        print("RESULTADOS CALCULADORA VLSM")
+        print("="*70)
+        print(f"Red base: {self.red_base}/{self.prefijo_base}")
+        print(f"Espacio total: {self.espacio_total} direcciones")
+        if self.espacio_reservado:
+            print(f"Espacio reservado: {self.espacio_reservado} direcciones")
+        print(f"Espacio usado: {self.espacio_usado} direcciones")
+        print(f"Espacio restante: {self.espacio_restante} direcciones")
+        print("="*70)
+        
+        # Detalle y tabla resumen se arman en una sola pasada y se imprimen
+        # de una vez
+        detalle = []
+        tabla = []
+        total_requeridos = 0
+        total_disponibles = 0
+        total_desperdicio = 0
+        
+        with PERFILADOR.etapa("vlsm.formatear"):
+            for i, subred in enumerate(self.resultados, 1):
+                notacion_cidr = subred['notacion_cidr']
+                hosts_requeridos = subred['hosts_requeridos']
+                hosts_validos = subred['hosts_validos']
+                desperdicio = subred['desperdicio']
+                
+                detalle.append(
+                    f"\nSubred {i}: {subred['nombre']}\n"
+                    f"{'-' * 40}\n"
+                    f"  Hosts requeridos:  {hosts_requeridos}\n"
+                    f"  Dirección de red:  {notacion_cidr}\n"
+                    f"  Máscara:           {subred['mascara']} (/{subred['prefijo']})\n"
+                    f"  Rango de hosts:    {subred['rango_hosts']}\n"
+                    f"  Broadcast:         {subred['broadcast']}\n"
+                    f"  Hosts válidos:     {hosts_validos}\n"
+                    f"  Tamaño de bloque:  {subred['tam_bloque']} direcciones\n"
+                    f"  Desperdicio:       {desperdicio} direcciones"
+                )
+                tabla.append(
+                    f"{i:<4} {subred['nombre']:<15} {notacion_cidr:<18} "
+                    f"{hosts_requeridos:<12} {hosts_validos:<12} "
+                    f"{desperdicio:<12}"
+                )
+                
+                total_requeridos += hosts_requeridos
+                total_disponibles += hosts_validos
+                total_desperdicio += desperdicio
+        
+        # Cada subred convierte 4 direcciones a texto (red, broadcast y rango)
+        PERFILADOR.contar("vlsm.conversiones_ip", 4 * len(tabla))
+        PERFILADOR.contar("vlsm.cadenas", len(detalle) + len(tabla))
+        
+        with PERFILADOR.etapa("vlsm.imprimir"):
+            print("\n".join(detalle))
+            
+            print("\n" + "="*70)
+            print("RESUMEN")
+            print("="*70)
+            
+            # Tabla resumen
+            print(f"\n{'No.':<4} {'Subred':<15} {'Red':<18} {'Hosts Req.':<12} {'Hosts Disp.':<12} {'Desperdicio':<12}")
+            print("-" * 75)
+            print("\n".join(tabla))
+            print("-" * 75)
+            print(f"\nTotal hosts requeridos: {total_requeridos}")
+            print(f"Total hosts disponibles: {total_disponibles}")
+            print(f"Total desperdicio: {total_desperdicio} direcciones")
+            print("="*70 + "\n")
+    
+    def ejecutar_desde_consola(self):
+        """
+        Interfaz de consola para la calculadora VLSM.
+        """
+        print("\n" + "="*50)
+        print("CALCULADORA VLSM")
+        print("="*50)
+        
+        # Configurar red base
+        while True:
+            red_base = input("Ingrese red base (ej: 192.168.0.0/24): ").strip()
+            try:
+                self.configurar_red_base(red_base)
+                break
+            except ValueError as e:
+                print(f"Error: {e}")
+        
+        # Configurar redes ya asignadas (opcional)
+        self.reservas = []
+        print("\nIngrese las redes ya asignadas dentro de la red base (IP/prefijo)")
+        print("Presione Enter sin escribir nada para continuar")
+        
+        while True:
+            reserva = input("Red reservada: ").strip()
+            if not reserva:
+                break
+            try:
+                self.reservar_red(reserva)
+                print(f"Red '{reserva}' reservada.")
+            except ValueError as e:
+                print(f"Error: {e}")
+        
+        # Configurar subredes
+        self.subredes = []
+        print("\nIngrese las subredes (nombre y número de hosts requeridos)")
+        print("Ingrese 'fin' cuando termine")
+        
+        while True:
+            nombre = input("\nNombre de la subred (o 'fin'): ").strip()
+            if nombre.lower() == 'fin':
+                if not self.subredes:
+                    print("Debe agregar al menos una subred.")
+                    continue
+                break
+            
+            try:
+                hosts = input(f"Número de hosts para '{nombre}': ").strip()
+                hosts_int = int(hosts)
+                self.agregar_subred(nombre, hosts_int)
+                print(f"Subred '{nombre}' agregada con {hosts_int} hosts.")
+            except ValueError as e:
+                print(f"Error: {e}")
+        
+        # Calcular VLSM
+        try:
+            print("\nCalculando asignaciones VLSM...")
+            self.calcular_vlsm()
+            self.imprimir_resultados()
+        except ValueError as e:
+            print(f"\nError en el cálculo: {e}")
+
+def ejecutar_lote(argumentos: list = None):
+    """
+    Modo por lotes desde la línea de comandos: lee las subredes ("nombre hosts"
+    o "nombre,hosts", una por línea) y escribe el plan conforme se calcula.
+    python vlsm_calculator.py --red IP/prefijo --subredes ARCHIVO|- [--formato csv|jsonl|ancho]
+    """
+    import argparse
+    import sys
+    from escritores import ESCRITORES
+    
+    parser = argparse.ArgumentParser(description="Cálculo VLSM por lotes")
+    parser.add_argument("--red", required=True, help="Red base (IP/prefijo)")
+    parser.add_argument("--subredes", required=True, help="Archivo de subredes ('-' para stdin)")
+    parser.add_argument("--reserva", action="append", default=[], help="Red ya asignada (IP/prefijo)")
+    parser.add_argument("--formato", choices=sorted(ESCRITORES), default="csv")
+    parser.add_argument("--salida", default="-", help="Archivo de salida ('-' para stdout)")
+    agregar_argumentos(parser)
+    args = parser.parse_args(argumentos)
+    iniciar_desde_argumentos(args)
+    
+    calculadora = CalculadoraVLSM()
+    entrada = sys.stdin if args.subredes == "-" else open(args.subredes, encoding="utf-8")
+    try:
+        calculadora.configurar_red_base(args.red)
+        for reserva in args.reserva:
+            calculadora.reservar_red(reserva)
+        for numero, linea in enumerate(entrada, 1):
+            partes = linea.replace(",", " ").split()
+            if not partes:
+                continue
+            if len(partes) != 2:
+                raise ValueError(f"Línea {numero}: use 'nombre hosts'")
+            calculadora.agregar_subred(partes[0], int(partes[1]))
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+    
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8", newline="")
+    try:
+        # Incluye la asignación: el escritor consume el generador
+        with PERFILADOR.etapa("vlsm.escribir"):
+            ESCRITORES[args.formato](calculadora.iterar_vlsm(), salida)
+    except ValueError as e:
+        print(f"Error en el cálculo: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    reportar_desde_argumentos(args, sys.stderr)
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) > 1:
+        ejecutar_lote()
+    else:
+        calculadora = CalculadoraVLSM()
+        calculadora.ejecutar_desde_consola()
\ No newline at end of file
@@ -0,0 +1,306 @@
+import math
+
+from ip_utils import *
+from lote_vlsm import _repartir
+from registro_subred import RegistroSubred, RegistroSubred6
+from vlsm_calculator import CalculadoraVLSM
+
+
+class RegistroNodo(RegistroSubred):
+    """
+    RegistroSubred de un nodo del árbol de requerimientos. El nombre es la
+    ruta completa ("Norte/Sitio1/VLAN10") y se agregan el nivel (0 para la
+    raíz) y si es una hoja.
+    """
+
+    __slots__ = ("nivel", "hoja")
+
+    CAMPOS = RegistroSubred.CAMPOS + ("nivel", "hoja")
+
+    def __init__(self, nombre, hosts_requeridos, red_entero: int, prefijo: int,
+                 nivel: int, hoja: bool):
+        super().__init__(nombre, hosts_requeridos, red_entero, prefijo)
+        object.__setattr__(self, "nivel", nivel)
+        object.__setattr__(self, "hoja", hoja)
+
+    def __getitem__(self, clave):
+        if clave == "nivel":
+            return self.nivel
+        if clave == "hoja":
+            return self.hoja
+        return super().__getitem__(clave)
+
+    def __hash__(self):
+        return hash((self.nombre, self.hosts_requeridos, self.red_entero, self.prefijo, self.nivel))
+
+    def __reduce__(self):
+        return (type(self), (self.nombre, self.hosts_requeridos, self.red_entero,
+                             self.prefijo, self.nivel, self.hoja))
+
+
+class RegistroNodo6(RegistroNodo, RegistroSubred6):
+    """
+    RegistroNodo de un árbol planeado en una red base IPv6.
+    """
+
+    __slots__ = ()
+
+
+def _dimensionar(nodo: dict, ruta: str = "", bits: int = 32) -> tuple:
+    """
+    Calcula el tamaño de bloque de un nodo y de todo su subárbol. Una hoja
+    ocupa el bloque de sus hosts (como en calcular_vlsm, IPv6 con bits=128)
+    y un nodo interno el bloque que aloja a sus hijos colocados de mayor a
+    menor.
+
+    Regresa (nombre, bits_host, hosts_requeridos, hijos) con los hijos ya
+    dimensionados y ordenados por tamaño descendente (y, a igual tamaño,
+    por hosts requeridos, como calcular_vlsm).
+    """
+    if not isinstance(nodo, dict) or "nombre" not in nodo:
+        raise ValueError(f"Nodo inválido en '{ruta or '/'}': se esperaba un objeto con 'nombre'")
+    nombre = str(nodo["nombre"])
+    ruta = f"{ruta}/{nombre}" if ruta else nombre
+
+    hijos = nodo.get("hijos")
+    if hijos:
+        dimensionados = sorted((_dimensionar(hijo, ruta, bits) for hijo in hijos),
+                               key=lambda h: (h[1], h[2]), reverse=True)
+        # Bloques potencia de 2 de mayor a menor: quedan alineados y su
+        # suma es el espacio contiguo que necesitan
+        total = sum(1 << h[1] for h in dimensionados)
+        return (nombre, (total - 1).bit_length(), sum(h[2] for h in dimensionados), dimensionados)
+
+    try:
+        hosts_requeridos = int(nodo["hosts_requeridos"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"El nodo '{ruta}' no tiene hijos ni un número de hosts válido") from None
+    if hosts_requeridos <= 0:
+        raise ValueError(f"El número de hosts de '{ruta}' debe ser mayor a 0")
+    if bits == 128:
+        return (nombre, bits_host_para(hosts_requeridos, 128), hosts_requeridos, [])
+    return (nombre, math.ceil(math.log2(hosts_requeridos + 2)), hosts_requeridos, [])
+
+
+def _asignar(nodo: tuple, inicio: int, ruta: str, nivel: int, bits: int, salida: list):
+    """
+    Coloca un nodo dimensionado en `inicio` y a sus hijos uno tras otro
+    dentro de su bloque, en preorden. Agrega a `salida` tuplas
+    (ruta, hosts_requeridos, red_entero, prefijo, nivel, hoja).
+    """
+    nombre, bits_host, hosts_requeridos, hijos = nodo
+    ruta = f"{ruta}/{nombre}" if ruta else nombre
+    salida.append((ruta, hosts_requeridos, inicio, bits - bits_host, nivel, not hijos))
+    for hijo in hijos:
+        _asignar(hijo, inicio, ruta, nivel + 1, bits, salida)
+        inicio += 1 << hijo[1]
+
+
+def _planear_subarbol(argumentos: tuple) -> tuple:
+    """
+    Dimensiona un subárbol completo y lo coloca a partir de la dirección 0
+    (se ejecuta en un proceso de trabajo). Regresa (bits_host,
+    hosts_requeridos, asignados), con los asignados como en _asignar.
+    """
+    nodo, ruta, nivel, bits = argumentos
+    dimensionado = _dimensionar(nodo, ruta, bits)
+    asignados = []
+    _asignar(dimensionado, 0, ruta, nivel, bits, asignados)
+    return dimensionado[1], dimensionado[2], asignados
+
+
+class CalculadoraVLSMJerarquica:
+    """
+    VLSM sobre un árbol de requerimientos (región, sitio, VLAN...):
+
+        {"nombre": "Corp", "hijos": [
+            {"nombre": "Norte", "hijos": [
+                {"nombre": "VLAN10", "hosts_requeridos": 50}, ...]},
+            ...]}
+
+    Cada nodo recibe un bloque dimensionado a partir de sus hijos y la
+    asignación va de arriba hacia abajo. Cada subárbol de la raíz se
+    dimensiona y se coloca por separado, en direcciones relativas a su
+    inicio; solo falta sumarle el desplazamiento que le toca dentro de la
+    raíz. Con calcular(procesos=N) los subárboles se planean en un grupo de
+    procesos.
+    """
+
+    def __init__(self):
+        self.red_base = None
+        self.prefijo_base = None
+        self.bits = 32
+        self.arbol = None
+        self.resultados = []
+        self.niveles = []
+
+    def configurar_red_base(self, red_base: str):
+        """
+        Configura la red base (IP/prefijo, IPv4 o IPv6), con las mismas
+        validaciones que CalculadoraVLSM.
+        """
+        calculadora = CalculadoraVLSM()
+        calculadora.configurar_red_base(red_base)
+        self.red_base = calculadora.red_base
+        self.prefijo_base = calculadora.prefijo_base
+        self.bits = calculadora.bits
+
+    def definir_arbol(self, arbol: dict):
+        """
+        Define el árbol de requerimientos (dict o su texto JSON). Aquí solo
+        se revisa la raíz: el resto del árbol se valida al dimensionarlo en
+        calcular(), junto con cada subárbol.
+        """
+        if isinstance(arbol, str):
+            import json
+            arbol = json.loads(arbol)
+        if not isinstance(arbol, dict) or "nombre" not in arbol:
+            raise ValueError("Nodo inválido en '/': se esperaba un objeto con 'nombre'")
+        self.arbol = arbol
+
+    def calcular(self, procesos: int = 1) -> list:
+        """
+        Asigna el árbol completo y regresa la lista de RegistroNodo en
+        preorden (cada nodo seguido de sus descendientes).
+
+        Cada hijo directo de la raíz se dimensiona y se coloca con
+        _planear_subarbol; este proceso solo ordena los tamaños de los
+        hijos (como _dimensionar), calcula el desplazamiento de cada uno y
+        lo suma al crear los registros. Por defecto todo corre en el proceso
+        actual; con `procesos` mayor a 1 (o None, uno por núcleo) los
+        subárboles se planean en un grupo de procesos.
+        """
+        if not self.red_base or self.prefijo_base is None:
+            raise ValueError("Debe configurar la red base primero")
+        if self.arbol is None:
+            raise ValueError("Debe definir el árbol de requerimientos primero")
+
+        bits = self.bits
+        nombre = str(self.arbol["nombre"])
+        if self.arbol.get("hijos"):
+            tareas = [(hijo, nombre, 1, bits) for hijo in self.arbol["hijos"]]
+            partes = sorted(_repartir(_planear_subarbol, tareas, procesos, 1),
+                            key=lambda p: (p[0], p[1]), reverse=True)
+            bits_host = (sum(1 << parte[0] for parte in partes) - 1).bit_length()
+            hosts_requeridos = sum(parte[1] for parte in partes)
+        else:
+            _, bits_host, hosts_requeridos, _ = _dimensionar(self.arbol, bits=bits)
+            partes = []
+        if bits_host > bits - self.prefijo_base:
+            raise ValueError(
+                f"No hay espacio suficiente para la jerarquía '{nombre}': necesita un "
+                f"/{bits - bits_host} y la red base es /{self.prefijo_base}."
+            )
+
+        inicio = analizar_direccion(self.red_base)[0] & ~((1 << (bits - self.prefijo_base)) - 1)
+        clase = RegistroNodo6 if bits == 128 else RegistroNodo
+
+        # La raíz va al inicio y cada subárbol a continuación del anterior
+        self.resultados = [clase(nombre, hosts_requeridos, inicio, bits - bits_host, 0, not partes)]
+        for bits_subarbol, _, asignados in partes:
+            self.resultados.extend(clase(ruta, hosts, inicio + relativo, prefijo, nivel, hoja)
+                                   for ruta, hosts, relativo, prefijo, nivel, hoja in asignados)
+            inicio += 1 << bits_subarbol
+        self.espacio_total = 2 ** (bits - self.prefijo_base)
+        self.espacio_usado = 1 << bits_host
+        self.espacio_restante = self.espacio_total - self.espacio_usado
+        self.niveles = self._resumir_niveles()
+        return self.resultados
+
+    def _resumir_niveles(self) -> list:
+        """
+        Totales por nivel: nodos, direcciones asignadas, hosts requeridos y
+        válidos (de las hojas), hosts_sin_usar (direcciones sin hosts
+        requeridos) y utilización (hosts requeridos / direcciones).
+        """
+        niveles = []
+        for registro in self.resultados:
+            while len(niveles) <= registro.nivel:
+                niveles.append({"nivel": len(niveles), "nodos": 0, "hojas": 0, "direcciones": 0,
+                                "hosts_requeridos": 0, "hosts_validos": 0})
+            nivel = niveles[registro.nivel]
+            nivel["nodos"] += 1
+            nivel["direcciones"] += registro.tam_bloque
+            nivel["hosts_requeridos"] += registro.hosts_requeridos
+            if registro.hoja:
+                nivel["hojas"] += 1
+                nivel["hosts_validos"] += registro.hosts_validos
+
+        for nivel in niveles:
+            nivel["hosts_sin_usar"] = nivel["direcciones"] - nivel["hosts_requeridos"]
+            nivel["utilizacion"] = nivel["hosts_requeridos"] / nivel["direcciones"]
+        return niveles
+
+    def imprimir_resultados(self):
+        """
+        Imprime el árbol asignado y el resumen por nivel.
+        """
+        if not self.resultados:
+            print("No hay resultados para mostrar. Ejecute calcular() primero.")
+            return
+
+        print("\n" + "="*70)
+        print("RESULTADOS VLSM JERÁRQUICO")
+        print("="*70)
+        print(f"Red base: {self.red_base}/{self.prefijo_base}")
+        print(f"Espacio total: {self.espacio_total} direcciones")
+        print(f"Espacio usado: {self.espacio_usado} direcciones")
+        print(f"Espacio restante: {self.espacio_restante} direcciones")
+        print("="*70)
+
+        lineas = []
+        for registro in self.resultados:
+            nombre = registro.nombre.rsplit("/", 1)[-1]
+            lineas.append(f"{'  ' * registro.nivel}{nombre:<{30 - 2 * registro.nivel}} "
+                          f"{registro['notacion_cidr']:<18} {registro.hosts_requeridos:>10}")
+        print("\n".join(lineas))
+
+        print("\n" + "="*70)
+        print("RESUMEN POR NIVEL")
+        print("="*70)
+        print(f"{'Nivel':<6} {'Nodos':>8} {'Direcciones':>12} {'Hosts Req.':>12} "
+              f"{'Sin usar':>12} {'Utilización':>12}")
+        print("-" * 70)
+        for nivel in self.niveles:
+            print(f"{nivel['nivel']:<6} {nivel['nodos']:>8} {nivel['direcciones']:>12} "
+                  f"{nivel['hosts_requeridos']:>12} {nivel['hosts_sin_usar']:>12} "
+                  f"{nivel['utilizacion']:>12.1%}")
+        print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+
+    parser = argparse.ArgumentParser(description="VLSM jerárquico a partir de un árbol JSON")
+    parser.add_argument("--red", required=True, help="Red base (IP/prefijo)")
+    parser.add_argument("arbol", help="Archivo JSON con el árbol ('-' para stdin)")
+    parser.add_argument("--procesos", type=int, default=1,
+                        help="Procesos para planear los subárboles de la raíz "
+                             "(por defecto: el proceso actual)")
+    parser.add_argument("--json", action="store_true", help="Escribe el resultado como JSON")
+    args = parser.parse_args()
+
+    entrada = sys.stdin if args.arbol == "-" else open(args.arbol, encoding="utf-8")
+    try:
+        texto = entrada.read()
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+
+    calculadora = CalculadoraVLSMJerarquica()
+    try:
+        calculadora.configurar_red_base(args.red)
+        calculadora.definir_arbol(texto)
+        calculadora.calcular(args.procesos)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        json.dump({"nodos": [dict(r) for r in calculadora.resultados],
+                   "niveles": calculadora.niveles}, sys.stdout, ensure_ascii=False)
+        print()
+    else:
+        calculadora.imprimir_resultados()